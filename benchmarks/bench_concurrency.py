@@ -0,0 +1,103 @@
+"""
+Multi-threaded stress and throughput benchmark for kenat's caches.
+
+Each workload runs on 1, 2, 4, ... threads, first against cold caches (every
+thread races to fill them) and then warm. Results are checked against a
+single-threaded reference, so the benchmark doubles as a stress test. On a
+free-threaded build (e.g. python3.13t) warm throughput should scale close to
+linearly with the thread count; with the GIL it stays roughly flat.
+
+Usage:
+    python benchmarks/bench_concurrency.py [--threads 1 2 4 8] [--seconds S]
+"""
+import argparse
+import sys
+import threading
+import time
+
+import kenat
+from kenat import to_ec, to_gc, get_holidays_for_year, MonthGrid
+
+YEARS = range(2007, 2025)
+
+def holidays_workload(i):
+    return get_holidays_for_year(YEARS[i % len(YEARS)])
+
+def month_grid_workload(i):
+    return MonthGrid({'year': YEARS[i % len(YEARS)], 'month': i % 13 + 1}).generate()
+
+def conversions_workload(i):
+    greg = to_gc(YEARS[i % len(YEARS)], i % 13 + 1, i % 5 + 1)
+    return to_ec(greg.year, greg.month, greg.day)
+
+WORKLOADS = {
+    'get_holidays_for_year': holidays_workload,
+    'MonthGrid.generate': month_grid_workload,
+    'to_gc + to_ec': conversions_workload,
+}
+
+def run(workload, threads, seconds, reference):
+    """Runs `workload` on `threads` threads for `seconds`; returns total ops and errors."""
+    barrier = threading.Barrier(threads + 1)
+    stop = threading.Event()
+    counts = [0] * threads
+    errors = []
+
+    def worker(index):
+        barrier.wait()
+        i = index * 7919
+        try:
+            while not stop.is_set():
+                result = workload(i)
+                if i < len(reference) and result != reference[i]:
+                    errors.append(f"mismatch at {i}")
+                i += 1
+                counts[index] += 1
+        except Exception as exc:
+            errors.append(repr(exc))
+
+    workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    time.sleep(seconds)
+    stop.set()
+    for thread in workers:
+        thread.join()
+    return sum(counts), errors
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8], help='Thread counts to measure.')
+    parser.add_argument('--seconds', type=float, default=1.0, help='Duration of each measurement.')
+    args = parser.parse_args()
+
+    gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil_enabled else 'disabled'}")
+
+    failed = False
+    for name, workload in WORKLOADS.items():
+        with kenat.caching(enabled=False):
+            reference = [workload(i) for i in range(len(YEARS) * 13)]
+        print(f"\n{name}")
+        baseline = None
+        for threads in args.threads:
+            for state in ('cold', 'warm'):
+                if state == 'cold':
+                    kenat.cache_clear()
+                else:
+                    for i in range(len(reference)):
+                        workload(i)
+                ops, errors = run(workload, threads, args.seconds, reference)
+                rate = ops / args.seconds
+                if state == 'warm' and baseline is None:
+                    baseline = rate
+                scaling = f"  x{rate / baseline:.2f}" if state == 'warm' else ''
+                print(f"  {threads:2d} threads, {state}: {rate:12,.0f} ops/s{scaling}")
+                if errors:
+                    failed = True
+                    print(f"    {len(errors)} errors, first: {errors[0]}")
+    sys.exit(1 if failed else 0)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+Startup benchmark based on `python -X importtime`.
+
+Each scenario is run in a fresh interpreter several times. For every run we
+record the cumulative import time `-X importtime` reports for the `kenat`
+package, the wall-clock time of the whole interpreter compared to an empty
+`python -c pass`, and which kenat modules ended up in `sys.modules`.
+
+`-X importtime` does not log modules that are loaded through
+`importlib.import_module` (which the lazy `kenat.__getattr__` uses), so the
+wall-clock delta is the number to compare across versions.
+
+Usage:
+    python benchmarks/bench_import_time.py [--runs N]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+SCENARIOS = [
+    ('conversion only', 'from kenat import to_ec; to_ec(2024, 5, 23)'),
+    ('Kenat class', 'from kenat import Kenat; Kenat(2016, 9, 15)'),
+    ('holidays', 'from kenat import get_holidays_for_year'),
+    ('everything', 'from kenat import *'),
+]
+
+_REPORT_MODULES = "; import sys; print(','.join(sorted(m for m in sys.modules if m.startswith('kenat'))))"
+
+def _run(statement):
+    """Returns (wall-clock seconds, importtime µs of `kenat`, loaded kenat modules)."""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement + _REPORT_MODULES],
+        capture_output=True, text=True, check=True,
+    )
+    elapsed = time.perf_counter() - start
+
+    package_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative_us, name = [field.strip() for field in line[len('import time:'):].split('|')]
+        if name == 'kenat' and cumulative_us.isdigit():
+            package_us = int(cumulative_us)
+    modules = result.stdout.strip().split(',')
+    return elapsed, package_us, modules
+
+def _baseline(runs):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-X', 'importtime', '-c', 'pass'], capture_output=True, check=True)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=15, help='Interpreter launches per scenario.')
+    args = parser.parse_args()
+
+    baseline = _baseline(args.runs)
+    print(f"empty interpreter: {baseline * 1000:.2f} ms (median of {args.runs})\n")
+    print(f"{'scenario':<16} {'wall delta (ms)':>16} {'importtime (ms)':>16}  kenat modules")
+    for label, statement in SCENARIOS:
+        walls, package_times, modules = [], [], []
+        for _ in range(args.runs):
+            elapsed, package_us, modules = _run(statement)
+            walls.append(elapsed)
+            package_times.append(package_us / 1000)
+        print(f"{label:<16} {(statistics.median(walls) - baseline) * 1000:>16.2f} "
+              f"{statistics.median(package_times):>16.2f}  {len(modules)}: {', '.join(modules)}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,33 @@
+"""
+Measures the per-call overhead of the instrumentation wrapper on `to_ec`,
+with instrumentation disabled and enabled, against the unwrapped function.
+
+Usage:
+    python benchmarks/bench_instrumentation.py [--number N]
+"""
+import argparse
+import timeit
+
+from kenat import conversions, instrumentation
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--number', type=int, default=200_000, help='Calls per measurement.')
+    args = parser.parse_args()
+
+    raw = conversions.to_ec.__wrapped__
+    wrapped = conversions.to_ec
+
+    def best(func):
+        return min(timeit.repeat(lambda: func(2024, 5, 23), number=args.number, repeat=5)) / args.number * 1e9
+
+    baseline = best(raw)
+    print(f"unwrapped to_ec:          {baseline:8.1f} ns/call")
+    disabled = best(wrapped)
+    print(f"instrumentation disabled: {disabled:8.1f} ns/call (+{disabled - baseline:.1f})")
+    with instrumentation.instrumenting():
+        enabled = best(wrapped)
+    print(f"instrumentation enabled:  {enabled:8.1f} ns/call (+{enabled - baseline:.1f})")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+Compares the pickled size and round-trip time of `Kenat` and `Time` lists
+using their compact `__reduce__` against the default `__dict__` pickling,
+and against `packing.pack_many`, plus a process-pool round trip.
+
+Usage:
+    python benchmarks/bench_pickle.py [--count N] [--workers W]
+"""
+import argparse
+import copyreg
+import gc
+import datetime
+import io
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from kenat import Kenat, Time, packing
+
+class DictPickler(pickle.Pickler):
+    """Pickles Kenat and Time the default way, through their __dict__."""
+    def reducer_override(self, obj):
+        if isinstance(obj, (Kenat, Time)):
+            return (copyreg.__newobj__, (type(obj),), dict(vars(obj)))
+        return NotImplemented
+
+def dict_dumps(obj):
+    buffer = io.BytesIO()
+    DictPickler(buffer, pickle.HIGHEST_PROTOCOL).dump(obj)
+    return buffer.getvalue()
+
+def compact_dumps(obj):
+    return pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+
+def timed(func, *args, repeat=3):
+    """Returns the best time of `repeat` calls and the result; GC is paused like in timeit."""
+    best = float('inf')
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = func(*args)
+            best = min(best, time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return best, result
+
+def report(label, values):
+    print(f"\n{label} ({len(values):,} objects)")
+    for name, dumps in (('__dict__', dict_dumps), ('__reduce__', compact_dumps)):
+        dump_time, payload = timed(dumps, values)
+        load_time, restored = timed(pickle.loads, payload)
+        assert restored == values
+        print(f"  {name:<10} {len(payload) / len(values):6.1f} B/object  "
+              f"dumps {dump_time * 1e3:7.1f} ms  loads {load_time * 1e3:7.1f} ms")
+
+def echo(values):
+    return values
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=100_000, help='Objects per list.')
+    parser.add_argument('--workers', type=int, default=2, help='Processes for the round-trip test.')
+    args = parser.parse_args()
+
+    start = datetime.datetime(2020, 1, 1)
+    dates = [Kenat(start + datetime.timedelta(days=i % 20000)) for i in range(args.count)]
+    dates_with_time = [Kenat(start + datetime.timedelta(days=i % 20000, minutes=i * 7))
+                       for i in range(args.count)]
+    times = [Time.from_minute_of_day(i % 1440) for i in range(args.count)]
+
+    report('Kenat, default time', dates)
+    report('Kenat with time', dates_with_time)
+    report('Time', times)
+
+    pack_time, packed = timed(packing.pack_many, dates)
+    unpack_time, _ = timed(packing.unpack_many, packed)
+    print(f"\npack_many  {packed.itemsize:6.1f} B/object  "
+          f"pack  {pack_time * 1e3:7.1f} ms  unpack {unpack_time * 1e3:7.1f} ms")
+
+    with ProcessPoolExecutor(args.workers) as executor:
+        executor.submit(echo, None).result() # Start the workers
+        elapsed, result = timed(lambda: executor.submit(echo, dates).result())
+        assert result == dates
+    print(f"\nProcess-pool round trip of {len(dates):,} dates: {elapsed * 1e3:.1f} ms")
+
+if __name__ == '__main__':
+    main()
@@ -1,14 +1,58 @@
-from .kenat import Kenat
+from importlib import import_module
+
 from .conversions import to_ec, to_gc
-from .geez_converter import to_arabic, to_geez
-from .holidays import get_holidays_in_month, get_holiday, get_holidays_for_year
-from .bahire_hasab import get_bahire_hasab
-from .month_grid import MonthGrid
-from .time import Time
-from .constants import HolidayTags, MONTH_NAMES
+from .utils import set_validation_mode, get_validation_mode, validation_mode
+from .cache import cache_info, cache_clear, caching, set_cache_maxsize, set_caching_enabled, warmup
+
+# Everything else is imported on first access (PEP 562), so that a caller who
+# only needs `to_ec`/`to_gc` does not pay for holidays, Bahire Hasab, MonthGrid,
+# Time and the localized holiday tables at startup.
+_LAZY_ATTRIBUTES = {
+    'Kenat': '.kenat',
+    'EthiopianDateTime': '.date_time',
+    'KenatArray': '.kenat_array',
+    'to_arabic': '.geez_converter',
+    'to_geez': '.geez_converter',
+    'get_holidays_in_month': '.holidays',
+    'get_holiday': '.holidays',
+    'get_holidays_for_year': '.holidays',
+    'Holiday': '.holiday_record',
+    'get_bahire_hasab': '.bahire_hasab',
+    'MonthGrid': '.month_grid',
+    'Time': '.time',
+    'HolidayTags': '.constants',
+    'MONTH_NAMES': '.constants',
+}
+
+_LAZY_SUBMODULES = {
+    'arrow',
+    'bahire_hasab',
+    'cache',
+    'constants',
+    'date_time',
+    'day_arithmetic',
+    'formatting',
+    'geez_converter',
+    'holiday_record',
+    'holiday_rules',
+    'holidays',
+    'ical',
+    'instrumentation',
+    'kenat',
+    'kenat_array',
+    'month_grid',
+    'packing',
+    'pandas',
+    'parallel',
+    'sqlalchemy',
+    'sqlite',
+    'time',
+}
 
 __all__ = [
     'Kenat',
+    'EthiopianDateTime',
+    'KenatArray',
     'to_ec',
     'to_gc',
     'to_arabic',
@@ -19,6 +63,29 @@ __all__ = [
     'MonthGrid',
     'Time',
     'get_holiday',
+    'Holiday',
     'HolidayTags',
     'MONTH_NAMES',
+    'set_validation_mode',
+    'get_validation_mode',
+    'validation_mode',
+    'cache_info',
+    'cache_clear',
+    'caching',
+    'set_cache_maxsize',
+    'set_caching_enabled',
+    'warmup',
 ]
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    elif name in _LAZY_SUBMODULES:
+        value = import_module(f'.{name}', __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value # Cache so later lookups bypass __getattr__
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | _LAZY_SUBMODULES)
@@ -0,0 +1,206 @@
+# Gregorian dates of the Islamic holidays in each Ethiopian year, computed with
+# the tabular Islamic calendar. Generated by tools/generate_islamic_holidays.py;
+# do not edit. Observed dates that differ are supplied with
+# `holidays.load_islamic_holiday_overrides`.
+ISLAMIC_HOLIDAYS = {
+  1893: {'moulid': ((1901, 6, 28),), 'eidFitr': ((1901, 1, 21),), 'eidAdha': ((1901, 3, 30),)},
+  1894: {'moulid': ((1902, 6, 18),), 'eidFitr': ((1902, 1, 10),), 'eidAdha': ((1902, 3, 19),)},
+  1895: {'moulid': ((1903, 6, 7),), 'eidFitr': ((1902, 12, 31),), 'eidAdha': ((1903, 3, 9),)},
+  1896: {'moulid': ((1904, 5, 26),), 'eidFitr': ((1903, 12, 20),), 'eidAdha': ((1904, 2, 26),)},
+  1897: {'moulid': ((1905, 5, 16),), 'eidFitr': ((1904, 12, 8),), 'eidAdha': ((1905, 2, 14),)},
+  1898: {'moulid': ((1906, 5, 5),), 'eidFitr': ((1905, 11, 28),), 'eidAdha': ((1906, 2, 4),)},
+  1899: {'moulid': ((1907, 4, 24),), 'eidFitr': ((1906, 11, 17),), 'eidAdha': ((1907, 1, 24),)},
+  1900: {'moulid': ((1908, 4, 13),), 'eidFitr': ((1907, 11, 6),), 'eidAdha': ((1908, 1, 13),)},
+  1901: {'moulid': ((1909, 4, 2),), 'eidFitr': ((1908, 10, 26),), 'eidAdha': ((1909, 1, 2),)},
+  1902: {'moulid': ((1910, 3, 23),), 'eidFitr': ((1909, 10, 15),), 'eidAdha': ((1909, 12, 22),)},
+  1903: {'moulid': ((1911, 3, 12),), 'eidFitr': ((1910, 10, 5),), 'eidAdha': ((1910, 12, 12),)},
+  1904: {'moulid': ((1912, 2, 29),), 'eidFitr': ((1911, 9, 24),), 'eidAdha': ((1911, 12, 1),)},
+  1905: {'moulid': ((1913, 2, 18),), 'eidFitr': ((1912, 9, 12), (1913, 9, 2)), 'eidAdha': ((1912, 11, 19),)},
+  1906: {'moulid': ((1914, 2, 7),), 'eidFitr': ((1914, 8, 22),), 'eidAdha': ((1913, 11, 9),)},
+  1907: {'moulid': ((1915, 1, 27),), 'eidFitr': ((1915, 8, 11),), 'eidAdha': ((1914, 10, 29),)},
+  1908: {'moulid': ((1916, 1, 17),), 'eidFitr': ((1916, 7, 31),), 'eidAdha': ((1915, 10, 18),)},
+  1909: {'moulid': ((1917, 1, 5),), 'eidFitr': ((1917, 7, 20),), 'eidAdha': ((1916, 10, 7),)},
+  1910: {'moulid': ((1917, 12, 25),), 'eidFitr': ((1918, 7, 9),), 'eidAdha': ((1917, 9, 26),)},
+  1911: {'moulid': ((1918, 12, 15),), 'eidFitr': ((1919, 6, 29),), 'eidAdha': ((1918, 9, 15), (1919, 9, 5))},
+  1912: {'moulid': ((1919, 12, 4),), 'eidFitr': ((1920, 6, 17),), 'eidAdha': ((1920, 8, 24),)},
+  1913: {'moulid': ((1920, 11, 23),), 'eidFitr': ((1921, 6, 7),), 'eidAdha': ((1921, 8, 14),)},
+  1914: {'moulid': ((1921, 11, 12),), 'eidFitr': ((1922, 5, 27),), 'eidAdha': ((1922, 8, 3),)},
+  1915: {'moulid': ((1922, 11, 1),), 'eidFitr': ((1923, 5, 16),), 'eidAdha': ((1923, 7, 23),)},
+  1916: {'moulid': ((1923, 10, 22),), 'eidFitr': ((1924, 5, 5),), 'eidAdha': ((1924, 7, 12),)},
+  1917: {'moulid': ((1924, 10, 10),), 'eidFitr': ((1925, 4, 24),), 'eidAdha': ((1925, 7, 1),)},
+  1918: {'moulid': ((1925, 9, 29),), 'eidFitr': ((1926, 4, 13),), 'eidAdha': ((1926, 6, 20),)},
+  1919: {'moulid': ((1926, 9, 19), (1927, 9, 8)), 'eidFitr': ((1927, 4, 3),), 'eidAdha': ((1927, 6, 10),)},
+  1920: {'moulid': ((1928, 8, 28),), 'eidFitr': ((1928, 3, 22),), 'eidAdha': ((1928, 5, 29),)},
+  1921: {'moulid': ((1929, 8, 17),), 'eidFitr': ((1929, 3, 12),), 'eidAdha': ((1929, 5, 19),)},
+  1922: {'moulid': ((1930, 8, 6),), 'eidFitr': ((1930, 3, 1),), 'eidAdha': ((1930, 5, 8),)},
+  1923: {'moulid': ((1931, 7, 27),), 'eidFitr': ((1931, 2, 18),), 'eidAdha': ((1931, 4, 27),)},
+  1924: {'moulid': ((1932, 7, 15),), 'eidFitr': ((1932, 2, 8),), 'eidAdha': ((1932, 4, 16),)},
+  1925: {'moulid': ((1933, 7, 4),), 'eidFitr': ((1933, 1, 27),), 'eidAdha': ((1933, 4, 5),)},
+  1926: {'moulid': ((1934, 6, 24),), 'eidFitr': ((1934, 1, 16),), 'eidAdha': ((1934, 3, 25),)},
+  1927: {'moulid': ((1935, 6, 13),), 'eidFitr': ((1935, 1, 6),), 'eidAdha': ((1935, 3, 15),)},
+  1928: {'moulid': ((1936, 6, 1),), 'eidFitr': ((1935, 12, 26),), 'eidAdha': ((1936, 3, 3),)},
+  1929: {'moulid': ((1937, 5, 22),), 'eidFitr': ((1936, 12, 14),), 'eidAdha': ((1937, 2, 20),)},
+  1930: {'moulid': ((1938, 5, 11),), 'eidFitr': ((1937, 12, 4),), 'eidAdha': ((1938, 2, 10),)},
+  1931: {'moulid': ((1939, 5, 1),), 'eidFitr': ((1938, 11, 23),), 'eidAdha': ((1939, 1, 30),)},
+  1932: {'moulid': ((1940, 4, 19),), 'eidFitr': ((1939, 11, 13),), 'eidAdha': ((1940, 1, 20),)},
+  1933: {'moulid': ((1941, 4, 8),), 'eidFitr': ((1940, 11, 1),), 'eidAdha': ((1941, 1, 8),)},
+  1934: {'moulid': ((1942, 3, 29),), 'eidFitr': ((1941, 10, 21),), 'eidAdha': ((1941, 12, 28),)},
+  1935: {'moulid': ((1943, 3, 18),), 'eidFitr': ((1942, 10, 11),), 'eidAdha': ((1942, 12, 18),)},
+  1936: {'moulid': ((1944, 3, 6),), 'eidFitr': ((1943, 9, 30),), 'eidAdha': ((1943, 12, 7),)},
+  1937: {'moulid': ((1945, 2, 24),), 'eidFitr': ((1944, 9, 18), (1945, 9, 8)), 'eidAdha': ((1944, 11, 25),)},
+  1938: {'moulid': ((1946, 2, 13),), 'eidFitr': ((1946, 8, 28),), 'eidAdha': ((1945, 11, 15),)},
+  1939: {'moulid': ((1947, 2, 2),), 'eidFitr': ((1947, 8, 17),), 'eidAdha': ((1946, 11, 4),)},
+  1940: {'moulid': ((1948, 1, 23),), 'eidFitr': ((1948, 8, 6),), 'eidAdha': ((1947, 10, 24),)},
+  1941: {'moulid': ((1949, 1, 11),), 'eidFitr': ((1949, 7, 26),), 'eidAdha': ((1948, 10, 13),)},
+  1942: {'moulid': ((1950, 1, 1),), 'eidFitr': ((1950, 7, 16),), 'eidAdha': ((1949, 10, 2),)},
+  1943: {'moulid': ((1950, 12, 21),), 'eidFitr': ((1951, 7, 5),), 'eidAdha': ((1950, 9, 22), (1951, 9, 11))},
+  1944: {'moulid': ((1951, 12, 10),), 'eidFitr': ((1952, 6, 23),), 'eidAdha': ((1952, 8, 30),)},
+  1945: {'moulid': ((1952, 11, 29),), 'eidFitr': ((1953, 6, 13),), 'eidAdha': ((1953, 8, 20),)},
+  1946: {'moulid': ((1953, 11, 18),), 'eidFitr': ((1954, 6, 2),), 'eidAdha': ((1954, 8, 9),)},
+  1947: {'moulid': ((1954, 11, 7),), 'eidFitr': ((1955, 5, 22),), 'eidAdha': ((1955, 7, 29),)},
+  1948: {'moulid': ((1955, 10, 28),), 'eidFitr': ((1956, 5, 11),), 'eidAdha': ((1956, 7, 18),)},
+  1949: {'moulid': ((1956, 10, 16),), 'eidFitr': ((1957, 4, 30),), 'eidAdha': ((1957, 7, 7),)},
+  1950: {'moulid': ((1957, 10, 6),), 'eidFitr': ((1958, 4, 20),), 'eidAdha': ((1958, 6, 27),)},
+  1951: {'moulid': ((1958, 9, 25),), 'eidFitr': ((1959, 4, 9),), 'eidAdha': ((1959, 6, 16),)},
+  1952: {'moulid': ((1959, 9, 14), (1960, 9, 3)), 'eidFitr': ((1960, 3, 28),), 'eidAdha': ((1960, 6, 4),)},
+  1953: {'moulid': ((1961, 8, 23),), 'eidFitr': ((1961, 3, 18),), 'eidAdha': ((1961, 5, 25),)},
+  1954: {'moulid': ((1962, 8, 12),), 'eidFitr': ((1962, 3, 7),), 'eidAdha': ((1962, 5, 14),)},
+  1955: {'moulid': ((1963, 8, 2),), 'eidFitr': ((1963, 2, 24),), 'eidAdha': ((1963, 5, 3),)},
+  1956: {'moulid': ((1964, 7, 21),), 'eidFitr': ((1964, 2, 14),), 'eidAdha': ((1964, 4, 22),)},
+  1957: {'moulid': ((1965, 7, 10),), 'eidFitr': ((1965, 2, 2),), 'eidAdha': ((1965, 4, 11),)},
+  1958: {'moulid': ((1966, 6, 30),), 'eidFitr': ((1966, 1, 22),), 'eidAdha': ((1966, 3, 31),)},
+  1959: {'moulid': ((1967, 6, 19),), 'eidFitr': ((1967, 1, 12),), 'eidAdha': ((1967, 3, 21),)},
+  1960: {'moulid': ((1968, 6, 8),), 'eidFitr': ((1968, 1, 1),), 'eidAdha': ((1968, 3, 9),)},
+  1961: {'moulid': ((1969, 5, 28),), 'eidFitr': ((1968, 12, 21),), 'eidAdha': ((1969, 2, 27),)},
+  1962: {'moulid': ((1970, 5, 17),), 'eidFitr': ((1969, 12, 10),), 'eidAdha': ((1970, 2, 16),)},
+  1963: {'moulid': ((1971, 5, 7),), 'eidFitr': ((1970, 11, 29),), 'eidAdha': ((1971, 2, 5),)},
+  1964: {'moulid': ((1972, 4, 25),), 'eidFitr': ((1971, 11, 19),), 'eidAdha': ((1972, 1, 26),)},
+  1965: {'moulid': ((1973, 4, 14),), 'eidFitr': ((1972, 11, 7),), 'eidAdha': ((1973, 1, 14),)},
+  1966: {'moulid': ((1974, 4, 4),), 'eidFitr': ((1973, 10, 27),), 'eidAdha': ((1974, 1, 3),)},
+  1967: {'moulid': ((1975, 3, 24),), 'eidFitr': ((1974, 10, 17),), 'eidAdha': ((1974, 12, 24),)},
+  1968: {'moulid': ((1976, 3, 12),), 'eidFitr': ((1975, 10, 6),), 'eidAdha': ((1975, 12, 13),)},
+  1969: {'moulid': ((1977, 3, 2),), 'eidFitr': ((1976, 9, 24),), 'eidAdha': ((1976, 12, 1),)},
+  1970: {'moulid': ((1978, 2, 19),), 'eidFitr': ((1977, 9, 14), (1978, 9, 3)), 'eidAdha': ((1977, 11, 21),)},
+  1971: {'moulid': ((1979, 2, 9),), 'eidFitr': ((1979, 8, 24),), 'eidAdha': ((1978, 11, 10),)},
+  1972: {'moulid': ((1980, 1, 29),), 'eidFitr': ((1980, 8, 12),), 'eidAdha': ((1979, 10, 31),)},
+  1973: {'moulid': ((1981, 1, 17),), 'eidFitr': ((1981, 8, 1),), 'eidAdha': ((1980, 10, 19),)},
+  1974: {'moulid': ((1982, 1, 7),), 'eidFitr': ((1982, 7, 22),), 'eidAdha': ((1981, 10, 8),)},
+  1975: {'moulid': ((1982, 12, 27),), 'eidFitr': ((1983, 7, 11),), 'eidAdha': ((1982, 9, 28),)},
+  1976: {'moulid': ((1983, 12, 16),), 'eidFitr': ((1984, 6, 29),), 'eidAdha': ((1983, 9, 17), (1984, 9, 5))},
+  1977: {'moulid': ((1984, 12, 5),), 'eidFitr': ((1985, 6, 19),), 'eidAdha': ((1985, 8, 26),)},
+  1978: {'moulid': ((1985, 11, 24),), 'eidFitr': ((1986, 6, 8),), 'eidAdha': ((1986, 8, 15),)},
+  1979: {'moulid': ((1986, 11, 14),), 'eidFitr': ((1987, 5, 29),), 'eidAdha': ((1987, 8, 5),)},
+  1980: {'moulid': ((1987, 11, 3),), 'eidFitr': ((1988, 5, 17),), 'eidAdha': ((1988, 7, 24),)},
+  1981: {'moulid': ((1988, 10, 22),), 'eidFitr': ((1989, 5, 6),), 'eidAdha': ((1989, 7, 13),)},
+  1982: {'moulid': ((1989, 10, 12),), 'eidFitr': ((1990, 4, 26),), 'eidAdha': ((1990, 7, 3),)},
+  1983: {'moulid': ((1990, 10, 1),), 'eidFitr': ((1991, 4, 15),), 'eidAdha': ((1991, 6, 22),)},
+  1984: {'moulid': ((1991, 9, 20), (1992, 9, 9)), 'eidFitr': ((1992, 4, 3),), 'eidAdha': ((1992, 6, 10),)},
+  1985: {'moulid': ((1993, 8, 29),), 'eidFitr': ((1993, 3, 24),), 'eidAdha': ((1993, 5, 31),)},
+  1986: {'moulid': ((1994, 8, 18),), 'eidFitr': ((1994, 3, 13),), 'eidAdha': ((1994, 5, 20),)},
+  1987: {'moulid': ((1995, 8, 8),), 'eidFitr': ((1995, 3, 2),), 'eidAdha': ((1995, 5, 9),)},
+  1988: {'moulid': ((1996, 7, 27),), 'eidFitr': ((1996, 2, 20),), 'eidAdha': ((1996, 4, 28),)},
+  1989: {'moulid': ((1997, 7, 17),), 'eidFitr': ((1997, 2, 8),), 'eidAdha': ((1997, 4, 17),)},
+  1990: {'moulid': ((1998, 7, 6),), 'eidFitr': ((1998, 1, 29),), 'eidAdha': ((1998, 4, 7),)},
+  1991: {'moulid': ((1999, 6, 25),), 'eidFitr': ((1999, 1, 18),), 'eidAdha': ((1999, 3, 27),)},
+  1992: {'moulid': ((2000, 6, 14),), 'eidFitr': ((2000, 1, 7),), 'eidAdha': ((2000, 3, 15),)},
+  1993: {'moulid': ((2001, 6, 3),), 'eidFitr': ((2000, 12, 27),), 'eidAdha': ((2001, 3, 5),)},
+  1994: {'moulid': ((2002, 5, 23),), 'eidFitr': ((2001, 12, 16),), 'eidAdha': ((2002, 2, 22),)},
+  1995: {'moulid': ((2003, 5, 13),), 'eidFitr': ((2002, 12, 5),), 'eidAdha': ((2003, 2, 11),)},
+  1996: {'moulid': ((2004, 5, 1),), 'eidFitr': ((2003, 11, 25),), 'eidAdha': ((2004, 2, 1),)},
+  1997: {'moulid': ((2005, 4, 20),), 'eidFitr': ((2004, 11, 13),), 'eidAdha': ((2005, 1, 20),)},
+  1998: {'moulid': ((2006, 4, 10),), 'eidFitr': ((2005, 11, 2),), 'eidAdha': ((2006, 1, 9),)},
+  1999: {'moulid': ((2007, 3, 30),), 'eidFitr': ((2006, 10, 23),), 'eidAdha': ((2006, 12, 30),)},
+  2000: {'moulid': ((2008, 3, 19),), 'eidFitr': ((2007, 10, 12),), 'eidAdha': ((2007, 12, 19),)},
+  2001: {'moulid': ((2009, 3, 8),), 'eidFitr': ((2008, 10, 1),), 'eidAdha': ((2008, 12, 8),)},
+  2002: {'moulid': ((2010, 2, 25),), 'eidFitr': ((2009, 9, 20), (2010, 9, 9)), 'eidAdha': ((2009, 11, 27),)},
+  2003: {'moulid': ((2011, 2, 15),), 'eidFitr': ((2011, 8, 30),), 'eidAdha': ((2010, 11, 16),)},
+  2004: {'moulid': ((2012, 2, 4),), 'eidFitr': ((2012, 8, 18),), 'eidAdha': ((2011, 11, 6),)},
+  2005: {'moulid': ((2013, 1, 23),), 'eidFitr': ((2013, 8, 7),), 'eidAdha': ((2012, 10, 25),)},
+  2006: {'moulid': ((2014, 1, 13),), 'eidFitr': ((2014, 7, 28),), 'eidAdha': ((2013, 10, 14),)},
+  2007: {'moulid': ((2015, 1, 2),), 'eidFitr': ((2015, 7, 17),), 'eidAdha': ((2014, 10, 4),)},
+  2008: {'moulid': ((2015, 12, 23),), 'eidFitr': ((2016, 7, 6),), 'eidAdha': ((2015, 9, 23),)},
+  2009: {'moulid': ((2016, 12, 11),), 'eidFitr': ((2017, 6, 25),), 'eidAdha': ((2016, 9, 12), (2017, 9, 1))},
+  2010: {'moulid': ((2017, 11, 30),), 'eidFitr': ((2018, 6, 14),), 'eidAdha': ((2018, 8, 21),)},
+  2011: {'moulid': ((2018, 11, 20),), 'eidFitr': ((2019, 6, 4),), 'eidAdha': ((2019, 8, 11),)},
+  2012: {'moulid': ((2019, 11, 9),), 'eidFitr': ((2020, 5, 23),), 'eidAdha': ((2020, 7, 30),)},
+  2013: {'moulid': ((2020, 10, 28),), 'eidFitr': ((2021, 5, 12),), 'eidAdha': ((2021, 7, 19),)},
+  2014: {'moulid': ((2021, 10, 18),), 'eidFitr': ((2022, 5, 2),), 'eidAdha': ((2022, 7, 9),)},
+  2015: {'moulid': ((2022, 10, 7),), 'eidFitr': ((2023, 4, 21),), 'eidAdha': ((2023, 6, 28),)},
+  2016: {'moulid': ((2023, 9, 26),), 'eidFitr': ((2024, 4, 9),), 'eidAdha': ((2024, 6, 16),)},
+  2017: {'moulid': ((2024, 9, 15), (2025, 9, 4)), 'eidFitr': ((2025, 3, 30),), 'eidAdha': ((2025, 6, 6),)},
+  2018: {'moulid': ((2026, 8, 25),), 'eidFitr': ((2026, 3, 19),), 'eidAdha': ((2026, 5, 26),)},
+  2019: {'moulid': ((2027, 8, 14),), 'eidFitr': ((2027, 3, 9),), 'eidAdha': ((2027, 5, 16),)},
+  2020: {'moulid': ((2028, 8, 2),), 'eidFitr': ((2028, 2, 26),), 'eidAdha': ((2028, 5, 4),)},
+  2021: {'moulid': ((2029, 7, 23),), 'eidFitr': ((2029, 2, 14),), 'eidAdha': ((2029, 4, 23),)},
+  2022: {'moulid': ((2030, 7, 12),), 'eidFitr': ((2030, 2, 4),), 'eidAdha': ((2030, 4, 13),)},
+  2023: {'moulid': ((2031, 7, 1),), 'eidFitr': ((2031, 1, 24),), 'eidAdha': ((2031, 4, 2),)},
+  2024: {'moulid': ((2032, 6, 20),), 'eidFitr': ((2032, 1, 13),), 'eidAdha': ((2032, 3, 21),)},
+  2025: {'moulid': ((2033, 6, 9),), 'eidFitr': ((2033, 1, 2),), 'eidAdha': ((2033, 3, 11),)},
+  2026: {'moulid': ((2034, 5, 29),), 'eidFitr': ((2033, 12, 22),), 'eidAdha': ((2034, 2, 28),)},
+  2027: {'moulid': ((2035, 5, 19),), 'eidFitr': ((2034, 12, 11),), 'eidAdha': ((2035, 2, 17),)},
+  2028: {'moulid': ((2036, 5, 7),), 'eidFitr': ((2035, 12, 1),), 'eidAdha': ((2036, 2, 7),)},
+  2029: {'moulid': ((2037, 4, 27),), 'eidFitr': ((2036, 11, 19),), 'eidAdha': ((2037, 1, 26),)},
+  2030: {'moulid': ((2038, 4, 16),), 'eidFitr': ((2037, 11, 9),), 'eidAdha': ((2038, 1, 16),)},
+  2031: {'moulid': ((2039, 4, 5),), 'eidFitr': ((2038, 10, 29),), 'eidAdha': ((2039, 1, 5),)},
+  2032: {'moulid': ((2040, 3, 25),), 'eidFitr': ((2039, 10, 18),), 'eidAdha': ((2039, 12, 25),)},
+  2033: {'moulid': ((2041, 3, 14),), 'eidFitr': ((2040, 10, 7),), 'eidAdha': ((2040, 12, 14),)},
+  2034: {'moulid': ((2042, 3, 3),), 'eidFitr': ((2041, 9, 26),), 'eidAdha': ((2041, 12, 3),)},
+  2035: {'moulid': ((2043, 2, 21),), 'eidFitr': ((2042, 9, 15), (2043, 9, 5)), 'eidAdha': ((2042, 11, 22),)},
+  2036: {'moulid': ((2044, 2, 10),), 'eidFitr': ((2044, 8, 24),), 'eidAdha': ((2043, 11, 12),)},
+  2037: {'moulid': ((2045, 1, 30),), 'eidFitr': ((2045, 8, 14),), 'eidAdha': ((2044, 10, 31),)},
+  2038: {'moulid': ((2046, 1, 19),), 'eidFitr': ((2046, 8, 3),), 'eidAdha': ((2045, 10, 21),)},
+  2039: {'moulid': ((2047, 1, 8),), 'eidFitr': ((2047, 7, 23),), 'eidAdha': ((2046, 10, 10),)},
+  2040: {'moulid': ((2047, 12, 29),), 'eidFitr': ((2048, 7, 12),), 'eidAdha': ((2047, 9, 29),)},
+  2041: {'moulid': ((2048, 12, 17),), 'eidFitr': ((2049, 7, 1),), 'eidAdha': ((2048, 9, 18), (2049, 9, 7))},
+  2042: {'moulid': ((2049, 12, 6),), 'eidFitr': ((2050, 6, 20),), 'eidAdha': ((2050, 8, 27),)},
+  2043: {'moulid': ((2050, 11, 26),), 'eidFitr': ((2051, 6, 10),), 'eidAdha': ((2051, 8, 17),)},
+  2044: {'moulid': ((2051, 11, 15),), 'eidFitr': ((2052, 5, 29),), 'eidAdha': ((2052, 8, 5),)},
+  2045: {'moulid': ((2052, 11, 3),), 'eidFitr': ((2053, 5, 18),), 'eidAdha': ((2053, 7, 25),)},
+  2046: {'moulid': ((2053, 10, 24),), 'eidFitr': ((2054, 5, 8),), 'eidAdha': ((2054, 7, 15),)},
+  2047: {'moulid': ((2054, 10, 13),), 'eidFitr': ((2055, 4, 27),), 'eidAdha': ((2055, 7, 4),)},
+  2048: {'moulid': ((2055, 10, 3),), 'eidFitr': ((2056, 4, 16),), 'eidAdha': ((2056, 6, 23),)},
+  2049: {'moulid': ((2056, 9, 21), (2057, 9, 10)), 'eidFitr': ((2057, 4, 5),), 'eidAdha': ((2057, 6, 12),)},
+  2050: {'moulid': ((2058, 8, 31),), 'eidFitr': ((2058, 3, 25),), 'eidAdha': ((2058, 6, 1),)},
+  2051: {'moulid': ((2059, 8, 20),), 'eidFitr': ((2059, 3, 15),), 'eidAdha': ((2059, 5, 22),)},
+  2052: {'moulid': ((2060, 8, 8),), 'eidFitr': ((2060, 3, 3),), 'eidAdha': ((2060, 5, 10),)},
+  2053: {'moulid': ((2061, 7, 29),), 'eidFitr': ((2061, 2, 20),), 'eidAdha': ((2061, 4, 29),)},
+  2054: {'moulid': ((2062, 7, 18),), 'eidFitr': ((2062, 2, 10),), 'eidAdha': ((2062, 4, 19),)},
+  2055: {'moulid': ((2063, 7, 7),), 'eidFitr': ((2063, 1, 30),), 'eidAdha': ((2063, 4, 8),)},
+  2056: {'moulid': ((2064, 6, 26),), 'eidFitr': ((2064, 1, 19),), 'eidAdha': ((2064, 3, 27),)},
+  2057: {'moulid': ((2065, 6, 15),), 'eidFitr': ((2065, 1, 8),), 'eidAdha': ((2065, 3, 17),)},
+  2058: {'moulid': ((2066, 6, 5),), 'eidFitr': ((2065, 12, 28),), 'eidAdha': ((2066, 3, 6),)},
+  2059: {'moulid': ((2067, 5, 25),), 'eidFitr': ((2066, 12, 18),), 'eidAdha': ((2067, 2, 24),)},
+  2060: {'moulid': ((2068, 5, 13),), 'eidFitr': ((2067, 12, 7),), 'eidAdha': ((2068, 2, 13),)},
+  2061: {'moulid': ((2069, 5, 3),), 'eidFitr': ((2068, 11, 25),), 'eidAdha': ((2069, 2, 1),)},
+  2062: {'moulid': ((2070, 4, 22),), 'eidFitr': ((2069, 11, 15),), 'eidAdha': ((2070, 1, 22),)},
+  2063: {'moulid': ((2071, 4, 11),), 'eidFitr': ((2070, 11, 4),), 'eidAdha': ((2071, 1, 11),)},
+  2064: {'moulid': ((2072, 3, 31),), 'eidFitr': ((2071, 10, 24),), 'eidAdha': ((2071, 12, 31),)},
+  2065: {'moulid': ((2073, 3, 20),), 'eidFitr': ((2072, 10, 13),), 'eidAdha': ((2072, 12, 20),)},
+  2066: {'moulid': ((2074, 3, 10),), 'eidFitr': ((2073, 10, 2),), 'eidAdha': ((2073, 12, 9),)},
+  2067: {'moulid': ((2075, 2, 27),), 'eidFitr': ((2074, 9, 22), (2075, 9, 11)), 'eidAdha': ((2074, 11, 29),)},
+  2068: {'moulid': ((2076, 2, 16),), 'eidFitr': ((2076, 8, 30),), 'eidAdha': ((2075, 11, 18),)},
+  2069: {'moulid': ((2077, 2, 5),), 'eidFitr': ((2077, 8, 20),), 'eidAdha': ((2076, 11, 6),)},
+  2070: {'moulid': ((2078, 1, 25),), 'eidFitr': ((2078, 8, 9),), 'eidAdha': ((2077, 10, 27),)},
+  2071: {'moulid': ((2079, 1, 14),), 'eidFitr': ((2079, 7, 29),), 'eidAdha': ((2078, 10, 16),)},
+  2072: {'moulid': ((2080, 1, 4),), 'eidFitr': ((2080, 7, 18),), 'eidAdha': ((2079, 10, 5),)},
+  2073: {'moulid': ((2080, 12, 23),), 'eidFitr': ((2081, 7, 7),), 'eidAdha': ((2080, 9, 24),)},
+  2074: {'moulid': ((2081, 12, 12),), 'eidFitr': ((2082, 6, 26),), 'eidAdha': ((2081, 9, 13), (2082, 9, 2))},
+  2075: {'moulid': ((2082, 12, 2),), 'eidFitr': ((2083, 6, 16),), 'eidAdha': ((2083, 8, 23),)},
+  2076: {'moulid': ((2083, 11, 21),), 'eidFitr': ((2084, 6, 4),), 'eidAdha': ((2084, 8, 11),)},
+  2077: {'moulid': ((2084, 11, 10),), 'eidFitr': ((2085, 5, 25),), 'eidAdha': ((2085, 8, 1),)},
+  2078: {'moulid': ((2085, 10, 30),), 'eidFitr': ((2086, 5, 14),), 'eidAdha': ((2086, 7, 21),)},
+  2079: {'moulid': ((2086, 10, 19),), 'eidFitr': ((2087, 5, 3),), 'eidAdha': ((2087, 7, 10),)},
+  2080: {'moulid': ((2087, 10, 9),), 'eidFitr': ((2088, 4, 22),), 'eidAdha': ((2088, 6, 29),)},
+  2081: {'moulid': ((2088, 9, 27),), 'eidFitr': ((2089, 4, 11),), 'eidAdha': ((2089, 6, 18),)},
+  2082: {'moulid': ((2089, 9, 16), (2090, 9, 6)), 'eidFitr': ((2090, 3, 31),), 'eidAdha': ((2090, 6, 7),)},
+  2083: {'moulid': ((2091, 8, 26),), 'eidFitr': ((2091, 3, 21),), 'eidAdha': ((2091, 5, 28),)},
+  2084: {'moulid': ((2092, 8, 14),), 'eidFitr': ((2092, 3, 9),), 'eidAdha': ((2092, 5, 16),)},
+  2085: {'moulid': ((2093, 8, 4),), 'eidFitr': ((2093, 2, 26),), 'eidAdha': ((2093, 5, 5),)},
+  2086: {'moulid': ((2094, 7, 24),), 'eidFitr': ((2094, 2, 16),), 'eidAdha': ((2094, 4, 25),)},
+  2087: {'moulid': ((2095, 7, 14),), 'eidFitr': ((2095, 2, 5),), 'eidAdha': ((2095, 4, 14),)},
+  2088: {'moulid': ((2096, 7, 2),), 'eidFitr': ((2096, 1, 26),), 'eidAdha': ((2096, 4, 3),)},
+  2089: {'moulid': ((2097, 6, 21),), 'eidFitr': ((2097, 1, 14),), 'eidAdha': ((2097, 3, 23),)},
+  2090: {'moulid': ((2098, 6, 11),), 'eidFitr': ((2098, 1, 3),), 'eidAdha': ((2098, 3, 12),)},
+  2091: {'moulid': ((2099, 5, 31),), 'eidFitr': ((2098, 12, 24),), 'eidAdha': ((2099, 3, 2),)},
+  2092: {'moulid': ((2100, 5, 20),), 'eidFitr': ((2099, 12, 13),), 'eidAdha': ((2100, 2, 19),)},
+}
@@ -0,0 +1,228 @@
+"""
+Apache Arrow integration: an Ethiopian date extension type and bulk conversions.
+
+Requires pyarrow (`pip install kenat[arrow]`). Importing this module
+registers the `kenat.ethiopian_date` extension type, so Ethiopian date
+columns keep their type through IPC streams and Parquet files:
+
+    import pyarrow.parquet as pq
+    from kenat import arrow as kenat_arrow
+
+    table = pq.read_table('sales.parquet')
+    table = kenat_arrow.with_ethiopian_columns(table, 'date')
+    pq.write_to_dataset(table, 'sales_by_year', partition_cols=['date_ec_year'])
+
+Ethiopian dates are stored as int32 day numbers (see
+`conversions.ethiopian_to_day_number`). All conversions operate on the Arrow
+buffers through numpy and never create Python date objects; null slots
+stay null. Every function accepts an Array or a ChunkedArray and returns
+the same kind.
+"""
+try:
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError as e: # pragma: no cover - depends on the environment
+    raise ImportError("kenat.arrow requires pyarrow. Install it with `pip install kenat[arrow]`.") from e
+
+from . import conversions
+from .kenat import Kenat
+from .exceptions import InvalidInputTypeError
+from ._vectorized import (
+    UNIX_EPOCH_ORDINAL,
+    MIN_GREGORIAN_ORDINAL,
+    MIN_TABLE_DAY_NUMBER,
+    check_ethiopian,
+    check_gregorian_range,
+    day_numbers_to_ordinals,
+    ordinals_to_day_numbers,
+)
+
+EXTENSION_NAME = 'kenat.ethiopian_date'
+
+class EthiopianDateType(pa.ExtensionType):
+    """Arrow extension type for Ethiopian dates, stored as int32 day numbers."""
+    def __init__(self):
+        super().__init__(pa.int32(), EXTENSION_NAME)
+
+    def __arrow_ext_serialize__(self):
+        return b''
+
+    @classmethod
+    def __arrow_ext_deserialize__(cls, storage_type, serialized):
+        return cls()
+
+    def __arrow_ext_class__(self):
+        return EthiopianDateArray
+
+    def __arrow_ext_scalar_class__(self):
+        return EthiopianDateScalar
+
+    def to_pandas_dtype(self):
+        from .pandas import EthiopianDateDtype # Requires pandas, which is only needed here
+        return EthiopianDateDtype()
+
+class EthiopianDateScalar(pa.ExtensionScalar):
+    """A single Ethiopian date; `as_py()` returns a `Kenat` instance or None."""
+    def as_py(self, **kwargs):
+        if self.value is None:
+            return None
+        return Kenat._from_day_number(self.value.as_py())
+
+class EthiopianDateArray(pa.ExtensionArray):
+    """Arrow array of Ethiopian dates."""
+    def to_date32(self):
+        """Returns the Gregorian dates as a date32 array."""
+        return to_date32(self)
+
+    def to_ymd(self):
+        """Returns the (year, month, day) arrays of the dates."""
+        return to_ymd(self)
+
+ethiopian_date = EthiopianDateType()
+
+try:
+    pa.register_extension_type(ethiopian_date)
+except pa.ArrowKeyError: # Already registered, e.g. after importlib.reload
+    pass
+
+# --- Buffer helpers ---
+
+def _chunkwise(values, func):
+    """Applies `func` to each chunk of a ChunkedArray, or to a plain Array."""
+    if isinstance(values, pa.ChunkedArray):
+        chunks = [func(chunk) for chunk in values.chunks]
+        if not chunks: # The result type is still needed for an empty ChunkedArray
+            chunks = [func(pa.array([], type=values.type))]
+        return pa.chunked_array(chunks)
+    return func(values)
+
+def _integers_and_mask(storage, fill):
+    """Returns (int64 numpy values, null mask) of an integer Array; nulls hold `fill`."""
+    mask = storage.is_null().to_numpy(zero_copy_only=False)
+    if storage.null_count:
+        storage = pc.fill_null(storage, pa.scalar(fill, storage.type))
+    return storage.to_numpy(zero_copy_only=False).astype(np.int64), mask
+
+def _int64_array(values):
+    if not isinstance(values, pa.Array):
+        values = pa.array(values)
+    return values.cast(pa.int64())
+
+def _int32_storage(values, mask):
+    return pa.array(values.astype(np.int32), type=pa.int32(), mask=mask if mask.any() else None)
+
+def _ethiopian_storage(values):
+    """Returns the int32 day-number storage of an Ethiopian date array."""
+    if isinstance(values.type, EthiopianDateType):
+        return values.storage
+    raise InvalidInputTypeError('kenat.arrow', 'values', EXTENSION_NAME, values)
+
+def _ethiopian_day_numbers(values):
+    """Returns (int64 day numbers, null mask) of an Ethiopian date or date-like array."""
+    if isinstance(values.type, EthiopianDateType):
+        return _integers_and_mask(values.storage, MIN_TABLE_DAY_NUMBER)
+    return _integers_and_mask(_from_date32(values).storage, MIN_TABLE_DAY_NUMBER)
+
+# --- Conversions ---
+
+def _from_date32(values):
+    if not pa.types.is_date32(values.type):
+        values = values.cast(pa.date32())
+    days, mask = _integers_and_mask(values.view(pa.int32()), MIN_GREGORIAN_ORDINAL - UNIX_EPOCH_ORDINAL)
+    ordinals = days + UNIX_EPOCH_ORDINAL
+    check_gregorian_range(ordinals, mask)
+    return pa.ExtensionArray.from_storage(ethiopian_date, _int32_storage(ordinals_to_day_numbers(ordinals), mask))
+
+def from_date32(values):
+    """
+    Converts Gregorian dates to Ethiopian dates.
+
+    Args:
+        values (pyarrow.Array or ChunkedArray): date32 values, or any type
+            Arrow can cast to date32 (date64, timestamp).
+
+    Returns:
+        An Ethiopian date array of the same length and nulls.
+
+    Raises:
+        InvalidGregorianDateError: For the first date outside the range supported by `to_ec`.
+    """
+    return _chunkwise(values, _from_date32)
+
+def _to_date32(values):
+    day_numbers, mask = _integers_and_mask(_ethiopian_storage(values), MIN_TABLE_DAY_NUMBER)
+    days = day_numbers_to_ordinals(day_numbers) - UNIX_EPOCH_ORDINAL
+    return _int32_storage(days, mask).view(pa.date32())
+
+def to_date32(values):
+    """Converts Ethiopian dates to Gregorian date32 values, matching `to_gc`."""
+    return _chunkwise(values, _to_date32)
+
+def _ymd_struct(values):
+    day_numbers, mask = _ethiopian_day_numbers(values)
+    years, months, days = conversions.day_number_to_ethiopian(day_numbers)
+    mask = mask if mask.any() else None
+    return pa.StructArray.from_arrays([
+        pa.array(years.astype(np.int32), mask=mask),
+        pa.array(months.astype(np.int8), mask=mask),
+        pa.array(days.astype(np.int8), mask=mask),
+    ], names=['year', 'month', 'day'])
+
+def to_ymd(values):
+    """
+    Returns the Ethiopian year, month and day of Ethiopian or Gregorian dates.
+
+    Args:
+        values (pyarrow.Array or ChunkedArray): Ethiopian dates, or date32
+            (or castable) Gregorian dates.
+
+    Returns:
+        tuple: (year int32, month int8, day int8) arrays, null where the input is null.
+    """
+    struct = _chunkwise(values, _ymd_struct)
+    if isinstance(struct, pa.ChunkedArray):
+        return tuple(pa.chunked_array([chunk.field(name) for chunk in struct.chunks],
+                                      type=struct.type.field(name).type)
+                     for name in ('year', 'month', 'day'))
+    return struct.field('year'), struct.field('month'), struct.field('day')
+
+def from_ymd(years, months, days):
+    """
+    Builds Ethiopian dates from year, month and day arrays. A date is null
+    if any of its components is null.
+
+    Raises:
+        InvalidEthiopianDateError: For the first date that does not exist.
+    """
+    if isinstance(years, pa.ChunkedArray):
+        years, months, days = (column.combine_chunks() for column in (years, months, days))
+    years, year_mask = _integers_and_mask(_int64_array(years), 1)
+    months, month_mask = _integers_and_mask(_int64_array(months), 1)
+    days, day_mask = _integers_and_mask(_int64_array(days), 1)
+    mask = year_mask | month_mask | day_mask
+    check_ethiopian(years, months, days, mask)
+    storage = _int32_storage(conversions.ethiopian_to_day_number(years, months, days), mask)
+    return pa.ExtensionArray.from_storage(ethiopian_date, storage)
+
+def with_ethiopian_columns(table, column, prefix=None):
+    """
+    Appends Ethiopian date columns computed from a Gregorian date column, e.g.
+    to partition a dataset by Ethiopian year.
+
+    Args:
+        table (pyarrow.Table): The source table.
+        column (str): The name of a date32 (or castable) column.
+        prefix (str, optional): Prefix of the new columns. Defaults to `f"{column}_ec"`.
+
+    Returns:
+        pyarrow.Table: `table` with the columns `prefix` (Ethiopian dates),
+        `prefix_year`, `prefix_month` and `prefix_day` appended.
+    """
+    prefix = prefix or f"{column}_ec"
+    ethiopian = from_date32(table.column(column))
+    years, months, days = to_ymd(ethiopian)
+    for name, values in ((prefix, ethiopian), (f"{prefix}_year", years),
+                         (f"{prefix}_month", months), (f"{prefix}_day", days)):
+        table = table.append_column(name, values)
+    return table
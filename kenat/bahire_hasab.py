@@ -1,7 +1,10 @@
 from .utils import validate_numeric_inputs, get_weekday
-from .day_arithmetic import add_days
-from .conversions import to_gc
+from .day_arithmetic import _add_days
+from .conversions import _to_gc
 from .exceptions import UnknownHolidayError
+from .instrumentation import instrumented
+from .cache import memoize
+from .holiday_record import Holiday, HolidayDate
 from .constants import (
     DAYS_OF_WEEK,
     EVANGELIST_NAMES,
@@ -12,17 +15,19 @@ from .constants import (
     MOVABLE_HOLIDAYS
 )
 
+@memoize('bahire_hasab', maxsize=512)
 def _calculate_bahire_hasab_base(ethiopian_year):
     """
     Calculates and returns all base values for the Bahire Hasab system. 
     This internal helper is the single source of truth for the core computational logic. 
+    The result is cached, so callers must copy the nested date dicts before handing them out.
     """
     amete_alem = 5500 + ethiopian_year  
     metene_rabiet = amete_alem // 4  
     medeb = amete_alem % 19  
     wenber = 18 if medeb == 0 else medeb - 1  
     abektie = (wenber * 11) % 30  
-    metqi = (wenber * 19) % 30  
+    metqi = (wenber * 19) % 30 or 30  
 
     beale_metqi_month = 1 if metqi > 14 else 2  
     beale_metqi_day = metqi  
@@ -53,6 +58,7 @@ def _calculate_bahire_hasab_base(ethiopian_year):
         'nineveh_date': nineveh_date,  
     }
 
+@instrumented('get_bahire_hasab')
 def get_bahire_hasab(ethiopian_year, lang='amharic'):
     """
     Calculates all Bahire Hasab values for a given Ethiopian year. 
@@ -76,25 +82,7 @@ def get_bahire_hasab(ethiopian_year, lang='amharic'):
     weekday_index = (tinte_qemer + 1) % 7  
     new_year_weekday = DAYS_OF_WEEK.get(lang, DAYS_OF_WEEK['english'])[weekday_index]  
 
-    movable_feasts = {}  
-    tewsak_to_key_map = {v: k for k, v in KEY_TO_TEWSAK_MAP.items()}  
-    
-    for tewsak_key, tewsak_value in MOVABLE_HOLIDAY_TEWSAK.items():  
-        holiday_key = tewsak_to_key_map.get(tewsak_key)  
-        if holiday_key:  
-            date = add_days(base['nineveh_date'], tewsak_value)  
-            info = HOLIDAY_INFO.get(holiday_key, {})  
-            rules = MOVABLE_HOLIDAYS.get(holiday_key, {})  
-            
-            movable_feasts[holiday_key] = {  
-                'key': holiday_key,  
-                'tags': rules.get('tags', []),  
-                'movable': True,  
-                'name': info.get('name', {}).get(lang) or info.get('name', {}).get('english'),  
-                'description': info.get('description', {}).get(lang) or info.get('description', {}).get('english'),  
-                'ethiopian': date,  
-                'gregorian': to_gc(date['year'], date['month'], date['day'])  
-            }
+    movable_feasts = {feast.key: feast for feast in _movable_feasts(ethiopian_year, lang)}
 
     return {  
         'ameteAlem': base['amete_alem'],
@@ -105,12 +93,38 @@ def get_bahire_hasab(ethiopian_year, lang='amharic'):
         'wenber': base['wenber'],
         'abektie': base['abektie'],
         'metqi': base['metqi'],
-        'bealeMetqi': {'date': base['beale_metqi_date'], 'weekday': base['beale_metqi_weekday']},
+        'bealeMetqi': {'date': dict(base['beale_metqi_date']), 'weekday': base['beale_metqi_weekday']},
         'mebajaHamer': base['mebaja_hamer'],
-        'nineveh': base['nineveh_date'],
+        'nineveh': dict(base['nineveh_date']),
         'movableFeasts': movable_feasts
     }
 
+@memoize('movable_feasts', maxsize=512)
+def _movable_feasts(ethiopian_year, lang):
+    """
+    Returns the `Holiday` records of the movable feasts of a year, with
+    'gregorian' as a `datetime.date`. Records are immutable and shared.
+    """
+    base = _calculate_bahire_hasab_base(ethiopian_year)
+    tewsak_to_key_map = {v: k for k, v in KEY_TO_TEWSAK_MAP.items()}
+    feasts = []
+    for tewsak_key, tewsak_value in MOVABLE_HOLIDAY_TEWSAK.items():
+        holiday_key = tewsak_to_key_map.get(tewsak_key)
+        if holiday_key:
+            date = _add_days(base['nineveh_date'], tewsak_value)
+            info = HOLIDAY_INFO.get(holiday_key, {})
+            rules = MOVABLE_HOLIDAYS.get(holiday_key, {})
+            feasts.append(Holiday(
+                holiday_key,
+                tuple(rules.get('tags', ())),
+                True,
+                info.get('name', {}).get(lang) or info.get('name', {}).get('english'),
+                info.get('description', {}).get(lang) or info.get('description', {}).get('english'),
+                HolidayDate(date['year'], date['month'], date['day']),
+                _to_gc(date['year'], date['month'], date['day']),
+            ))
+    return tuple(feasts)
+
 def get_movable_holiday(holiday_key, ethiopian_year):
     """
     Calculates the date of a movable holiday for a given year. 
@@ -123,11 +137,14 @@ def get_movable_holiday(holiday_key, ethiopian_year):
         dict: An Ethiopian date object {'year', 'month', 'day'}. 
     """
     validate_numeric_inputs('get_movable_holiday', ethiopian_year=ethiopian_year)  
+    return _get_movable_holiday(holiday_key, ethiopian_year)
 
+def _get_movable_holiday(holiday_key, ethiopian_year):
+    """Unvalidated core of `get_movable_holiday`, for internal callers."""
     tewsak = MOVABLE_HOLIDAY_TEWSAK.get(holiday_key)  
     if tewsak is None:  
         raise UnknownHolidayError(holiday_key)  
     
     base = _calculate_bahire_hasab_base(ethiopian_year)  
 
-    return add_days(base['nineveh_date'], tewsak) 
+    return _add_days(base['nineveh_date'], tewsak) 
@@ -0,0 +1,255 @@
+"""
+Memoization layer shared by all kenat caches, and the API to manage them.
+
+Every cache is registered under a name ('to_ec', 'holiday_index', ...) and
+can be inspected with `cache_info()`, emptied with `cache_clear()` and
+bounded with `set_cache_maxsize()`. Cached values are always immutable
+(tuples, dates, strings, `Holiday` records); public functions build fresh
+dicts and lists from them, so callers can never corrupt a cache by
+mutating a result.
+"""
+import contextlib
+import contextvars
+import functools
+import threading
+from collections import deque
+
+from .instrumentation import record_cache_access
+
+_MISSING = object()
+
+# Modules that define caches. They are imported on demand by the management
+# functions, because `import kenat` loads most of them lazily.
+_CACHING_MODULES = ('conversions', 'utils', 'geez_converter', 'bahire_hasab', 'holidays', 'kenat')
+
+_registry = {}
+_enabled = True
+_enabled_override = contextvars.ContextVar('kenat_caching_enabled', default=None)
+
+
+class LRUCache:
+    """
+    A bounded mapping with approximate least-recently-used eviction.
+
+    Reads take no lock: a hit is one dict lookup plus one dict store, both
+    atomic under the GIL and internally synchronized on free-threaded builds.
+    Inserts and evictions are serialized by a per-cache lock, and the first
+    value stored for a key wins, so threads racing on a cold key all end up
+    sharing the same object. Eviction uses the CLOCK (second-chance) policy:
+    an entry read since the last sweep is moved to the back once instead of
+    being dropped. Hit and miss counters are statistics only and may
+    undercount slightly under heavy contention.
+    """
+
+    def __init__(self, name, maxsize):
+        self.name = name
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = {}
+        self._order = deque() # Keys in eviction order, only touched under the lock
+        self._referenced = {}
+        self._lock = threading.Lock()
+
+    def lookup(self, key):
+        """Returns the cached value for `key`, or `_MISSING`."""
+        value = self._data.get(key, _MISSING)
+        if value is _MISSING:
+            self.misses += 1
+        else:
+            self._referenced[key] = True
+            if key not in self._data: # Evicted meanwhile; don't leave a stale flag
+                self._referenced.pop(key, None)
+            self.hits += 1
+        return value
+
+    def store(self, key, value):
+        """
+        Stores `value` under `key` unless another thread got there first,
+        and returns the value that is now cached.
+        """
+        with self._lock:
+            size = len(self._data)
+            value = self._data.setdefault(key, value)
+            if len(self._data) > size:
+                self._order.append(key)
+                self._referenced.pop(key, None) # A new entry has not been used yet
+            self._evict()
+            return value
+
+    def resize(self, maxsize):
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._order.clear()
+            self._referenced.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+                'evictions': self.evictions,
+            }
+
+    def _evict(self):
+        """Drops entries until the cache fits. Must be called with the lock held."""
+        if self.maxsize is None:
+            return
+        data, order = self._data, self._order
+        while len(data) > self.maxsize:
+            key = order.popleft()
+            if self._referenced.pop(key, False):
+                order.append(key) # Second chance: move to the back
+            else:
+                del data[key]
+                self.evictions += 1
+
+
+def _caching_enabled():
+    override = _enabled_override.get()
+    return _enabled if override is None else override
+
+
+def memoize(name, maxsize=1024):
+    """
+    Decorator that caches a function's results by its positional arguments.
+
+    Exceptions are not cached, and calls with unhashable arguments bypass the
+    cache. Hits and misses are reported to `kenat.instrumentation` under `name`.
+
+    Args:
+        name (str): The registry name of the cache.
+        maxsize (int or None): The maximum number of entries; None is unbounded.
+    """
+    cache = _registry.setdefault(name, LRUCache(name, maxsize))
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args):
+            if not _caching_enabled():
+                return func(*args)
+            try:
+                value = cache.lookup(args)
+            except TypeError: # Unhashable argument
+                return func(*args)
+            if value is not _MISSING:
+                record_cache_access(name, True)
+                return value
+            record_cache_access(name, False)
+            return cache.store(args, func(*args))
+        wrapper.cache = cache
+        return wrapper
+    return decorator
+
+
+def _load_caching_modules():
+    from importlib import import_module
+    for module in _CACHING_MODULES:
+        import_module(f'.{module}', __package__)
+
+
+def _get_cache(name):
+    _load_caching_modules()
+    cache = _registry.get(name)
+    if cache is None:
+        raise ValueError(f"Unknown cache: {name!r}. Known caches: {sorted(_registry)}.")
+    return cache
+
+
+def cache_info():
+    """
+    Returns statistics for every kenat cache.
+
+    Returns:
+        dict: Maps each cache name to {'hits', 'misses', 'size', 'maxsize', 'evictions'}.
+    """
+    _load_caching_modules()
+    return {name: _registry[name].info() for name in sorted(_registry)}
+
+
+def cache_clear(name=None):
+    """
+    Empties one cache, or all of them, and resets their statistics.
+
+    Args:
+        name (str, optional): The cache to clear. Clears every cache if omitted.
+    """
+    if name is not None:
+        _get_cache(name).clear()
+        return
+    _load_caching_modules()
+    for cache in _registry.values():
+        cache.clear()
+
+
+def set_cache_maxsize(name, maxsize):
+    """
+    Sets the maximum number of entries of a cache, evicting entries if it shrinks.
+
+    Args:
+        name (str): The cache name, as listed by `cache_info()`.
+        maxsize (int or None): The new bound; None makes the cache unbounded.
+    """
+    if maxsize is not None and (not isinstance(maxsize, int) or maxsize < 0):
+        raise ValueError(f"Invalid maxsize: {maxsize!r}. Must be a non-negative integer or None.")
+    _get_cache(name).resize(maxsize)
+
+
+def set_caching_enabled(enabled):
+    """Enables or disables all kenat caches library-wide."""
+    global _enabled
+    _enabled = bool(enabled)
+
+
+@contextlib.contextmanager
+def caching(enabled=True):
+    """
+    Context manager that enables or disables caching for the enclosed block.
+    The override is local to the current thread (or asyncio task).
+
+    Example:
+        with kenat.caching(enabled=False):
+            fresh = get_holidays_for_year(2016)
+    """
+    token = _enabled_override.set(bool(enabled))
+    try:
+        yield
+    finally:
+        _enabled_override.reset(token)
+
+
+def warmup(years, conversions=False):
+    """
+    Pre-populates the caches for the given Ethiopian years, e.g. before
+    worker processes fork.
+
+    The holiday index, Bahire Hasab values, weekdays and month calendars
+    are always computed. With `conversions=True`, the Ethiopian ↔ Gregorian
+    conversion of every day is cached too. Caches stop growing at their
+    maxsize, so raise it with `set_cache_maxsize` for long ranges.
+
+    Args:
+        years (iterable of int): The Ethiopian years to warm up.
+        conversions (bool): Whether to cache every day's conversion.
+    """
+    from . import holidays, kenat as kenat_module, utils
+    from .conversions import to_ec, _to_gc
+
+    for year in years:
+        holidays._holiday_index(year)
+        for month in range(1, 14):
+            kenat_module._month_gregorian_days(year, month)
+            for day in range(1, utils.get_ethiopian_days_in_month(year, month) + 1):
+                utils._weekday(year, month, day)
+                if conversions:
+                    greg = _to_gc(year, month, day)
+                    to_ec(greg.year, greg.month, greg.day)
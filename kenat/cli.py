@@ -0,0 +1,339 @@
+"""
+Command-line interface: `python -m kenat <command>`.
+
+The `convert` command streams CSV or JSON Lines and converts date columns
+between Gregorian ISO dates and Ethiopian dates:
+
+    python -m kenat convert --columns order_date,ship_date < orders.csv > orders_ec.csv
+    python -m kenat convert --to gc --columns date events.jsonl --errors bad.jsonl
+
+Rows are read and written in batches, so memory use does not depend on the
+input size. With `--workers`, batches are converted on a process pool (see
+`kenat.parallel`). Rows with a value that cannot be converted are written
+to the `--errors` side file, or stop the run when no side file is given.
+"""
+import argparse
+import csv
+import datetime
+import io
+import json
+import re
+import sys
+
+from . import conversions, formatting, parallel
+from .constants import MONTH_NAMES, DAYS_OF_WEEK
+from .geez_converter import to_arabic
+from .exceptions import KenatError, InvalidDateFormatError
+
+INPUT_FORMATS = ('csv', 'jsonl')
+
+_NUMERIC_DATE = re.compile(r'(\d{1,4})[/-](\d{1,2})[/-](\d{1,2})')
+_GEEZ_NUMERIC_DATE = re.compile(r'([\u1369-\u137c]+)[/-]([\u1369-\u137c]+)[/-]([\u1369-\u137c]+)')
+
+# Month and weekday names of every language, for parsing localized dates.
+_MONTH_NUMBERS = {
+    name.lower(): index + 1
+    for lang, names in MONTH_NAMES.items() if lang != 'gregorian'
+    for index, name in enumerate(names)
+}
+_WEEKDAY_NAMES = {name.lower() for names in DAYS_OF_WEEK.values() for name in names}
+
+
+def _parse_number(token):
+    # isdigit() is also true for the Ge'ez digits ፩-፱, which int() rejects
+    return int(token) if token.isdecimal() else to_arabic(token)
+
+def parse_ethiopian(value):
+    """
+    Parses an Ethiopian date written as 'yyyy/mm/dd' or 'yyyy-mm-dd', or with
+    a month name ("መስከረም 10 2016", "ማክሰኞ, መስከረም ፲ ፳፻፲፮"), in Arabic or
+    Ge'ez numerals.
+
+    Returns:
+        tuple: (year, month, day)
+
+    Raises:
+        InvalidDateFormatError: If the value is not in a recognized format.
+    """
+    match = _NUMERIC_DATE.fullmatch(value.strip())
+    if match:
+        return tuple(int(part) for part in match.groups())
+    match = _GEEZ_NUMERIC_DATE.fullmatch(value.strip())
+    if match:
+        try:
+            return tuple(to_arabic(part) for part in match.groups())
+        except KenatError:
+            raise InvalidDateFormatError(value)
+
+    tokens = value.replace(',', ' ').split()
+    if len(tokens) == 4 and tokens[0].lower() in _WEEKDAY_NAMES:
+        tokens = tokens[1:]
+    if len(tokens) == 3 and tokens[0].lower() in _MONTH_NUMBERS:
+        try:
+            return _parse_number(tokens[2]), _MONTH_NUMBERS[tokens[0].lower()], _parse_number(tokens[1])
+        except KenatError:
+            pass
+    raise InvalidDateFormatError(value)
+
+def parse_gregorian(value):
+    """
+    Parses an ISO 'YYYY-MM-DD' date; a trailing ISO time ('T08:30:00', ' 08:30') is ignored.
+
+    Returns:
+        tuple: (year, month, day)
+    """
+    value = value.strip()
+    if len(value) > 10 and value[10] in 'T ':
+        value = value[:10]
+    date = datetime.date.fromisoformat(value)
+    return date.year, date.month, date.day
+
+# Converted values by (direction, date format, lang), kept across batches in
+# each process since exports repeat the same dates many times.
+_converted = {}
+_MAX_CONVERTED = 1 << 17
+
+def _value_converter(options):
+    """
+    Returns `(memo, convert)`: a dict of already converted values, and a
+    function converting (and memoizing) one date string as described by `options`.
+    """
+    direction, date_format, lang = options[:3]
+    memo = _converted.setdefault((direction, date_format, lang), {})
+    if len(memo) > _MAX_CONVERTED:
+        memo.clear()
+
+    def convert(value):
+        if direction == 'to_ec':
+            eth = conversions.to_ec(*parse_gregorian(value))
+            result = formatting.format_date(eth, date_format, lang)
+        else:
+            result = conversions.to_gc(*parse_ethiopian(value)).isoformat()
+        memo[value] = result
+        return result
+    return memo, convert
+
+# The batch workers parse, convert and serialize their rows themselves, so
+# the parent process only splits the input and writes text back out.
+
+def _convert_csv_batch(options, records):
+    """
+    Worker: converts a batch of raw CSV records.
+
+    Returns:
+        tuple: (CSV text of the converted rows, list of (index in the batch,
+        row, error message) for the rows that failed). With `stop_on_error`,
+        the batch ends at the first failure.
+    """
+    memo, convert = _value_converter(options)
+    columns, stop_on_error = options[3:]
+    width = max(target for _, target, _ in columns) + 1
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    failed = []
+    for index, row in enumerate(csv.reader(records)):
+        out = row + [''] * (width - len(row))
+        error = None
+        for source, target, name in columns:
+            value = out[source]
+            if value: # Empty cells are passed through
+                try:
+                    out[target] = memo.get(value) or convert(value)
+                except (KenatError, ValueError) as e:
+                    error = f"{name}: {e}"
+                    break
+        if error is None:
+            writer.writerow(out)
+            continue
+        failed.append((index, row, error))
+        if stop_on_error:
+            break
+    return buffer.getvalue(), failed
+
+def _convert_json_record(line, columns, memo, convert):
+    """Returns the converted JSON text of one line, or raises ValueError."""
+    record = json.loads(line)
+    if not isinstance(record, dict):
+        raise ValueError('expected a JSON object')
+    for source, target, name in columns:
+        value = record.get(source)
+        if value is None or value == '': # Missing and empty values are passed through
+            record[target] = value
+        elif not isinstance(value, str):
+            raise ValueError(f"{name}: expected a date string, got {value!r}")
+        else:
+            try:
+                record[target] = memo.get(value) or convert(value)
+            except (KenatError, ValueError) as e:
+                raise ValueError(f"{name}: {e}") from None
+    return json.dumps(record, ensure_ascii=False)
+
+def _convert_jsonl_batch(options, lines):
+    """Worker: converts a batch of JSON Lines. Returns the same pair as `_convert_csv_batch`."""
+    memo, convert = _value_converter(options)
+    columns, stop_on_error = options[3:]
+    converted = []
+    failed = []
+    for index, line in enumerate(lines):
+        try:
+            converted.append(_convert_json_record(line, columns, memo, convert))
+        except ValueError as e:
+            failed.append((index, line, str(e)))
+            if stop_on_error:
+                break
+    return ''.join(f"{line}\n" for line in converted), failed
+
+def _csv_records(infile):
+    """Yields the raw text of each non-blank CSV record; quoted fields may span lines."""
+    parts = []
+    quotes = 0
+    for line in infile:
+        quotes += line.count('"')
+        if quotes % 2: # Inside a quoted field
+            parts.append(line)
+            continue
+        if parts:
+            parts.append(line)
+            line = ''.join(parts)
+            parts = []
+        quotes = 0
+        if line.strip():
+            yield line
+    if parts:
+        yield ''.join(parts)
+
+
+def _open_input(path):
+    if path == '-':
+        return sys.stdin
+    return open(path, encoding='utf-8', newline='')
+
+def _open_output(path):
+    if path == '-':
+        return sys.stdout
+    return open(path, 'w', encoding='utf-8', newline='')
+
+def _infer_input_format(path):
+    return 'jsonl' if path.endswith(('.jsonl', '.ndjson')) else 'csv'
+
+def _target_name(column, suffix):
+    return column + suffix if suffix else column
+
+def _convert_csv(args, infile, outfile, errfile, direction):
+    records = _csv_records(infile)
+    first = next(records, None)
+    if first is None:
+        return 0
+    header = next(csv.reader([first]))
+    missing = [name for name in args.columns if name not in header]
+    if missing:
+        raise SystemExit(f"kenat convert: column(s) not found in the CSV header: {', '.join(missing)}")
+    out_header = list(header)
+    columns = []
+    for name in args.columns:
+        target = _target_name(name, args.suffix)
+        if target not in out_header:
+            out_header.append(target)
+        columns.append((header.index(name), out_header.index(target), name))
+    csv.writer(outfile, lineterminator='\n').writerow(out_header)
+    error_writer = None
+    if errfile is not None:
+        error_writer = csv.writer(errfile, lineterminator='\n')
+        error_writer.writerow(['row', *header, 'error'])
+
+    options = (direction, args.date_format, args.lang, columns, error_writer is None)
+    chunks = parallel._chunks(records, args.batch_size, str)
+    errors = 0
+    for start, (text, failed) in parallel._run_chunks(_convert_csv_batch, options, chunks, args.workers, True):
+        outfile.write(text)
+        for index, row, error in failed:
+            if error_writer is None:
+                raise SystemExit(f"kenat convert: row {start + index + 1}: {error}")
+            error_writer.writerow([start + index + 1, *row, error])
+        errors += len(failed)
+    return errors
+
+def _convert_jsonl(args, infile, outfile, errfile, direction):
+    columns = [(name, _target_name(name, args.suffix), name) for name in args.columns]
+    options = (direction, args.date_format, args.lang, columns, errfile is None)
+    lines = (line for line in infile if line.strip())
+    chunks = parallel._chunks(lines, args.batch_size, str.rstrip)
+    errors = 0
+    for start, (text, failed) in parallel._run_chunks(_convert_jsonl_batch, options, chunks, args.workers, True):
+        outfile.write(text)
+        for index, line, error in failed:
+            if errfile is None:
+                raise SystemExit(f"kenat convert: record {start + index + 1}: {error}")
+            errfile.write(json.dumps({'record': start + index + 1, 'error': error, 'input': line},
+                                     ensure_ascii=False) + '\n')
+        errors += len(failed)
+    return errors
+
+def _positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value}")
+    return number
+
+def _column_list(value):
+    return [name.strip() for name in value.split(',') if name.strip()]
+
+def build_parser():
+    """Returns the argument parser of the `kenat` command."""
+    parser = argparse.ArgumentParser(prog='python -m kenat', description='Ethiopian calendar tools.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    convert = commands.add_parser(
+        'convert', help='Convert date columns of a CSV or JSON Lines stream.',
+        description='Convert date columns between Gregorian ISO dates and Ethiopian dates. '
+                    'Empty values are passed through unchanged.')
+    convert.add_argument('input', nargs='?', default='-', help="Input file (default: stdin).")
+    convert.add_argument('-c', '--columns', type=_column_list, required=True,
+                         help='Comma-separated names of the date columns (or JSON keys).')
+    convert.add_argument('--to', choices=('ec', 'gc'), default='ec',
+                         help="'ec': Gregorian ISO to Ethiopian (default); 'gc': Ethiopian to Gregorian ISO.")
+    convert.add_argument('-f', '--date-format', choices=formatting.DATE_STYLES, default='short',
+                         help="Ethiopian output format: 'short' yyyy/mm/dd (default), 'iso' yyyy-mm-dd, "
+                              "'standard' month name, 'weekday' weekday and month name, "
+                              "'geez' Amharic month name with Ge'ez numerals.")
+    convert.add_argument('--lang', choices=[lang for lang in MONTH_NAMES if lang != 'gregorian'],
+                         default='amharic', help="Month name language of the 'standard' format.")
+    convert.add_argument('--input-format', choices=INPUT_FORMATS,
+                         help='Input format (default: jsonl for .jsonl/.ndjson files, else csv).')
+    convert.add_argument('-o', '--output', default='-', help='Output file (default: stdout).')
+    convert.add_argument('--suffix',
+                         help="Write converted values to new '<column><suffix>' columns instead of in place.")
+    convert.add_argument('--errors', metavar='FILE',
+                         help='Write rows that fail to convert to FILE and keep going. '
+                              'Without it, the first bad row stops the run.')
+    convert.add_argument('--batch-size', type=_positive_int, default=10000,
+                         help='Rows converted per batch (default: 10000).')
+    convert.add_argument('--workers', type=_positive_int, default=1,
+                         help='Worker processes converting batches in parallel (default: 1).')
+    return parser
+
+def convert_command(args):
+    """Runs `convert` with parsed arguments. Returns the process exit status."""
+    input_format = args.input_format or _infer_input_format(args.input)
+    direction = 'to_ec' if args.to == 'ec' else 'to_gc'
+    convert = _convert_jsonl if input_format == 'jsonl' else _convert_csv
+
+    infile = _open_input(args.input)
+    outfile = _open_output(args.output)
+    errfile = _open_output(args.errors) if args.errors else None
+    try:
+        errors = convert(args, infile, outfile, errfile, direction)
+    finally:
+        for stream in (infile, outfile, errfile):
+            if stream is not None and stream not in (sys.stdin, sys.stdout):
+                stream.close()
+        if outfile is sys.stdout:
+            outfile.flush()
+    if errors:
+        print(f"kenat convert: {errors} row(s) could not be converted; see {args.errors}", file=sys.stderr)
+    return 0
+
+def main(argv=None):
+    """Entry point of `python -m kenat` and the `kenat` script."""
+    args = build_parser().parse_args(argv)
+    return convert_command(args)
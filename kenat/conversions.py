@@ -1,14 +1,24 @@
 import datetime
 import math
+from array import array
 from .utils import (
     is_gregorian_leap_year,
     is_ethiopian_leap_year,
     get_ethiopian_days_in_month,
     validate_numeric_inputs
 )
-from .exceptions import InvalidEthiopianDateError, InvalidGregorianDateError, KenatError
+from .exceptions import InvalidEthiopianDateError, InvalidGregorianDateError, InvalidInputTypeError, KenatError
+from .instrumentation import instrumented
+from .cache import memoize
 
+# Supported Gregorian range for `to_ec`, matching the original library.
+_MIN_GREGORIAN_DATE = datetime.date(1900, 1, 1)
+_MAX_GREGORIAN_DATE = datetime.date(2100, 12, 31)
+_MIN_GREGORIAN_ORDINAL = _MIN_GREGORIAN_DATE.toordinal()
+_MAX_GREGORIAN_ORDINAL = _MAX_GREGORIAN_DATE.toordinal()
+_UNIX_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
 
+@instrumented('to_gc')
 def to_gc(eth_year, eth_month, eth_day):
     """
     Converts an Ethiopian date to its corresponding Gregorian date.
@@ -26,46 +36,186 @@ def to_gc(eth_year, eth_month, eth_day):
     if not 1 <= eth_month <= 13 or not 1 <= eth_day <= get_ethiopian_days_in_month(eth_year, eth_month):
         raise InvalidEthiopianDateError(eth_year, eth_month, eth_day)
 
-    # 2. Determine the Gregorian date of the Ethiopian New Year 
+    return _to_gc(eth_year, eth_month, eth_day)
+
+@memoize('to_gc', maxsize=8192)
+def _to_gc(eth_year, eth_month, eth_day):
+    """
+    Unvalidated core of `to_gc`, used by internal callers whose inputs
+    have already been checked.
+    """
+    # 1. Determine the Gregorian date of the Ethiopian New Year 
     gregorian_year = eth_year + 7
     new_year_day = 12 if is_gregorian_leap_year(gregorian_year + 1) else 11
     new_year_date = datetime.date(gregorian_year, 9, new_year_day)
 
-    # 3. Calculate days elapsed since the Ethiopian new year and add to the new year date 
+    # 2. Calculate days elapsed since the Ethiopian new year and add to the new year date 
     days_to_add = (eth_month - 1) * 30 + (eth_day - 1)
     
     return new_year_date + datetime.timedelta(days=days_to_add)
 
+@instrumented('to_ec')
 def to_ec(greg_year, greg_month, greg_day):
     """
     Converts a Gregorian date to the Ethiopian calendar (EC) date.
     """
     # 1. Validate input types
     validate_numeric_inputs('to_ec', g_year=greg_year, g_month=greg_month, g_day=greg_day)
-    
+    eth_year, eth_month, eth_day = _to_ec(greg_year, greg_month, greg_day)
+    return {'year': eth_year, 'month': eth_month, 'day': eth_day}
+
+@memoize('to_ec', maxsize=8192)
+def _to_ec(greg_year, greg_month, greg_day):
+    """
+    Cached core of `to_ec`. Returns the Ethiopian date as a (year, month, day)
+    tuple so the cached value cannot be mutated by callers.
+    """
     # 2. Validate date validity and range (1900-2100) to match original library
     try:
         greg_date = datetime.date(greg_year, greg_month, greg_day)
-        if not (datetime.date(1900, 1, 1) <= greg_date <= datetime.date(2100, 12, 31)):
+        if not (_MIN_GREGORIAN_DATE <= greg_date <= _MAX_GREGORIAN_DATE):
              raise InvalidGregorianDateError(greg_year, greg_month, greg_day)
     except (ValueError, InvalidGregorianDateError): # Catch both invalid dates and out-of-range
         raise InvalidGregorianDateError(greg_year, greg_month, greg_day)
 
     # 3. Determine the corresponding Ethiopian year
     eth_year = greg_year - 8
-    greg_of_eth_new_year = to_gc(eth_year + 1, 1, 1)
+    greg_of_eth_new_year = _to_gc(eth_year + 1, 1, 1)
     if greg_date >= greg_of_eth_new_year:
         eth_year += 1
+        new_year_greg_date = greg_of_eth_new_year
+    else:
+        new_year_greg_date = _to_gc(eth_year, 1, 1)
 
     # 4. Calculate the difference in days from that Ethiopian New Year
-    new_year_greg_date = to_gc(eth_year, 1, 1)
     days_diff = (greg_date - new_year_greg_date).days
     
     # 5. Convert the day difference into Ethiopian month and day
     eth_month = (days_diff // 30) + 1
     eth_day = (days_diff % 30) + 1
     
-    return {'year': eth_year, 'month': eth_month, 'day': eth_day}
+    return (eth_year, eth_month, eth_day)
+
+# --- Day Numbers ---
+# An Ethiopian day number counts days from Meskerem 1 of year 1, which is
+# day number 1. Day numbers give every date a single integer, which makes
+# them the storage format of the vectorized integrations (pandas, Arrow,
+# SQL). The helpers below perform no validation and use only integer
+# arithmetic and comparisons, so they accept Python ints as well as numpy
+# integer arrays.
+
+def ethiopian_to_day_number(year, month, day):
+    """Returns the day number of an Ethiopian date."""
+    return 365 * (year - 1) + year // 4 + 30 * (month - 1) + day
+
+def day_number_to_ethiopian(day_number):
+    """Returns the Ethiopian (year, month, day) of a day number."""
+    year = (4 * day_number + 1459) // 1461
+    day_of_year = day_number - (365 * (year - 1) + year // 4) - 1
+    return year, day_of_year // 30 + 1, day_of_year % 30 + 1
+
+def _is_gregorian_leap(year):
+    """Array-friendly version of `utils.is_gregorian_leap_year`."""
+    return ((year % 4 == 0) & (year % 100 != 0)) | (year % 400 == 0)
+
+def _gregorian_year_of_ordinal(ordinal):
+    """Returns the Gregorian year of a proleptic Gregorian ordinal (date.toordinal())."""
+    n = ordinal - 1
+    n400, n = n // 146097, n % 146097
+    n100, n = n // 36524, n % 36524
+    n4, n = n // 1461, n % 1461
+    n1 = n // 365
+    year = 400 * n400 + 100 * n100 + 4 * n4 + n1 + 1
+    return year - ((n1 == 4) | (n100 == 4)) # The last day of a leap year
+
+def _new_year_ordinal(eth_year):
+    """Returns the Gregorian ordinal of Meskerem 1, exactly as `to_gc` computes it."""
+    greg_year = eth_year + 7
+    before = greg_year - 1
+    days_before_year = 365 * before + before // 4 - before // 100 + before // 400
+    # September 11 is day 254 of a common year; the new year moves to the
+    # 12th when the following Gregorian year is a leap year.
+    return days_before_year + 254 + _is_gregorian_leap(greg_year) + _is_gregorian_leap(greg_year + 1)
+
+def day_number_to_gregorian_ordinal(day_number):
+    """Returns the Gregorian ordinal (date.toordinal()) of a day number, matching `to_gc`."""
+    year = (4 * day_number + 1459) // 1461
+    return _new_year_ordinal(year) + day_number - (365 * (year - 1) + year // 4) - 1
+
+def gregorian_ordinal_to_day_number(ordinal):
+    """Returns the day number of a Gregorian ordinal (date.toordinal()), matching `to_ec`."""
+    eth_year = _gregorian_year_of_ordinal(ordinal) - 8
+    eth_year = eth_year + (ordinal >= _new_year_ordinal(eth_year + 1))
+    return 365 * (eth_year - 1) + eth_year // 4 + 1 + ordinal - _new_year_ordinal(eth_year)
+
+# --- Unix Timestamps ---
+
+@instrumented('from_timestamps')
+def from_timestamps(timestamps, utc_offset=3 * 3600):
+    """
+    Converts Unix timestamps to Ethiopian dates and times, as
+    `Kenat(datetime.fromtimestamp(...))` would at the given UTC offset: the
+    date is that of the local Gregorian day, and the time is split into
+    periods at 6 AM and 6 PM like `Time.from_gregorian`.
+
+    Uses numpy when it is installed; otherwise any iterable of numbers
+    (`array.array`, `memoryview`, list) is converted in pure Python.
+
+    Args:
+        timestamps (array-like): Seconds since 1970-01-01 00:00 UTC (int or float).
+        utc_offset (int): Seconds east of UTC of the local time (default UTC+3, East Africa Time).
+
+    Returns:
+        tuple: (years, months, days, hours, minutes, periods). With numpy, int32
+        arrays and a str array of 'day'/'night'; without it, `array('i')`s
+        and a list of 'day'/'night'.
+
+    Raises:
+        InvalidInputTypeError: If a timestamp is not a finite number.
+        InvalidGregorianDateError: If a local date is outside the range supported by `to_ec`.
+    """
+    validate_numeric_inputs('from_timestamps', utc_offset=utc_offset)
+    try:
+        from ._vectorized import timestamps_to_ethiopian
+    except ImportError: # numpy is not installed
+        return _from_timestamps_python(timestamps, utc_offset)
+    return timestamps_to_ethiopian(timestamps, utc_offset)
+
+def _timestamp_range_error(timestamp, utc_offset):
+    """Returns the error for a timestamp whose local date is outside the range of `to_ec`."""
+    ordinal = int((timestamp // 1 + utc_offset) // 86400) + _UNIX_EPOCH_ORDINAL
+    greg = datetime.date.fromordinal(min(max(ordinal, 1), datetime.date.max.toordinal()))
+    return InvalidGregorianDateError(greg.year, greg.month, greg.day)
+
+def _from_timestamps_python(timestamps, utc_offset):
+    """Pure-Python `from_timestamps`, memoized per day since log timestamps cluster."""
+    from .time import Time
+    times = [Time._from_minute_of_day(minute) for minute in range(1440)]
+    hours_of_day = [time.hour for time in times]
+    periods_of_day = [time.period for time in times]
+    years, months, days, hours, minutes = (array('i') for _ in range(5))
+    periods = []
+    dates = {}
+    for timestamp in timestamps:
+        if not isinstance(timestamp, (int, float)):
+            raise InvalidInputTypeError('from_timestamps', 'timestamps', 'numbers', timestamp)
+        if not math.isfinite(timestamp):
+            raise InvalidInputTypeError('from_timestamps', 'timestamps', 'finite numbers', timestamp)
+        day, second = divmod(int(timestamp // 1) + utc_offset, 86400)
+        date = dates.get(day)
+        if date is None:
+            ordinal = day + _UNIX_EPOCH_ORDINAL
+            if not _MIN_GREGORIAN_ORDINAL <= ordinal <= _MAX_GREGORIAN_ORDINAL:
+                raise _timestamp_range_error(timestamp, utc_offset)
+            date = dates[day] = day_number_to_ethiopian(gregorian_ordinal_to_day_number(ordinal))
+        minute_of_day = second // 60
+        years.append(date[0])
+        months.append(date[1])
+        days.append(date[2])
+        hours.append(hours_of_day[minute_of_day])
+        minutes.append(minute_of_day % 60)
+        periods.append(periods_of_day[minute_of_day])
+    return years, months, days, hours, minutes, periods
 
 def _gregorian_to_jd(year, month, day):
     """Converts a Gregorian date to Julian Day Number."""
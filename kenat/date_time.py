@@ -0,0 +1,227 @@
+"""
+Ethiopian date and time as a single integer.
+
+An `EthiopianDateTime` is stored as the number of minutes since the start of
+Ethiopian day number 1 (see `conversions.ethiopian_to_day_number`). Ethiopian
+days start at 6 AM Gregorian (12:00 day), so the hours after Gregorian
+midnight (6:00-11:59 night) belong to the previous Ethiopian date:
+
+    from kenat import EthiopianDateTime, Time
+
+    start = EthiopianDateTime(2016, 1, 1, Time(11, 0, 'night'))
+    start.to_datetime()                 # datetime(2023, 9, 13, 5, 0)
+    start.add(hours=2)                  # 2016/01/02 01:00 day
+
+Because the key is one integer, arithmetic, differences, comparisons and
+hashing are O(1) and agree with real-time order, which makes `to_minutes()`
+a cheap sort and window key.
+"""
+import datetime
+
+from . import conversions, formatting, utils
+from .kenat import Kenat
+from .time import Time
+from .exceptions import InvalidEthiopianDateError, InvalidInputTypeError
+
+_MINUTES_PER_DAY = 1440
+
+# Gregorian minute of day at which an Ethiopian day starts (12:00 day).
+_DAY_START = 6 * 60
+
+# Ethiopian time of a date-time built without one.
+_DEFAULT_TIME = Time(12, 0, 'day')
+
+# Default UTC offset of Unix timestamps: East Africa Time (UTC+3).
+_EAT_OFFSET = 3 * 3600
+
+def _gregorian_minutes(ordinal, minute_of_day):
+    """Returns the key of a Gregorian ordinal (date.toordinal()) and minute since midnight."""
+    day_number = conversions.gregorian_ordinal_to_day_number(ordinal)
+    return (day_number - 1) * _MINUTES_PER_DAY + minute_of_day - _DAY_START
+
+# Key of the Unix epoch, 1970-01-01 00:00 local time.
+_UNIX_EPOCH_MINUTES = _gregorian_minutes(datetime.date(1970, 1, 1).toordinal(), 0)
+
+def _restore_date_time(minutes):
+    """Unpickles an EthiopianDateTime from its key (see `EthiopianDateTime.__reduce__`)."""
+    return EthiopianDateTime._from_minutes(minutes)
+
+class EthiopianDateTime:
+    """
+    An immutable Ethiopian date and time, backed by one integer: the minutes
+    since 12:00 day on Meskerem 1 of year 1.
+    """
+    __slots__ = ('_minutes',)
+
+    def __init__(self, year, month, day, time=None):
+        """
+        Constructs an EthiopianDateTime from an Ethiopian date and a `Time`
+        of that Ethiopian day (default 12:00 day, i.e. 6 AM Gregorian).
+        """
+        utils.validate_numeric_inputs('EthiopianDateTime', year=year, month=month, day=day)
+        if not utils.is_valid_ethiopian_date(year, month, day):
+            raise InvalidEthiopianDateError(year, month, day)
+        if time is None:
+            time = _DEFAULT_TIME
+        elif not isinstance(time, Time):
+            raise InvalidInputTypeError('EthiopianDateTime', 'time', 'Time', time)
+        day_number = conversions.ethiopian_to_day_number(year, month, day)
+        minute = (time.minute_of_day - _DAY_START) % _MINUTES_PER_DAY
+        self._minutes = (day_number - 1) * _MINUTES_PER_DAY + minute
+
+    @classmethod
+    def from_minutes(cls, minutes):
+        """
+        Creates an EthiopianDateTime from its key, as returned by `to_minutes`.
+        Every integer is a valid key.
+        """
+        utils.validate_numeric_inputs('EthiopianDateTime.from_minutes', minutes=minutes)
+        return cls._from_minutes(int(minutes))
+
+    @classmethod
+    def _from_minutes(cls, minutes):
+        """Unvalidated core of `from_minutes`, for bulk callers that pass ints."""
+        date_time = cls.__new__(cls)
+        date_time._minutes = minutes
+        return date_time
+
+    def to_minutes(self):
+        """Returns the key: minutes since 12:00 day on Meskerem 1 of year 1."""
+        return self._minutes
+
+    @classmethod
+    def from_timestamp(cls, timestamp, utc_offset=_EAT_OFFSET):
+        """
+        Creates an EthiopianDateTime from a Unix timestamp, truncated to the minute.
+
+        Args:
+            timestamp (int or float): Seconds since 1970-01-01 00:00 UTC.
+            utc_offset (int): Seconds east of UTC of the local time (default UTC+3).
+        """
+        utils.validate_numeric_inputs('EthiopianDateTime.from_timestamp', timestamp=timestamp, utc_offset=utc_offset)
+        return cls._from_minutes(_UNIX_EPOCH_MINUTES + int((timestamp + utc_offset) // 60))
+
+    def to_timestamp(self, utc_offset=_EAT_OFFSET):
+        """Returns the Unix timestamp (seconds) of the date-time, read as local time at `utc_offset`."""
+        utils.validate_numeric_inputs('EthiopianDateTime.to_timestamp', utc_offset=utc_offset)
+        return (self._minutes - _UNIX_EPOCH_MINUTES) * 60 - utc_offset
+
+    @classmethod
+    def from_datetime(cls, value):
+        """
+        Creates an EthiopianDateTime from a `datetime.datetime`, truncated to
+        the minute. The wall-clock time is used; `tzinfo` is ignored.
+        """
+        if not isinstance(value, datetime.datetime):
+            raise InvalidInputTypeError('EthiopianDateTime.from_datetime', 'value', 'datetime.datetime', value)
+        return cls._from_minutes(_gregorian_minutes(value.toordinal(), value.hour * 60 + value.minute))
+
+    def to_datetime(self):
+        """Returns the Gregorian date and time as a naive `datetime.datetime`."""
+        day_number, minute = divmod(self._minutes + _DAY_START, _MINUTES_PER_DAY)
+        date = datetime.datetime.fromordinal(conversions.day_number_to_gregorian_ordinal(day_number + 1))
+        return date + datetime.timedelta(minutes=minute)
+
+    @classmethod
+    def from_kenat(cls, date):
+        """
+        Creates an EthiopianDateTime from a `Kenat` and its time. A `Kenat`'s
+        date follows the Gregorian day, so its times after midnight (6:00-11:59
+        night) fall on the previous Ethiopian date here.
+        """
+        if not isinstance(date, Kenat):
+            raise InvalidInputTypeError('EthiopianDateTime.from_kenat', 'date', 'Kenat', date)
+        day_number = date.to_day_number()
+        return cls._from_minutes((day_number - 1) * _MINUTES_PER_DAY + date.time.minute_of_day - _DAY_START)
+
+    def to_kenat(self):
+        """Returns the `Kenat` of the same instant (the inverse of `from_kenat`)."""
+        day_number, minute = divmod(self._minutes + _DAY_START, _MINUTES_PER_DAY)
+        year, month, day = conversions.day_number_to_ethiopian(day_number + 1)
+        return Kenat({'year': year, 'month': month, 'day': day}, time_obj=Time._from_minute_of_day(minute))
+
+    # --- Properties ---
+    def to_day_number(self):
+        """Returns the day number of the Ethiopian date (see `conversions.ethiopian_to_day_number`)."""
+        return self._minutes // _MINUTES_PER_DAY + 1
+
+    def get_ethiopian(self):
+        """Returns the Ethiopian date as a dictionary."""
+        year, month, day = conversions.day_number_to_ethiopian(self.to_day_number())
+        return {'year': year, 'month': month, 'day': day}
+
+    @property
+    def year(self):
+        return conversions.day_number_to_ethiopian(self.to_day_number())[0]
+
+    @property
+    def month(self):
+        return conversions.day_number_to_ethiopian(self.to_day_number())[1]
+
+    @property
+    def day(self):
+        return conversions.day_number_to_ethiopian(self.to_day_number())[2]
+
+    @property
+    def time(self):
+        return Time._from_minute_of_day((self._minutes + _DAY_START) % _MINUTES_PER_DAY)
+
+    # --- Arithmetic Methods ---
+    def add(self, days=0, hours=0, minutes=0):
+        """Returns a new EthiopianDateTime with the added duration."""
+        utils.validate_numeric_inputs('EthiopianDateTime.add', days=days, hours=hours, minutes=minutes)
+        return self._from_minutes(self._minutes + int(days * _MINUTES_PER_DAY + hours * 60 + minutes))
+
+    def diff_in_minutes(self, other):
+        """Returns the number of minutes from `other` to this date-time."""
+        if not isinstance(other, EthiopianDateTime):
+            raise InvalidInputTypeError('EthiopianDateTime.diff_in_minutes', 'other', 'EthiopianDateTime', other)
+        return self._minutes - other._minutes
+
+    # --- Formatting Methods ---
+    def format(self, lang='amharic'):
+        """
+        Formats the date and time, e.g. "መስከረም 1 2016 11:00 ማታ".
+        """
+        return formatting.format_with_time(self.get_ethiopian(), self.time, lang)
+
+    # --- Python Special Methods ---
+    def __str__(self):
+        return f"{formatting.format_short(self.get_ethiopian())} {self.time.format(lang='english', use_geez=False, zero_as_dash=False)}"
+
+    def __repr__(self):
+        date, time = self.get_ethiopian(), self.time
+        return (f"EthiopianDateTime(year={date['year']}, month={date['month']}, day={date['day']}, "
+                f"time={time!r})")
+
+    def __reduce__(self):
+        # Pickle as the key alone
+        return (_restore_date_time, (self._minutes,))
+
+    def __hash__(self):
+        return hash(self._minutes)
+
+    def __eq__(self, other):
+        if not isinstance(other, EthiopianDateTime):
+            return NotImplemented
+        return self._minutes == other._minutes
+
+    def __lt__(self, other):
+        if not isinstance(other, EthiopianDateTime):
+            return NotImplemented
+        return self._minutes < other._minutes
+
+    def __le__(self, other):
+        if not isinstance(other, EthiopianDateTime):
+            return NotImplemented
+        return self._minutes <= other._minutes
+
+    def __gt__(self, other):
+        if not isinstance(other, EthiopianDateTime):
+            return NotImplemented
+        return self._minutes > other._minutes
+
+    def __ge__(self, other):
+        if not isinstance(other, EthiopianDateTime):
+            return NotImplemented
+        return self._minutes >= other._minutes
@@ -18,7 +18,10 @@ def add_days(ethiopian, days):
     """
     validate_ethiopian_date_object(ethiopian, 'add_days', 'ethiopian') # 
     validate_numeric_inputs('add_days', days=days) # 
-    
+    return _add_days(ethiopian, days)
+
+def _add_days(ethiopian, days):
+    """Unvalidated core of `add_days`, for internal callers."""
     # Create mutable copies
     year, month, day = ethiopian['year'], ethiopian['month'], ethiopian['day']
     day += days
@@ -46,7 +49,10 @@ def add_months(ethiopian, months):
     """
     validate_ethiopian_date_object(ethiopian, 'add_months', 'ethiopian') # 
     validate_numeric_inputs('add_months', months=months) # 
-    
+    return _add_months(ethiopian, months)
+
+def _add_months(ethiopian, months):
+    """Unvalidated core of `add_months`, for internal callers."""
     year, month, day = ethiopian['year'], ethiopian['month'], ethiopian['day']
     
     total_months = month + months # 
@@ -74,7 +80,10 @@ def add_years(ethiopian, years):
     """
     validate_ethiopian_date_object(ethiopian, 'add_years', 'ethiopian') # 
     validate_numeric_inputs('add_years', years=years) # 
+    return _add_years(ethiopian, years)
 
+def _add_years(ethiopian, years):
+    """Unvalidated core of `add_years`, for internal callers."""
     year, month, day = ethiopian['year'], ethiopian['month'], ethiopian['day']
     year += years # 
 
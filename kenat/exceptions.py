@@ -1,9 +1,22 @@
+def _restore_error(cls, args, state):
+    """Rebuilds a pickled KenatError without calling its __init__."""
+    error = cls.__new__(cls)
+    error.args = args
+    error.__dict__.update(state)
+    return error
+
 class KenatError(Exception):
     """Base class for all custom errors in the Kenat library."""
     def __init__(self, message):
         super().__init__(message)
         self.name = self.__class__.__name__
 
+    def __reduce__(self):
+        # Subclass constructors take different arguments than `self.args`, so
+        # errors are restored from their state. This lets them cross process
+        # boundaries, e.g. out of `kenat.parallel` workers.
+        return (_restore_error, (self.__class__, self.args, self.__dict__))
+
 class InvalidEthiopianDateError(KenatError):
     """Thrown when an Ethiopian date is numerically invalid (e.g., month 14)."""
     def __init__(self, year, month, day):
@@ -1,6 +1,7 @@
 from .geez_converter import to_geez
 from .constants import MONTH_NAMES, DAYS_OF_WEEK
 from .utils import get_weekday
+from .exceptions import InvalidInputTypeError
 
 def format_standard(et_date, lang='amharic'):
     """
@@ -65,3 +66,26 @@ def to_iso_date_string(et_date, time_obj=None):
     hr = str(time_obj.hour).zfill(2) 
     minute = str(time_obj.minute).zfill(2) 
     return f"{y}-{m}-{d}T{hr}:{minute}" 
+
+DATE_STYLES = ('short', 'iso', 'standard', 'weekday', 'geez')
+
+def format_date(et_date, style='standard', lang='amharic'):
+    """
+    Formats an Ethiopian date in one of the named `DATE_STYLES`:
+    'short' ("2017/10/25"), 'iso' ("2017-10-25"), 'standard' ("ሰኔ 25 2017"),
+    'weekday' ("ረቡዕ, ሰኔ 25 2017") or 'geez' ("ሰኔ ፳፭ ፳፻፲፯").
+
+    Raises:
+        InvalidInputTypeError: If `style` is not one of `DATE_STYLES`.
+    """
+    if style == 'short':
+        return format_short(et_date)
+    if style == 'iso':
+        return to_iso_date_string(et_date)
+    if style == 'standard':
+        return format_standard(et_date, lang)
+    if style == 'weekday':
+        return format_with_weekday(et_date, lang)
+    if style == 'geez':
+        return format_in_geez_amharic(et_date)
+    raise InvalidInputTypeError('format_date', 'style', f"one of {', '.join(DATE_STYLES)}", style)
@@ -1,4 +1,5 @@
 from .exceptions import GeezConverterError
+from .cache import memoize
 
 # A dictionary holding the Ethiopic numeral symbols
 SYMBOLS = {
@@ -8,6 +9,12 @@ SYMBOLS = {
     'ten_thousand': '፼'
 }
 
+# Reverse lookup table used by to_arabic, built once at import.
+_GEEZ_VALUES = {char: i for i, char in enumerate(SYMBOLS['ones']) if char}
+_GEEZ_VALUES.update({char: i * 10 for i, char in enumerate(SYMBOLS['tens']) if char})
+_GEEZ_VALUES[SYMBOLS['hundred']] = 100
+_GEEZ_VALUES[SYMBOLS['ten_thousand']] = 10000
+
 def to_geez(input_num):
     """
     Converts a natural number to an Ethiopic numeral string.
@@ -23,7 +30,11 @@ def to_geez(input_num):
     """
     if not isinstance(input_num, (int, str)):
         raise GeezConverterError("Input must be a number or a string.")
+    return _to_geez(input_num)
 
+@memoize('to_geez', maxsize=4096)
+def _to_geez(input_num):
+    """Cached core of `to_geez`."""
     try:
         num = int(input_num)
         if num < 0:
@@ -81,17 +92,16 @@ def to_arabic(geez_str):
         raise GeezConverterError('Input must be a non-empty string.')
     if not geez_str.strip():
         return 0
+    return _to_arabic(geez_str)
 
-    reverse_map = {char: i for i, char in enumerate(SYMBOLS['ones']) if char}
-    reverse_map.update({char: i * 10 for i, char in enumerate(SYMBOLS['tens']) if char})
-    reverse_map[SYMBOLS['hundred']] = 100
-    reverse_map[SYMBOLS['ten_thousand']] = 10000
-    
+@memoize('to_arabic', maxsize=4096)
+def _to_arabic(geez_str):
+    """Cached core of `to_arabic`."""
     total = 0
     current_number = 0
 
     for char in geez_str:
-        value = reverse_map.get(char)
+        value = _GEEZ_VALUES.get(char)
         if value is None:
             raise GeezConverterError(f"Unknown Ge'ez numeral: {char}")
 
@@ -0,0 +1,105 @@
+"""
+Immutable holiday records.
+
+Holiday queries return `Holiday` records instead of plain dicts. A record is
+built once per holiday occurrence and language and then shared by every
+call, so it cannot be changed. It is still a dict with the keys earlier
+versions returned, so it compares equal to them and serializes as JSON:
+
+    holiday = get_holiday('meskel', 2016, lang='english')
+    holiday.name == holiday['name']       # 'Finding of the True Cross (Meskel)'
+    holiday['ethiopian']['day']           # 17
+    holiday['tags'] == ['public', 'religious', 'christian']
+    json.dumps(holiday)
+
+Use `to_dict()` for a mutable copy.
+"""
+
+def _immutable(self, *args, **kwargs):
+    raise TypeError(f"{type(self).__name__} is immutable")
+
+class _Tags(list):
+    """The read-only list of a holiday's tags; it compares equal to plain lists."""
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+    append = extend = insert = pop = remove = clear = sort = reverse = _immutable
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def __reduce__(self):
+        return (type(self), (list(self),))
+
+class _Record(dict):
+    """Base of the frozen dict records; subclasses list their fields in _fields."""
+    __slots__ = ()
+    _fields = ()
+
+    def __init__(self, *values):
+        super().__init__(zip(self._fields, values))
+
+    def __getattr__(self, field):
+        if field in self._fields:
+            return self.get(field)
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {field!r}")
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    update = pop = popitem = clear = setdefault = _immutable
+
+    def _values(self):
+        return tuple(self.get(field) for field in self._fields)
+
+    def to_dict(self):
+        """Returns a mutable copy as plain nested dicts and lists."""
+        result = {}
+        for field, value in self.items():
+            if isinstance(value, _Record):
+                value = value.to_dict()
+            elif isinstance(value, list):
+                value = list(value)
+            result[field] = value
+        return result
+
+    # --- Python Special Methods ---
+    def __hash__(self):
+        return hash(self._values())
+
+    def __reduce__(self):
+        return (type(self), self._values())
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __repr__(self):
+        fields = ', '.join(f'{field}={value!r}' for field, value in self.items())
+        return f"{type(self).__name__}({fields})"
+
+class HolidayDate(_Record):
+    """A date of a holiday, read as `date.year` or `date['year']`."""
+    __slots__ = ()
+    _fields = ('year', 'month', 'day')
+
+class Holiday(_Record):
+    """
+    A holiday occurrence with the keys of the dicts returned by earlier
+    versions: 'key', 'tags', 'movable', 'name', 'description', 'ethiopian'
+    and, when known, 'gregorian'. The `gregorian` attribute is None when
+    the key is absent.
+    """
+    __slots__ = ()
+    _fields = ('key', 'tags', 'movable', 'name', 'description', 'ethiopian', 'gregorian')
+
+    def __init__(self, key, tags, movable, name, description, ethiopian, gregorian=None):
+        super().__init__(key, _Tags(tags), movable, name, description, ethiopian)
+        if gregorian is not None:
+            dict.__setitem__(self, 'gregorian', gregorian)
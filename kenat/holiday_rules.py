@@ -0,0 +1,212 @@
+"""
+Rules for custom holidays.
+
+A rule says when a holiday falls in an Ethiopian year. Each constructor
+validates its arguments once and compiles them into a small per-year
+evaluator, which is what the cached holiday index calls:
+
+    from kenat import holiday_rules
+    from kenat.holidays import register_holiday_provider
+
+    register_holiday_provider('acme', {
+        'foundersDay': {'rule': holiday_rules.fixed(3, 15), 'tags': ['company']},
+        'newYearsDay': {'rule': holiday_rules.fixed(1, 1, calendar='gregorian')},
+        'fastEnd': {'rule': holiday_rules.tewsak(55)},
+        'ashura': {'rule': holiday_rules.hijri(1, 10)},
+        'familyDay': {'rule': holiday_rules.nth_weekday(1, 0, -1)},
+    })
+
+Weekdays are numbered like `Kenat.weekday`: 0 for Sunday to 6 for Saturday.
+"""
+import datetime
+from calendar import monthrange
+
+from . import bahire_hasab, conversions, utils
+from .exceptions import InvalidInputTypeError
+
+CALENDARS = ('ethiopian', 'gregorian')
+
+class HolidayRule:
+    """
+    A compiled holiday rule. Calling it with an Ethiopian year returns the
+    holiday's occurrences in that year as
+    ((ethiopian (y, m, d), gregorian (y, m, d) or None), ...).
+    """
+    __slots__ = ('description', 'movable', '_evaluate')
+
+    def __init__(self, evaluate, movable=True, description='custom rule'):
+        """
+        Wraps a custom evaluator.
+
+        Args:
+            evaluate (callable): Maps an Ethiopian year to its occurrences, in
+                the format returned by calling the rule.
+            movable (bool): Whether the Ethiopian date changes from year to year.
+            description (str): A short description, shown in the repr.
+        """
+        if not callable(evaluate):
+            raise InvalidInputTypeError('HolidayRule', 'evaluate', 'callable', evaluate)
+        self.description = description
+        self.movable = movable
+        self._evaluate = evaluate
+
+    def __call__(self, eth_year):
+        return self._evaluate(eth_year)
+
+    def __repr__(self):
+        return f"HolidayRule({self.description})"
+
+def _check_range(func, name, value, low, high):
+    utils.validate_numeric_inputs(func, **{name: value})
+    if not low <= value <= high:
+        raise InvalidInputTypeError(func, name, f'number between {low} and {high}', value)
+
+def _check_calendar(func, calendar):
+    if calendar not in CALENDARS:
+        raise InvalidInputTypeError(func, 'calendar', "'ethiopian' or 'gregorian'", calendar)
+
+def _weekday(day_number):
+    """Returns the weekday of a day number, 0 for Sunday."""
+    return conversions.day_number_to_gregorian_ordinal(day_number) % 7
+
+def _occurrence(day_number):
+    """Returns (ethiopian (y, m, d), gregorian (y, m, d)) of a day number."""
+    gregorian = datetime.date.fromordinal(conversions.day_number_to_gregorian_ordinal(day_number))
+    return (
+        conversions.day_number_to_ethiopian(day_number),
+        (gregorian.year, gregorian.month, gregorian.day),
+    )
+
+def _gregorian_occurrences(eth_year, find):
+    """
+    Collects the occurrences of a Gregorian rule in an Ethiopian year, which
+    spans Gregorian years eth_year + 7 and eth_year + 8. `find(g_year)`
+    returns the Gregorian ordinal of the date in that year, or None.
+    """
+    occurrences = []
+    for g_year in (eth_year + 7, eth_year + 8):
+        ordinal = find(g_year)
+        if ordinal is None:
+            continue
+        day_number = conversions.gregorian_ordinal_to_day_number(ordinal)
+        if conversions.day_number_to_ethiopian(day_number)[0] == eth_year:
+            occurrences.append(_occurrence(day_number))
+    return tuple(occurrences)
+
+def fixed(month, day, calendar='ethiopian'):
+    """
+    A holiday on the same date every year. Years without the date (Pagume 6
+    in a common year, February 29) have no occurrence.
+
+    Args:
+        month (int): The month, 1-13 (Ethiopian) or 1-12 (Gregorian).
+        day (int): The day of the month.
+        calendar (str): 'ethiopian' or 'gregorian'.
+    """
+    _check_calendar('fixed', calendar)
+    if calendar == 'ethiopian':
+        _check_range('fixed', 'month', month, 1, 13)
+        _check_range('fixed', 'day', day, 1, 6 if month == 13 else 30)
+
+        def evaluate(eth_year):
+            if month == 13 and day == 6 and eth_year % 4 != 3:
+                return ()
+            return (((eth_year, month, day), None),)
+
+        return HolidayRule(evaluate, movable=False, description=f'Ethiopian {month}/{day}')
+
+    _check_range('fixed', 'month', month, 1, 12)
+    _check_range('fixed', 'day', day, 1, monthrange(2024, month)[1])
+
+    def find(g_year):
+        if day > monthrange(g_year, month)[1]:
+            return None
+        return datetime.date(g_year, month, day).toordinal()
+
+    return HolidayRule(lambda eth_year: _gregorian_occurrences(eth_year, find),
+                       description=f'Gregorian {month}/{day}')
+
+def tewsak(offset):
+    """
+    A holiday `offset` days after the Fast of Nineveh, like the movable
+    Christian feasts (Fasika is tewsak 69). Occurrences that fall outside
+    the Ethiopian year are dropped.
+
+    Args:
+        offset (int): Days after Nineveh; may be negative.
+    """
+    utils.validate_numeric_inputs('tewsak', offset=offset)
+    if offset != int(offset):
+        raise InvalidInputTypeError('tewsak', 'offset', 'whole number of days', offset)
+    offset = int(offset)
+
+    def evaluate(eth_year):
+        nineveh = bahire_hasab._calculate_bahire_hasab_base(eth_year)['nineveh_date']
+        day_number = conversions.ethiopian_to_day_number(nineveh['year'], nineveh['month'], nineveh['day']) + offset
+        if conversions.day_number_to_ethiopian(day_number)[0] != eth_year:
+            return ()
+        return (_occurrence(day_number),)
+
+    return HolidayRule(evaluate, description=f'tewsak {offset}')
+
+def hijri(month, day):
+    """
+    A holiday on a date of the tabular Islamic calendar. It can occur twice
+    in one Ethiopian year, or not at all.
+
+    Args:
+        month (int): The Hijri month, 1-12.
+        day (int): The Hijri day, 1-30.
+    """
+    _check_range('hijri', 'month', month, 1, 12)
+    _check_range('hijri', 'day', day, 1, 30)
+    from .holidays import _tabular_islamic_occurrences # holidays imports this module
+
+    def evaluate(eth_year):
+        return _tabular_islamic_occurrences(eth_year, month, day)
+
+    return HolidayRule(evaluate, description=f'Hijri {month}/{day}')
+
+def nth_weekday(month, weekday, n, calendar='ethiopian'):
+    """
+    A holiday on the nth weekday of a month, e.g. the last Sunday of
+    Meskerem is nth_weekday(1, 0, -1).
+
+    Args:
+        month (int): The month, 1-13 (Ethiopian) or 1-12 (Gregorian).
+        weekday (int): 0 for Sunday to 6 for Saturday.
+        n (int): 1 to 5 counts from the start of the month, -1 to -5 from
+            the end. Months without an nth such weekday have no occurrence.
+        calendar (str): 'ethiopian' or 'gregorian'.
+    """
+    _check_calendar('nth_weekday', calendar)
+    _check_range('nth_weekday', 'month', month, 1, 13 if calendar == 'ethiopian' else 12)
+    _check_range('nth_weekday', 'weekday', weekday, 0, 6)
+    _check_range('nth_weekday', 'n', n, -5, 5)
+    if n == 0:
+        raise InvalidInputTypeError('nth_weekday', 'n', 'non-zero number between -5 and 5', n)
+
+    def pick(first, last, weekday_of_first, weekday_of_last):
+        """Returns the chosen day between `first` and `last` (inclusive), or None."""
+        if n > 0:
+            chosen = first + (weekday - weekday_of_first) % 7 + 7 * (n - 1)
+        else:
+            chosen = last - (weekday_of_last - weekday) % 7 - 7 * (-n - 1)
+        return chosen if first <= chosen <= last else None
+
+    description = f'weekday {weekday} #{n} of {calendar} month {month}'
+    if calendar == 'ethiopian':
+        def evaluate(eth_year):
+            first = conversions.ethiopian_to_day_number(eth_year, month, 1)
+            last = first + utils.get_ethiopian_days_in_month(eth_year, month) - 1
+            day_number = pick(first, last, _weekday(first), _weekday(last))
+            return () if day_number is None else (_occurrence(day_number),)
+
+        return HolidayRule(evaluate, description=description)
+
+    def find(g_year):
+        first = datetime.date(g_year, month, 1).toordinal()
+        last = first + monthrange(g_year, month)[1] - 1
+        return pick(first, last, first % 7, last % 7)
+
+    return HolidayRule(lambda eth_year: _gregorian_occurrences(eth_year, find), description=description)
@@ -1,171 +1,553 @@
-import json
+import csv
 import datetime
-from . import conversions, bahire_hasab
+import functools
+import json
+import os
+from array import array
+
+from . import conversions, holiday_rules
 from .constants import (
     FIXED_HOLIDAYS,
     MOVABLE_HOLIDAYS,
     HOLIDAY_INFO,
-    KEY_TO_TEWSAK_MAP
+    KEY_TO_TEWSAK_MAP,
+    MOVABLE_HOLIDAY_TEWSAK
 )
 from .utils import validate_numeric_inputs
-from .exceptions import InvalidInputTypeError
+from .exceptions import InvalidInputTypeError, UnknownHolidayError
+from .instrumentation import instrumented
+from .cache import memoize, cache_clear
+from .holiday_record import Holiday, HolidayDate
+
+# Islamic holidays and their (Hijri month, Hijri day), in reporting order.
+ISLAMIC_HOLIDAY_DATES = {
+    'moulid': (3, 12),
+    'eidFitr': (10, 1),
+    'eidAdha': (12, 10),
+}
+
+# Environment variable naming an override file, loaded with the bundled table.
+ISLAMIC_OVERRIDES_ENV = 'KENAT_ISLAMIC_HOLIDAYS'
+
+# Bundled occurrences, {eth_year: {key: ((ethiopian, gregorian), ...)}}, loaded on first use.
+_islamic_table = None
+
+# Observed dates from override files, {(key, eth_year): ((ethiopian, gregorian), ...)}.
+_islamic_overrides = {}
 
-def _find_all_islamic_occurrences(ethiopian_year, hijri_month, hijri_day):
+# Caches built from the holiday index; cleared when holiday dates or providers change.
+_HOLIDAY_CACHES = ('holiday_index', 'holiday_days', 'gregorian_holiday_index', 'holiday_records')
+
+@memoize('islamic_holidays', maxsize=1024)
+def _tabular_islamic_occurrences(ethiopian_year, hijri_month, hijri_day):
     """
-    Finds all occurrences of an Islamic date within an Ethiopian year.
-    This version is a faithful port of the original JS logic.
+    Finds all occurrences of an Islamic date within an Ethiopian year, using
+    the tabular Islamic calendar. This version is a faithful port of the
+    original JS logic; `_islamic_holidays.py` is generated from it.
+
+    Returns:
+        tuple: ((ethiopian (y, m, d), gregorian (y, m, d)), ...) in order of discovery.
     """
-    start_gc = conversions.to_gc(ethiopian_year, 1, 1)
-    end_gc = conversions.to_gc(ethiopian_year, 13, 5)
-    
-    occurrences = []
-    
+    start_gc = conversions._to_gc(ethiopian_year, 1, 1)
+    end_gc = conversions._to_gc(ethiopian_year, 13, 5)
+
+    occurrences = {}
+
     # Check both the Gregorian year of the start and end of the Ethiopian year
     for g_year in range(start_gc.year, end_gc.year + 1):
         # Get the Hijri year at the start of this Gregorian year
         hijri_year_at_start = conversions.get_hijri_year(datetime.date(g_year, 1, 1))
-        
+
         # An Islamic date can only fall in one of two Hijri years for a given Gregorian year
         for h_year in [hijri_year_at_start, hijri_year_at_start + 1]:
             # Use our new search-based conversion function
             greg_date = conversions.hijri_to_gregorian(h_year, hijri_month, hijri_day, g_year)
-            
+
             if greg_date: # If a date was found
-                ec_date = conversions.to_ec(greg_date.year, greg_date.month, greg_date.day)
-                if ec_date['year'] == ethiopian_year:
-                    occurrences.append({
-                        'gregorian': {'year': greg_date.year, 'month': greg_date.month, 'day': greg_date.day},
-                        'ethiopian': ec_date
-                    })
-                
-    # Remove duplicates
-    return list({json.dumps(item['ethiopian']): item for item in occurrences}.values())
-
-_get_all_moulid_dates = lambda year: _find_all_islamic_occurrences(year, 3, 12)
-_get_all_eid_fitr_dates = lambda year: _find_all_islamic_occurrences(year, 10, 1)
-_get_all_eid_adha_dates = lambda year: _find_all_islamic_occurrences(year, 12, 10)
+                # Day numbers match `_to_ec` but have no range check, so the
+                # Ethiopian years 1892 and 2093 at the edges of 1900-2100 work
+                day_number = conversions.gregorian_ordinal_to_day_number(greg_date.toordinal())
+                ec_date = conversions.day_number_to_ethiopian(day_number)
+                if ec_date[0] == ethiopian_year:
+                    # Keyed by the Ethiopian date to remove duplicates
+                    occurrences[ec_date] = (ec_date, (greg_date.year, greg_date.month, greg_date.day))
+
+    return tuple(occurrences.values())
+
+def _load_islamic_table():
+    """Loads the bundled table and the override file named by `ISLAMIC_OVERRIDES_ENV`."""
+    global _islamic_table
+    from ._islamic_holidays import ISLAMIC_HOLIDAYS
+    table = {}
+    for eth_year, dates in ISLAMIC_HOLIDAYS.items():
+        table[eth_year] = {
+            key: tuple((conversions._to_ec(*gregorian), gregorian) for gregorian in gregorian_dates)
+            for key, gregorian_dates in dates.items()
+        }
+    path = os.environ.get(ISLAMIC_OVERRIDES_ENV)
+    # Parse the file before publishing the table: if it is invalid, the error
+    # is raised again on the next query instead of the overrides being dropped
+    overrides = _parse_overrides(path) if path else {}
+    _islamic_overrides.update(overrides)
+    _islamic_table = table
+    return table
+
+def _islamic_occurrences(key, eth_year):
+    """
+    Returns ((ethiopian (y, m, d), gregorian (y, m, d)), ...) of an Islamic
+    holiday in an Ethiopian year: the observed dates of an override file,
+    else the bundled table, else the tabular calendar for years outside it.
+    """
+    table = _islamic_table if _islamic_table is not None else _load_islamic_table()
+    override = _islamic_overrides.get((key, eth_year))
+    if override is not None:
+        return override
+    dates = table.get(eth_year)
+    if dates is None:
+        return _tabular_islamic_occurrences(eth_year, *ISLAMIC_HOLIDAY_DATES[key])
+    return dates.get(key, ())
+
+def _read_overrides(path):
+    """Yields (key, eth_year, ISO date) rows of a JSON or CSV override file."""
+    with open(path, encoding='utf-8', newline='') as f:
+        if str(path).lower().endswith('.csv'):
+            for row in csv.DictReader(f):
+                # An empty date, like an empty JSON list, means not observed that year
+                yield row.get('holiday'), row.get('year'), row.get('date') or None
+            return
+        overrides = json.load(f)
+        if not isinstance(overrides, dict):
+            raise InvalidInputTypeError('load_islamic_holiday_overrides', 'file', 'JSON object of holidays', overrides)
+        for key, years in overrides.items():
+            if not isinstance(years, dict):
+                raise InvalidInputTypeError('load_islamic_holiday_overrides', 'holiday', 'JSON object of years', years)
+            for eth_year, dates in years.items():
+                if not isinstance(dates, (str, list)):
+                    raise InvalidInputTypeError('load_islamic_holiday_overrides', 'date', 'an ISO date or a list of them', dates)
+                for date in ([dates] if isinstance(dates, str) else dates):
+                    yield key, eth_year, date
+                if not dates:
+                    yield key, eth_year, None # Not observed that year
+
+def load_islamic_holiday_overrides(path):
+    """
+    Replaces the computed dates of Islamic holidays with the dates observed
+    in Ethiopia, which are announced and can differ from the tabular
+    calendar by a day. Overrides apply to all holiday queries from then on.
+
+    The file maps a holiday key ('moulid', 'eidFitr', 'eidAdha') and an
+    Ethiopian year to the observed Gregorian date(s), which replace every
+    computed occurrence of that holiday in that year. JSON files look like
+    {"eidFitr": {"2016": "2024-04-10"}} (a list for several dates, an
+    empty list for none); CSV files have the columns holiday,year,date,
+    with an empty date for none.
+    An override file can also be named by the KENAT_ISLAMIC_HOLIDAYS
+    environment variable, which is read when the holiday table is first loaded.
+
+    Args:
+        path (str or os.PathLike): The JSON or CSV file.
+    """
+    if _islamic_table is None:
+        _load_islamic_table()
+    _islamic_overrides.update(_parse_overrides(path))
+    _clear_holiday_caches()
+
+def _parse_overrides(path):
+    """Reads and validates an override file, returning {(key, eth_year): ((ethiopian, gregorian), ...)}."""
+    overrides = {}
+    for key, eth_year, date in _read_overrides(path):
+        if key not in ISLAMIC_HOLIDAY_DATES:
+            raise UnknownHolidayError(key)
+        try:
+            eth_year = int(eth_year)
+        except (TypeError, ValueError):
+            raise InvalidInputTypeError('load_islamic_holiday_overrides', 'year', 'an Ethiopian year', eth_year)
+        occurrences = overrides.setdefault((key, eth_year), [])
+        if date is None:
+            continue
+        try:
+            gregorian = datetime.date.fromisoformat(date)
+        except (TypeError, ValueError):
+            raise InvalidInputTypeError('load_islamic_holiday_overrides', 'date', 'an ISO date (YYYY-MM-DD)', date)
+        ethiopian = conversions.to_ec(gregorian.year, gregorian.month, gregorian.day)
+        if ethiopian['year'] != eth_year:
+            raise InvalidInputTypeError('load_islamic_holiday_overrides', 'date', f'a date in Ethiopian year {eth_year}', date)
+        occurrences.append((
+            (ethiopian['year'], ethiopian['month'], ethiopian['day']),
+            (gregorian.year, gregorian.month, gregorian.day),
+        ))
+    return {item: tuple(sorted(dates)) for item, dates in overrides.items()}
+
+def clear_islamic_holiday_overrides():
+    """Discards all loaded overrides, restoring the bundled Islamic holiday dates."""
+    _islamic_overrides.clear()
+    _clear_holiday_caches()
+
+def _clear_holiday_caches():
+    for name in _HOLIDAY_CACHES:
+        cache_clear(name)
+
+# --- Holiday providers ---
+
+# Name of the built-in provider of Ethiopian public and religious holidays.
+BUILTIN_PROVIDER = 'ethiopia'
+
+# Compiled built-in holidays, {key: (rule, tags, None)}; built on first use.
+_builtin = None
+
+# Custom providers, {name: {key: (rule, tags, info)}}, in registration order.
+_providers = {}
+
+# Compiled definitions of every provider, {key: (rule, tags, info or None)},
+# in index order; rebuilt on first use after the providers change.
+_definitions = None
+
+def _builtin_definitions():
+    """
+    Compiles the holidays of `constants`: fixed holidays, then Christian
+    movable feasts, then Islamic holidays. Their names come from HOLIDAY_INFO.
+    """
+    global _builtin
+    if _builtin is not None:
+        return _builtin
+    definitions = {}
+    for key, rules in FIXED_HOLIDAYS.items():
+        rule = holiday_rules.fixed(rules['month'], rules['day'])
+        definitions[key] = (rule, tuple(rules.get('tags', ())), None)
+    for key, tewsak_key in KEY_TO_TEWSAK_MAP.items():
+        rule = holiday_rules.tewsak(MOVABLE_HOLIDAY_TEWSAK[tewsak_key])
+        definitions[key] = (rule, tuple(MOVABLE_HOLIDAYS.get(key, {}).get('tags', ())), None)
+    for key in ISLAMIC_HOLIDAY_DATES:
+        rule = holiday_rules.HolidayRule(functools.partial(_islamic_occurrences, key), description=f'Islamic holiday {key}')
+        definitions[key] = (rule, tuple(MOVABLE_HOLIDAYS.get(key, {}).get('tags', ())), None)
+    _builtin = definitions
+    return definitions
+
+def _holiday_definitions():
+    global _definitions
+    if _definitions is None:
+        definitions = dict(_builtin_definitions())
+        for provider in _providers.values():
+            definitions.update(provider)
+        _definitions = definitions
+    return _definitions
+
+def _localized(value, func, field):
+    """Returns a name or description as {lang: text}."""
+    if isinstance(value, str):
+        return {'english': value}
+    if isinstance(value, dict) and all(isinstance(text, str) for text in value.values()):
+        return dict(value)
+    raise InvalidInputTypeError(func, field, 'string or {language: string} dict', value)
+
+def register_holiday_provider(name, holidays):
+    """
+    Adds a set of custom holidays (regional, company or personal) to every
+    holiday query. Registering a provider name again replaces its holidays.
+
+    Each holiday is a dict with a 'rule' from `kenat.holiday_rules` and,
+    optionally, 'tags' (for `filter_by`), a 'name' and a 'description',
+    given as a string or as {language: string}:
+
+        register_holiday_provider('acme', {
+            'foundersDay': {
+                'rule': holiday_rules.fixed(3, 15),
+                'tags': ['company'],
+                'name': {'english': "Founders' Day", 'amharic': 'የመሥራቾች ቀን'},
+            },
+        })
+
+    Worker processes of `kenat.parallel` only see providers registered when
+    the worker imports your code, so register them at module level.
+
+    Args:
+        name (str): The provider name.
+        holidays (dict): {holiday key: definition}. Keys must not be used by another provider.
+    """
+    if not isinstance(name, str) or name == BUILTIN_PROVIDER:
+        raise InvalidInputTypeError('register_holiday_provider', 'name', f"provider name other than '{BUILTIN_PROVIDER}'", name)
+    if not isinstance(holidays, dict):
+        raise InvalidInputTypeError('register_holiday_provider', 'holidays', '{key: definition} dict', holidays)
+    taken = set(_builtin_definitions())
+    for other, provider in _providers.items():
+        if other != name:
+            taken.update(provider)
+
+    compiled = {}
+    for key, definition in holidays.items():
+        if not isinstance(key, str) or key in taken:
+            raise InvalidInputTypeError('register_holiday_provider', 'key', 'holiday key not used by another provider', key)
+        if not isinstance(definition, dict) or not isinstance(definition.get('rule'), holiday_rules.HolidayRule):
+            raise InvalidInputTypeError('register_holiday_provider', key, "{'rule': HolidayRule, ...} dict", definition)
+        tags = definition.get('tags', ())
+        if not isinstance(tags, (list, tuple)) or not all(isinstance(tag, str) for tag in tags):
+            raise InvalidInputTypeError('register_holiday_provider', 'tags', 'list of strings', tags)
+        info = {'name': _localized(definition.get('name', key), 'register_holiday_provider', 'name')}
+        if 'description' in definition:
+            info['description'] = _localized(definition['description'], 'register_holiday_provider', 'description')
+        compiled[key] = (definition['rule'], tuple(tags), info)
+
+    _providers.pop(name, None) # Re-registering moves the provider to the end
+    _providers[name] = compiled
+    _providers_changed()
+
+def unregister_holiday_provider(name):
+    """
+    Removes a custom holiday provider.
+
+    Raises:
+        InvalidInputTypeError: If no custom provider has this name.
+    """
+    if name not in _providers:
+        raise InvalidInputTypeError('unregister_holiday_provider', 'name', 'registered provider name', name)
+    del _providers[name]
+    _providers_changed()
+
+def get_holiday_providers():
+    """Returns {provider name: [holiday key, ...]}, the built-in provider first."""
+    providers = {BUILTIN_PROVIDER: list(_builtin_definitions())}
+    providers.update((name, list(provider)) for name, provider in _providers.items())
+    return providers
 
+def _providers_changed():
+    global _definitions
+    _definitions = None
+    _clear_holiday_caches()
+
+# --- Holiday index ---
+
+@memoize('holiday_index', maxsize=256)
+def _holiday_index(eth_year):
+    """
+    Computes every holiday occurrence of an Ethiopian year once, independent
+    of language and filters. All holiday queries are answered from this index.
+
+    Returns:
+        tuple: (key, movable, ethiopian (y, m, d), gregorian (y, m, d) or None), ...
+        Built-in holidays come first (fixed holidays, Christian movable feasts,
+        then every occurrence of each Islamic holiday), then those of custom
+        providers in registration order.
+    """
+    entries = []
+    for key, (rule, _, _) in _holiday_definitions().items():
+        for ethiopian, gregorian in rule(eth_year):
+            entries.append((key, rule.movable, ethiopian, gregorian))
+    return tuple(entries)
+
+def _localize(info, field, lang):
+    return info.get(field, {}).get(lang) or info.get(field, {}).get('english')
+
+@memoize('holiday_records', maxsize=4096)
+def _build_holiday(entry, lang):
+    """
+    Builds the `Holiday` record of an index entry. Records are immutable,
+    so each (entry, language) is built once and shared by all queries.
+    """
+    key, movable, ethiopian, gregorian = entry
+    rule, tags, info = _holiday_definitions()[key]
+    if info is None:
+        info = HOLIDAY_INFO[key]
+    return Holiday(
+        key, tags, movable, _localize(info, 'name', lang), _localize(info, 'description', lang),
+        HolidayDate(*ethiopian), None if gregorian is None else HolidayDate(*gregorian),
+    )
+
+def _filter_entries(entries, filter_by):
+    filter_tags = filter_by if isinstance(filter_by, list) else ([filter_by] if filter_by else None)
+    if not filter_tags:
+        return entries
+    definitions = _holiday_definitions()
+    result = []
+    for entry in entries:
+        tags = definitions[entry[0]][1]
+        if any(tag in tags for tag in filter_tags):
+            result.append(entry)
+    return result
+
+@instrumented('get_holiday')
 def get_holiday(holiday_key, eth_year, lang='amharic'):
     """Gets details for a single holiday for a given year."""
     validate_numeric_inputs('get_holiday', eth_year=eth_year)
-    info = HOLIDAY_INFO.get(holiday_key)
-    if not info:
-        return None
-        
-    name = info.get('name', {}).get(lang) or info.get('name', {}).get('english')
-    description = info.get('description', {}).get(lang) or info.get('description', {}).get('english')
-
-    if holiday_key in FIXED_HOLIDAYS:
-        rules = FIXED_HOLIDAYS[holiday_key]
-        return {
-            'key': holiday_key, 'tags': rules.get('tags', []), 'movable': False,
-            'name': name, 'description': description,
-            'ethiopian': {'year': eth_year, 'month': rules['month'], 'day': rules['day']}
-        }
-
-    tewsak_key = KEY_TO_TEWSAK_MAP.get(holiday_key)
-    if tewsak_key:
-        date = bahire_hasab.get_movable_holiday(tewsak_key, eth_year)
-        gregorian = conversions.to_gc(date['year'], date['month'], date['day'])
-        return {
-            'key': holiday_key, 'tags': MOVABLE_HOLIDAYS.get(holiday_key, {}).get('tags', []), 'movable': True,
-            'name': name, 'description': description, 'ethiopian': date, 
-            'gregorian': {'year': gregorian.year, 'month': gregorian.month, 'day': gregorian.day}
-        }
+    return _get_holiday(holiday_key, eth_year, lang)
 
-    all_dates = []
-    if holiday_key == 'eidFitr': all_dates = _get_all_eid_fitr_dates(eth_year)
-    elif holiday_key == 'eidAdha': all_dates = _get_all_eid_adha_dates(eth_year)
-    elif holiday_key == 'moulid': all_dates = _get_all_moulid_dates(eth_year)
-    
-    if all_dates:
-        data = all_dates[0]
-        return {
-            'key': holiday_key, 'tags': MOVABLE_HOLIDAYS.get(holiday_key, {}).get('tags', []), 'movable': True,
-            'name': name, 'description': description, 'ethiopian': data['ethiopian'], 'gregorian': data['gregorian']
-        }
-    
-    return None
+def _get_holiday(holiday_key, eth_year, lang):
+    """Unvalidated core of `get_holiday`, for internal callers: the first occurrence, or None."""
+    definition = _holiday_definitions().get(holiday_key)
+    if definition is None:
+        return None
+    occurrences = definition[0](eth_year)
+    if not occurrences:
+        return None
+    ethiopian, gregorian = occurrences[0]
+    return _build_holiday((holiday_key, definition[0].movable, ethiopian, gregorian), lang)
 
+@instrumented('get_holidays_in_month')
 def get_holidays_in_month(eth_year, eth_month, lang='amharic', filter_by=None):
     """Gets all holidays for a given Ethiopian month."""
     validate_numeric_inputs("get_holidays_in_month", eth_year=eth_year, eth_month=eth_month)
     if not 1 <= eth_month <= 13:
         raise InvalidInputTypeError("get_holidays_in_month", "eth_month", "number between 1 and 13", eth_month)
 
-    all_holidays_for_month = []
-    
-    for key in HOLIDAY_INFO.keys():
-        holiday = get_holiday(key, eth_year, lang)
-        if holiday and holiday['ethiopian']['month'] == eth_month:
-            all_holidays_for_month.append(holiday)
-
-    muslim_holidays_data = {
-        'moulid': _get_all_moulid_dates(eth_year),
-        'eidFitr': _get_all_eid_fitr_dates(eth_year),
-        'eidAdha': _get_all_eid_adha_dates(eth_year),
-    }
-
-    for key, dates in muslim_holidays_data.items():
-        for data in dates:
-            if data['ethiopian']['month'] == eth_month:
-                is_duplicate = any(
-                    json.dumps(h['ethiopian']) == json.dumps(data['ethiopian'])
-                    for h in all_holidays_for_month
-                )
-                if not is_duplicate:
-                    info = HOLIDAY_INFO[key]
-                    all_holidays_for_month.append({
-                        'key': key, 'tags': MOVABLE_HOLIDAYS[key]['tags'], 'movable': True,
-                        'name': info.get('name', {}).get(lang) or info.get('name', {}).get('english'),
-                        'description': info.get('description', {}).get(lang) or info.get('description', {}).get('english'),
-                        'ethiopian': data['ethiopian'], 'gregorian': data['gregorian'],
-                    })
-
-    filter_tags = filter_by if isinstance(filter_by, list) else ([filter_by] if filter_by else None)
-    final_holidays = all_holidays_for_month
-    if filter_tags:
-        final_holidays = [h for h in all_holidays_for_month if any(tag in h.get('tags', []) for tag in filter_tags)]
-    
-    final_holidays.sort(key=lambda x: x['ethiopian']['day'])
+    entries = [entry for entry in _holiday_index(eth_year) if entry[2][1] == eth_month]
+    final_holidays = [_build_holiday(entry, lang) for entry in _filter_entries(entries, filter_by)]
+    final_holidays.sort(key=lambda x: x.ethiopian.day)
     return final_holidays
 
-# --- THIS FUNCTION WAS MISSING AND IS NOW ADDED ---
+@instrumented('get_holidays_for_year')
 def get_holidays_for_year(eth_year, lang='amharic', filter_by=None):
     """Gets all holidays for a given Ethiopian year."""
     validate_numeric_inputs('get_holidays_for_year', eth_year=eth_year)
-    all_holidays_for_year = []
-
-    # Process all fixed and Christian movable holidays 
-    single_occurrence_keys = list(FIXED_HOLIDAYS.keys()) + list(KEY_TO_TEWSAK_MAP.keys())
-    for key in single_occurrence_keys:
-        holiday = get_holiday(key, eth_year, lang)
-        if holiday:
-            all_holidays_for_year.append(holiday)
-    
-    # Process all occurrences of Islamic holidays 
-    def add_muslim_holidays(key, date_array):
-        for data in date_array:
-            info = HOLIDAY_INFO[key]
-            all_holidays_for_year.append({
-                'key': key,
-                'tags': MOVABLE_HOLIDAYS[key]['tags'],
-                'movable': True,
-                'name': info.get('name', {}).get(lang) or info.get('name', {}).get('english'),
-                'description': info.get('description', {}).get(lang) or info.get('description', {}).get('english'),
-                'ethiopian': data['ethiopian'],
-                'gregorian': data['gregorian'],
-            })
-
-    add_muslim_holidays('moulid', _get_all_moulid_dates(eth_year))
-    add_muslim_holidays('eidFitr', _get_all_eid_fitr_dates(eth_year))
-    add_muslim_holidays('eidAdha', _get_all_eid_adha_dates(eth_year))
-
-    # Filter and sort the final list
-    filter_tags = filter_by if isinstance(filter_by, list) else ([filter_by] if filter_by else None)
-    final_holidays = all_holidays_for_year
-    if filter_tags:
-        final_holidays = [h for h in all_holidays_for_year if any(tag in h.get('tags', []) for tag in filter_tags)]
-        
-    final_holidays.sort(key=lambda x: (x['ethiopian']['month'], x['ethiopian']['day']))
+
+    return _holidays_from_index(_holiday_index(eth_year), lang, filter_by)
+
+def _holidays_from_index(entries, lang, filter_by):
+    """Builds the sorted public holiday list of a year from its index entries."""
+    final_holidays = [_build_holiday(entry, lang) for entry in _filter_entries(entries, filter_by)]
+    final_holidays.sort(key=lambda x: (x.ethiopian.month, x.ethiopian.day))
     return final_holidays
+
+# --- Gregorian views ---
+
+@memoize('gregorian_holiday_index', maxsize=256)
+def _gregorian_holiday_index(eth_year):
+    """
+    The entries of `_holiday_index(eth_year)` with the Gregorian date of fixed
+    holidays filled in, as ((Gregorian ordinal, entry), ...) in Gregorian order.
+    """
+    entries = []
+    for entry in _holiday_index(eth_year):
+        key, movable, ethiopian, gregorian = entry
+        if gregorian is None:
+            date = conversions._to_gc(*ethiopian)
+            entry = (key, movable, ethiopian, (date.year, date.month, date.day))
+        else:
+            date = datetime.date(*gregorian)
+        entries.append((date.toordinal(), entry))
+    entries.sort(key=lambda item: item[0])
+    return tuple(entries)
+
+def _entries_between(first, last):
+    """Returns the index entries from Gregorian date `first` to `last`, in Gregorian order."""
+    first_year = conversions._to_ec(first.year, first.month, first.day)[0]
+    last_year = conversions._to_ec(last.year, last.month, last.day)[0]
+    start, end = first.toordinal(), last.toordinal()
+    return [
+        entry
+        for eth_year in range(first_year, last_year + 1)
+        for ordinal, entry in _gregorian_holiday_index(eth_year)
+        if start <= ordinal <= end
+    ]
+
+def _whole_number(func, name, value):
+    """Returns `value` as an int, rejecting fractional floats."""
+    if isinstance(value, float) and not value.is_integer():
+        raise InvalidInputTypeError(func, name, 'whole number', value)
+    return int(value)
+
+@instrumented('get_holidays_for_gregorian_year')
+def get_holidays_for_gregorian_year(g_year, lang='amharic', filter_by=None):
+    """
+    Gets all holidays in a Gregorian year, which spans the end of one
+    Ethiopian year and the start of the next, ordered by Gregorian date.
+    Every holiday includes its 'gregorian' date.
+    """
+    validate_numeric_inputs('get_holidays_for_gregorian_year', g_year=g_year)
+    g_year = _whole_number('get_holidays_for_gregorian_year', 'g_year', g_year)
+    entries = _entries_between(datetime.date(g_year, 1, 1), datetime.date(g_year, 12, 31))
+    return [_build_holiday(entry, lang) for entry in _filter_entries(entries, filter_by)]
+
+@instrumented('get_holidays_in_gregorian_month')
+def get_holidays_in_gregorian_month(g_year, g_month, lang='amharic', filter_by=None):
+    """Gets all holidays in a Gregorian month, ordered by Gregorian date."""
+    validate_numeric_inputs('get_holidays_in_gregorian_month', g_year=g_year, g_month=g_month)
+    g_year = _whole_number('get_holidays_in_gregorian_month', 'g_year', g_year)
+    g_month = _whole_number('get_holidays_in_gregorian_month', 'g_month', g_month)
+    if not 1 <= g_month <= 12:
+        raise InvalidInputTypeError('get_holidays_in_gregorian_month', 'g_month', 'number between 1 and 12', g_month)
+    first = datetime.date(g_year, g_month, 1)
+    last = datetime.date(g_year + g_month // 12, g_month % 12 + 1, 1) - datetime.timedelta(days=1)
+    entries = _entries_between(first, last)
+    return [_build_holiday(entry, lang) for entry in _filter_entries(entries, filter_by)]
+
+# --- Vectorized lookups ---
+
+def _filter_tags(filter_by):
+    """Returns `filter_by` as a hashable tuple of tags."""
+    if isinstance(filter_by, (list, tuple)):
+        return tuple(filter_by)
+    return (filter_by,) if filter_by else ()
+
+@memoize('holiday_days', maxsize=256)
+def _holiday_days(eth_year, tags):
+    """
+    Returns the holidays of a year keyed by day number: {day number: (key, ...)},
+    with the keys of each day in index order. Built once per year and tag filter.
+    """
+    days = {}
+    for entry in _filter_entries(_holiday_index(eth_year), list(tags)):
+        day_number = conversions.ethiopian_to_day_number(*entry[2])
+        days[day_number] = days.get(day_number, ()) + (entry[0],)
+    return days
+
+def _day_numbers(dates):
+    """Returns the int32 day numbers of dates given in any form accepted by `KenatArray`."""
+    from .kenat_array import KenatArray # Imported lazily to keep this module light
+    if not isinstance(dates, KenatArray):
+        dates = KenatArray.from_gregorian(dates)
+    return dates.day_numbers
+
+def _day_number_mask(day_numbers, filter_by):
+    """Core of `holiday_mask` on a numpy array or an iterable of day numbers."""
+    tags = _filter_tags(filter_by)
+    if hasattr(day_numbers, 'dtype'): # numpy
+        import numpy as np
+        day_numbers = day_numbers.astype(np.int64)
+        years = np.unique(conversions.day_number_to_ethiopian(day_numbers)[0])
+        holiday_days = [day for year in years.tolist() for day in _holiday_days(year, tags)]
+        return np.isin(day_numbers, holiday_days)
+    holiday_days = {}
+    mask = array('B')
+    for day_number in day_numbers:
+        year = conversions.day_number_to_ethiopian(day_number)[0]
+        if year not in holiday_days:
+            holiday_days[year] = _holiday_days(year, tags)
+        mask.append(day_number in holiday_days[year])
+    return mask
+
+@instrumented('holiday_mask')
+def holiday_mask(dates, filter_by=None):
+    """
+    Flags the holidays among many dates, spanning any number of years.
+
+    Args:
+        dates: A `KenatArray`, a datetime64 array, or an iterable of `Kenat`,
+            `datetime.date` or day numbers.
+        filter_by (str or list, optional): Only count holidays with these tags.
+
+    Returns:
+        A boolean numpy array, or an `array('B')` of 0/1 without numpy.
+    """
+    return _day_number_mask(_day_numbers(dates), filter_by)
+
+@instrumented('holiday_keys')
+def holiday_keys(dates, filter_by=None):
+    """
+    Returns the keys of the holidays on each of many dates.
+
+    Args:
+        dates: As for `holiday_mask`.
+        filter_by (str or list, optional): Only include holidays with these tags.
+
+    Returns:
+        list of tuple: The holiday keys of each date (e.g. ('enkutatash',)),
+        empty for days that are not holidays.
+    """
+    tags = _filter_tags(filter_by)
+    keys = {}
+    result = []
+    for day_number in _day_numbers(dates).tolist():
+        if day_number not in keys:
+            year = conversions.day_number_to_ethiopian(day_number)[0]
+            keys[day_number] = _holiday_days(year, tags).get(day_number, ())
+        result.append(keys[day_number])
+    return result
@@ -0,0 +1,211 @@
+"""
+iCalendar (RFC 5545) export of holidays and events.
+
+Both exporters stream: they yield the .ics file one event at a time, or
+write it to a file, so a 100-year calendar is produced in constant memory:
+
+    from kenat import ical
+
+    ical.export_holidays(1993, 2092, lang='english', file='holidays.ics')
+
+    for chunk in ical.export_holidays(2016, 2017, filter_by='public'):
+        response.write(chunk)
+
+Every event is an all-day event on its Gregorian date (or a timed event for
+date-times), with the Ethiopian date at the top of its description. UIDs are
+derived from the event, so a calendar regenerated nightly keeps its UIDs
+and subscribers see updates instead of duplicates.
+"""
+import datetime
+import uuid
+
+from . import conversions, formatting, holidays
+from .date_time import EthiopianDateTime
+from .kenat import Kenat
+from .utils import validate_numeric_inputs
+from .exceptions import InvalidInputTypeError
+
+PRODID = '-//kenat//Ethiopian Calendar//EN'
+
+# The Ethiopian years that lie wholly within the supported Gregorian range (1900-2100)
+FIRST_YEAR = conversions.to_ec(1900, 1, 1)['year'] + 1
+LAST_YEAR = conversions.to_ec(2100, 12, 31)['year'] - 1
+
+# Maximum length of a content line in octets, excluding the CRLF (RFC 5545, 3.1).
+_LINE_OCTETS = 75
+
+def _escape(text):
+    """Escapes a TEXT value (RFC 5545, 3.3.11)."""
+    return (text.replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,')
+            .replace('\r\n', '\\n').replace('\n', '\\n'))
+
+def _fold(line):
+    """Terminates a content line with CRLF, folding it at 75 octets without splitting a UTF-8 character."""
+    encoded = line.encode('utf-8')
+    if len(encoded) <= _LINE_OCTETS:
+        return line + '\r\n'
+    parts = []
+    start, limit = 0, _LINE_OCTETS
+    while start < len(encoded):
+        end = min(start + limit, len(encoded))
+        while end < len(encoded) and encoded[end] & 0xC0 == 0x80: # UTF-8 continuation byte
+            end -= 1
+        parts.append(encoded[start:end].decode('utf-8'))
+        start, limit = end, _LINE_OCTETS - 1 # Continuation lines start with a space
+    return '\r\n '.join(parts) + '\r\n'
+
+def _format_date(date):
+    return f'{date.year:04d}{date.month:02d}{date.day:02d}'
+
+def _now_stamp():
+    return datetime.datetime.now(datetime.timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+def _event(uid, dtstamp, start, end, summary, description, categories=()):
+    """Returns a VEVENT; `start` and `end` are (property parameters, value) pairs."""
+    lines = ['BEGIN:VEVENT', f'UID:{uid}', f'DTSTAMP:{dtstamp}', f'DTSTART{start[0]}:{start[1]}']
+    if end is not None:
+        lines.append(f'DTEND{end[0]}:{end[1]}')
+    lines.append(f'SUMMARY:{_escape(summary)}')
+    if description:
+        lines.append(f'DESCRIPTION:{_escape(description)}')
+    if categories:
+        lines.append(f"CATEGORIES:{','.join(_escape(tag) for tag in categories)}")
+    lines.append('TRANSP:TRANSPARENT')
+    lines.append('END:VEVENT')
+    return ''.join(map(_fold, lines))
+
+def _calendar(events, calendar_name):
+    """Yields the calendar header, each VEVENT of `events`, then the footer."""
+    header = ['BEGIN:VCALENDAR', 'VERSION:2.0', f'PRODID:{PRODID}', 'CALSCALE:GREGORIAN', 'METHOD:PUBLISH']
+    if calendar_name:
+        header.append(f'X-WR-CALNAME:{_escape(calendar_name)}')
+    yield ''.join(map(_fold, header))
+    yield from events
+    yield _fold('END:VCALENDAR')
+
+def _output(chunks, file):
+    """Returns the chunks, or writes them to `file` (a path or a text file object)."""
+    if file is None:
+        return chunks
+    if hasattr(file, 'write'):
+        file.writelines(chunks)
+    else:
+        with open(file, 'w', encoding='utf-8', newline='') as f:
+            f.writelines(chunks)
+    return None
+
+# --- Holidays ---
+
+def _holiday_events(start_year, end_year, filter_by, lang, dtstamp):
+    for eth_year in range(start_year, end_year + 1):
+        # The holiday index of each year, with Gregorian dates, built once and cached
+        entries = [entry for _, entry in holidays._gregorian_holiday_index(eth_year)]
+        for entry in holidays._filter_entries(entries, filter_by):
+            holiday = holidays._build_holiday(entry, lang)
+            gregorian = datetime.date(*entry[3])
+            description = formatting.format_with_weekday(holiday.ethiopian, lang)
+            if holiday.description:
+                description += '\n\n' + holiday.description
+            yield _event(
+                f'{holiday.key}-{_format_date(gregorian)}@kenat',
+                dtstamp,
+                (';VALUE=DATE', _format_date(gregorian)),
+                (';VALUE=DATE', _format_date(gregorian + datetime.timedelta(days=1))),
+                holiday.name or holiday.key,
+                description,
+                holiday.tags,
+            )
+
+def export_holidays(start_year, end_year, filter_by=None, lang='amharic', file=None, calendar_name=None):
+    """
+    Exports the holidays of a range of Ethiopian years as an iCalendar file,
+    in order of Ethiopian year and, within a year, of Gregorian date.
+
+    Args:
+        start_year (int): The first Ethiopian year, from 1893 (FIRST_YEAR).
+        end_year (int): The last Ethiopian year (inclusive), up to 2092 (LAST_YEAR).
+        filter_by (str or list, optional): Only export holidays with these tags.
+        lang (str): The language of names and descriptions ('amharic' or 'english').
+        file (str, os.PathLike or file object, optional): Where to write the
+            calendar. Files opened by the caller should use newline=''.
+        calendar_name (str, optional): The calendar's display name (X-WR-CALNAME).
+
+    Returns:
+        A generator of str chunks that concatenate to the .ics file, or None
+        when `file` is given.
+    """
+    validate_numeric_inputs('export_holidays', start_year=start_year, end_year=end_year)
+    if not FIRST_YEAR <= start_year <= LAST_YEAR:
+        raise InvalidInputTypeError('export_holidays', 'start_year', f'year between {FIRST_YEAR} and {LAST_YEAR}', start_year)
+    if not start_year <= end_year <= LAST_YEAR:
+        raise InvalidInputTypeError('export_holidays', 'end_year', f'year between {start_year} and {LAST_YEAR}', end_year)
+    events = _holiday_events(start_year, end_year, filter_by, lang, _now_stamp())
+    return _output(_calendar(events, calendar_name), file)
+
+# --- Events ---
+
+def _event_time(value, field, lang):
+    """
+    Returns (property parameters, value, Ethiopian date details, Gregorian
+    date) of an event boundary; the Gregorian date is None for date-times.
+    """
+    if isinstance(value, EthiopianDateTime):
+        utc = datetime.datetime.fromtimestamp(value.to_timestamp(), datetime.timezone.utc)
+        return '', utc.strftime('%Y%m%dT%H%M%SZ'), value.format(lang), None
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is not None and value.utcoffset() is not None:
+            stamp = value.astimezone(datetime.timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+            ethiopian = EthiopianDateTime.from_timestamp(value.timestamp()) # Read as East Africa Time
+        else:
+            stamp = value.strftime('%Y%m%dT%H%M%S') # Floating local time
+            ethiopian = EthiopianDateTime.from_datetime(value)
+        return '', stamp, ethiopian.format(lang), None
+    if isinstance(value, Kenat):
+        gregorian, ethiopian = value.to_gregorian_date(), value.get_ethiopian()
+    elif isinstance(value, datetime.date):
+        gregorian, ethiopian = value, conversions.to_ec(value.year, value.month, value.day)
+    else:
+        raise InvalidInputTypeError('export_events', field, 'Kenat, EthiopianDateTime, datetime.date or datetime.datetime', value)
+    return ';VALUE=DATE', _format_date(gregorian), formatting.format_with_weekday(ethiopian, lang), gregorian
+
+def _custom_events(events, lang, dtstamp):
+    for event in events:
+        if not isinstance(event, dict) or 'summary' not in event or 'start' not in event:
+            raise InvalidInputTypeError('export_events', 'event', "dict with 'summary' and 'start'", event)
+        params, start, details, first_day = _event_time(event['start'], 'start', lang)
+        end = None
+        if event.get('end') is not None:
+            end_params, end_value, _, last_day = _event_time(event['end'], 'end', lang)
+            if (first_day is None) != (last_day is None):
+                raise InvalidInputTypeError('export_events', 'end', 'date-time if start is one, else a date', event['end'])
+            end = (end_params, end_value)
+        else:
+            last_day = first_day
+        if first_day is not None: # DTEND of an all-day event is the day after the last
+            end = (params, _format_date(last_day + datetime.timedelta(days=1)))
+
+        description = details + ('\n\n' + event['description'] if event.get('description') else '')
+        uid = event.get('uid') or f"{uuid.uuid5(uuid.NAMESPACE_URL, start + '|' + event['summary'])}@kenat"
+        yield _event(uid, dtstamp, (params, start), end, event['summary'], description, event.get('categories', ()))
+
+def export_events(events, lang='amharic', file=None, calendar_name=None):
+    """
+    Exports arbitrary events as an iCalendar file, streaming `events` one at a time.
+
+    Each event is a dict with a 'summary' and a 'start', and optionally an
+    'end' (the last day for all-day events), a 'description', 'categories'
+    and a 'uid' (by default derived from the start and summary). Dates
+    (`Kenat` or `datetime.date`) make all-day events; date-times make timed
+    events: `EthiopianDateTime` is read as East Africa Time, an aware
+    `datetime.datetime` is converted to UTC and a naive one is floating.
+
+    Args:
+        events (iterable of dict): The events.
+        lang (str): The language of the Ethiopian date details.
+        file (str, os.PathLike or file object, optional): As for `export_holidays`.
+        calendar_name (str, optional): The calendar's display name.
+
+    Returns:
+        A generator of str chunks, or None when `file` is given.
+    """
+    return _output(_calendar(_custom_events(events, lang, _now_stamp()), calendar_name), file)
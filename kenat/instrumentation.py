@@ -0,0 +1,221 @@
+"""
+Optional call counters and timers for kenat's hot public functions.
+
+Instrumentation is disabled by default. While disabled, an instrumented
+function costs one extra function call and a flag check. Once enabled, every
+call records its count, cumulative and maximum latency, and caches report
+their hits and misses under the same function name.
+
+Example:
+    from kenat import instrumentation
+
+    instrumentation.enable()
+    ...  # serve requests
+    print(instrumentation.to_prometheus())
+"""
+import contextlib
+import functools
+import threading
+import time
+import weakref
+
+_enabled = False
+
+# Each thread records into its own dict of counters, so recording never
+# contends on a shared lock; `snapshot()` merges them. When a thread ends,
+# its counters are folded into `_retired` so finished threads do not pile
+# up. `_lock` guards `_thread_stats` and `_retired`.
+_lock = threading.Lock()
+_local = threading.local()
+_thread_stats = {} # id(counters) -> counters of a live thread
+_retired = {}
+
+
+class _FunctionStats:
+    """Mutable counters for one instrumented function."""
+    __slots__ = ('calls', 'total_seconds', 'max_seconds', 'cache_hits', 'cache_misses')
+
+    def __init__(self):
+        self.calls = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+
+def _get_stats(name):
+    """Returns the calling thread's counters for `name`."""
+    try:
+        thread_stats = _local.stats
+    except AttributeError:
+        thread_stats = _local.stats = {}
+        with _lock:
+            _thread_stats[id(thread_stats)] = thread_stats
+        finalizer = weakref.finalize(threading.current_thread(), _retire, thread_stats)
+        finalizer.atexit = False
+    stats = thread_stats.get(name)
+    if stats is None:
+        stats = thread_stats[name] = _FunctionStats()
+    return stats
+
+
+def _retire(thread_stats):
+    """Folds the counters of a finished thread into `_retired`."""
+    with _lock:
+        if _thread_stats.pop(id(thread_stats), None) is not None:
+            _merge(_retired, thread_stats)
+
+
+def _merge(totals, thread_stats):
+    """Adds the counters of `thread_stats` to `totals`. Must be called with the lock held."""
+    for name, stats in list(thread_stats.items()):
+        total = totals.get(name)
+        if total is None:
+            total = totals[name] = _FunctionStats()
+        total.calls += stats.calls
+        total.total_seconds += stats.total_seconds
+        total.max_seconds = max(total.max_seconds, stats.max_seconds)
+        total.cache_hits += stats.cache_hits
+        total.cache_misses += stats.cache_misses
+
+
+def enable():
+    """Starts recording calls and cache accesses."""
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    """Stops recording. Collected statistics are kept until `reset()`."""
+    global _enabled
+    _enabled = False
+
+
+def is_enabled():
+    """Returns True if instrumentation is currently recording."""
+    return _enabled
+
+
+def reset():
+    """Discards all collected statistics."""
+    with _lock:
+        for thread_stats in _thread_stats.values():
+            thread_stats.clear()
+        _retired.clear()
+
+
+@contextlib.contextmanager
+def instrumenting():
+    """Context manager that enables instrumentation for the enclosed block."""
+    previous = _enabled
+    enable()
+    try:
+        yield
+    finally:
+        if not previous:
+            disable()
+
+
+def instrumented(name):
+    """
+    Decorator that records calls to the decorated function under `name`.
+
+    Args:
+        name (str): The metric name, e.g. 'to_ec' or 'MonthGrid.generate'.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                stats = _get_stats(name)
+                stats.calls += 1
+                stats.total_seconds += elapsed
+                if elapsed > stats.max_seconds:
+                    stats.max_seconds = elapsed
+        return wrapper
+    return decorator
+
+
+def record_cache_access(name, hit):
+    """
+    Records a cache hit or miss for the function `name`.
+    Called by kenat's caches; does nothing while instrumentation is disabled.
+    """
+    if not _enabled:
+        return
+    stats = _get_stats(name)
+    if hit:
+        stats.cache_hits += 1
+    else:
+        stats.cache_misses += 1
+
+
+def snapshot():
+    """
+    Returns the collected statistics as a plain dictionary.
+
+    Returns:
+        dict: Maps each function name to a dict with 'calls', 'total_seconds',
+        'max_seconds', 'mean_seconds', 'cache_hits', 'cache_misses' and
+        'cache_hit_rate' (None when the function has no cache accesses).
+    """
+    merged = {}
+    with _lock:
+        _merge(merged, _retired)
+        for thread_stats in _thread_stats.values():
+            _merge(merged, thread_stats)
+
+    result = {}
+    for name in sorted(merged):
+        stats = merged[name]
+        calls, total, maximum = stats.calls, stats.total_seconds, stats.max_seconds
+        hits, misses = stats.cache_hits, stats.cache_misses
+        lookups = hits + misses
+        result[name] = {
+            'calls': calls,
+            'total_seconds': total,
+            'max_seconds': maximum,
+            'mean_seconds': total / calls if calls else 0.0,
+            'cache_hits': hits,
+            'cache_misses': misses,
+            'cache_hit_rate': hits / lookups if lookups else None,
+        }
+    return result
+
+
+def _escape_label(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def to_prometheus(prefix='kenat'):
+    """
+    Renders the collected statistics in the Prometheus text exposition format.
+
+    Args:
+        prefix (str): Prefix for every metric name.
+
+    Returns:
+        str: The metrics, one sample per line, ending with a newline.
+    """
+    data = snapshot()
+    metrics = [
+        ('calls_total', 'counter', 'Number of calls to instrumented kenat functions.', 'calls'),
+        ('call_seconds_total', 'counter', 'Cumulative time spent in instrumented kenat functions.', 'total_seconds'),
+        ('call_seconds_max', 'gauge', 'Slowest single call to instrumented kenat functions.', 'max_seconds'),
+        ('cache_hits_total', 'counter', 'Cache hits recorded for kenat functions.', 'cache_hits'),
+        ('cache_misses_total', 'counter', 'Cache misses recorded for kenat functions.', 'cache_misses'),
+    ]
+    lines = []
+    for suffix, metric_type, help_text, field in metrics:
+        metric = f"{prefix}_{suffix}"
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} {metric_type}")
+        for name, stats in data.items():
+            lines.append(f'{metric}{{function="{_escape_label(name)}"}} {stats[field]!r}')
+    return '\n'.join(lines) + '\n'
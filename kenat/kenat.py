@@ -1,15 +1,38 @@
 import datetime
+import struct
 from .geez_converter import to_geez
 from . import (
     conversions,
-    holidays,
     day_arithmetic,
     formatting,
-    bahire_hasab,
     utils
 )
 from .time import Time
-from .exceptions import UnrecognizedInputError, InvalidDateFormatError, InvalidEthiopianDateError
+from .exceptions import UnrecognizedInputError, InvalidDateFormatError, InvalidEthiopianDateError, InvalidInputTypeError
+from .cache import memoize
+
+@memoize('month_calendar', maxsize=512)
+def _month_gregorian_days(year, month):
+    """Returns the Gregorian date of every day of an Ethiopian month, as a tuple."""
+    first = conversions.to_gc(year, month, 1) # Validates the year and month
+    return tuple(
+        first + datetime.timedelta(days=day - 1)
+        for day in range(1, utils.get_ethiopian_days_in_month(year, month) + 1)
+    )
+
+# Binary encoding of a date: its day number as a little-endian int32.
+_DATE_STRUCT = struct.Struct('<i')
+
+# Minute of day of the default time, Ethiopian 12:00 day (06:00 Gregorian).
+_DEFAULT_MINUTE_OF_DAY = 6 * 60
+
+def _restore_kenat(day_number, minute_of_day=_DEFAULT_MINUTE_OF_DAY):
+    """Unpickles a Kenat from its day number and minute of day (see `Kenat.__reduce__`)."""
+    year, month, day = conversions.day_number_to_ethiopian(day_number)
+    date = Kenat.__new__(Kenat)
+    date._ethiopian = {'year': year, 'month': month, 'day': day}
+    date._time = Time._from_minute_of_day(minute_of_day)
+    return date
 
 class Kenat:
     """
@@ -68,6 +91,49 @@ class Kenat:
         """Creates and returns a new Kenat instance for the current date and time."""
         return cls()
 
+    @classmethod
+    def from_day_number(cls, day_number):
+        """
+        Creates a Kenat instance from an Ethiopian day number, as returned by
+        `to_day_number`. Every day number is a valid date, so no validation is needed.
+        """
+        utils.validate_numeric_inputs('Kenat.from_day_number', day_number=day_number)
+        return cls._from_day_number(day_number)
+
+    @classmethod
+    def _from_day_number(cls, day_number):
+        """Unvalidated core of `from_day_number`, for bulk callers that pass ints."""
+        year, month, day = conversions.day_number_to_ethiopian(day_number)
+        date = cls.__new__(cls)
+        date._ethiopian = {'year': year, 'month': month, 'day': day}
+        date._time = Time._from_minute_of_day(_DEFAULT_MINUTE_OF_DAY)
+        return date
+
+    def to_day_number(self):
+        """Returns the Ethiopian day number of the date (see `conversions.ethiopian_to_day_number`)."""
+        return conversions.ethiopian_to_day_number(self.year, self.month, self.day)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Creates a Kenat instance from the 4 bytes written by `to_bytes`.
+
+        Args:
+            data (bytes-like): Any buffer-protocol object of exactly 4 bytes.
+        """
+        try:
+            (day_number,) = _DATE_STRUCT.unpack(data)
+        except (struct.error, TypeError):
+            raise InvalidInputTypeError('Kenat.from_bytes', 'data', '4-byte buffer', data)
+        return cls._from_day_number(day_number)
+
+    def to_bytes(self):
+        """
+        Returns the date as 4 bytes: its day number as a little-endian signed
+        32-bit integer. The time is not included.
+        """
+        return _DATE_STRUCT.pack(self.to_day_number())
+
     # --- Properties ---
     @property
     def year(self):
@@ -92,10 +158,12 @@ class Kenat:
     # --- Information Methods ---
     def get_bahire_hasab(self, lang='amharic'):
         """Calculates and returns the Bahire Hasab values for the current instance's year."""
+        from . import bahire_hasab # Imported lazily to keep `import kenat` light
         return bahire_hasab.get_bahire_hasab(self.year, lang)
 
     def is_holiday(self, lang='amharic'):
         """Checks if the current date is a holiday and returns a list of holiday objects if it is."""
+        from . import holidays # Imported lazily to keep `import kenat` light
         holidays_in_month = holidays.get_holidays_in_month(self.year, self.month, lang) 
         return [h for h in holidays_in_month if h['ethiopian']['day'] == self.day]
 
@@ -177,13 +245,15 @@ class Kenat:
     # --- Arithmetic Methods ---
     def add(self, years=0, months=0, days=0):
         """Returns a new Kenat instance with the added duration."""
+        # The instance's own date is already validated, so only the durations are checked.
+        utils.validate_numeric_inputs('Kenat.add', years=years, months=months, days=days)
         new_date = self._ethiopian
         if years:
-            new_date = day_arithmetic.add_years(new_date, years)
+            new_date = day_arithmetic._add_years(new_date, years)
         if months:
-            new_date = day_arithmetic.add_months(new_date, months)
+            new_date = day_arithmetic._add_months(new_date, months)
         if days:
-            new_date = day_arithmetic.add_days(new_date, days)
+            new_date = day_arithmetic._add_days(new_date, days)
         return Kenat(year=new_date)
 
     def diff_in_days(self, other):
@@ -216,16 +286,13 @@ class Kenat:
         # These local imports are fine.
         from .constants import MONTH_NAMES
         from .geez_converter import to_geez
-        from . import utils, conversions
 
         year = year or self.year
         month = month or self.month
-        days_in_month = utils.get_ethiopian_days_in_month(year, month)
         calendar = []
 
-        for day in range(1, days_in_month + 1):
+        for day, greg_date in enumerate(_month_gregorian_days(year, month), start=1):
             eth_date = {'year': year, 'month': month, 'day': day}
-            greg_date = conversions.to_gc(year, month, day) # This returns a datetime.date object
 
             ethiopian_display = ""
             if use_geez:
@@ -258,6 +325,14 @@ class Kenat:
         """Returns a user-friendly string representation."""
         return self.format({'lang': 'english'})
 
+    def __reduce__(self):
+        # Pickle as one or two integers, restored without re-validation. The
+        # time is omitted when it is the default.
+        minute_of_day = self._time.minute_of_day
+        if minute_of_day == _DEFAULT_MINUTE_OF_DAY:
+            return (_restore_kenat, (self.to_day_number(),))
+        return (_restore_kenat, (self.to_day_number(), minute_of_day))
+
     def __repr__(self):
         """Returns an unambiguous string representation of the object."""
         return f"Kenat(year={self.year}, month={self.month}, day={self.day})"
@@ -0,0 +1,306 @@
+"""
+Columnar Ethiopian dates.
+
+A `KenatArray` stores Ethiopian day numbers (see
+`conversions.ethiopian_to_day_number`) in one int32 buffer: a numpy array
+when numpy is installed, otherwise an `array.array('i')`. Its methods mirror
+`Kenat` but work on the whole column, so analytics code can handle millions
+of dates without building a `Kenat` per date:
+
+    from kenat import Kenat, KenatArray
+
+    dates = KenatArray.from_gregorian(df['date'].to_numpy())
+    dates.month                              # array of months
+    dates.add(months=1).format({'lang': 'english'})
+    dates.sort().searchsorted(Kenat(2016, 1, 1))
+
+With numpy, numeric results and masks are numpy arrays; without it they are
+`array.array`s ('i' for numbers, 'B' for masks). Strings and Gregorian
+dates are returned as lists without numpy.
+"""
+import bisect
+import datetime
+from array import array
+
+try:
+    import numpy as np
+    from . import _vectorized
+except ImportError: # numpy is optional; array.array is used instead
+    np = None
+
+from . import conversions, day_arithmetic, formatting, utils
+from .kenat import Kenat
+from .exceptions import InvalidInputTypeError, InvalidGregorianDateError
+
+def _day_number(value):
+    """Returns the day number of a Kenat, a datetime.date or a day number."""
+    if isinstance(value, Kenat):
+        return value.to_day_number()
+    if isinstance(value, datetime.date):
+        if isinstance(value, datetime.datetime):
+            value = value.date()
+        if not conversions._MIN_GREGORIAN_DATE <= value <= conversions._MAX_GREGORIAN_DATE:
+            raise InvalidGregorianDateError(value.year, value.month, value.day)
+        return conversions.gregorian_ordinal_to_day_number(value.toordinal())
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    raise InvalidInputTypeError('KenatArray', 'date', 'Kenat, datetime.date or day number', value)
+
+class KenatArray:
+    """
+    A sequence of Ethiopian dates stored as int32 day numbers. Indexing returns
+    `Kenat` instances; slicing, sorting and arithmetic return new KenatArrays.
+    """
+    __slots__ = ('_data',)
+
+    def __init__(self, day_numbers=()):
+        """
+        Constructs a KenatArray from Ethiopian day numbers (see `Kenat.to_day_number`).
+        Every day number is a valid date.
+        """
+        if np is not None:
+            self._data = np.array(day_numbers, dtype=np.int32)
+        else:
+            self._data = array('i', day_numbers)
+
+    @classmethod
+    def _wrap(cls, data):
+        """Wraps an int32 buffer without copying it."""
+        dates = cls.__new__(cls)
+        dates._data = data
+        return dates
+
+    @classmethod
+    def from_dates(cls, dates):
+        """
+        Creates a KenatArray from an iterable of `Kenat` or `datetime.date` objects.
+        """
+        day_numbers = map(_day_number, dates)
+        if np is not None:
+            return cls._wrap(np.fromiter(day_numbers, dtype=np.int32))
+        return cls._wrap(array('i', day_numbers))
+
+    @classmethod
+    def from_gregorian(cls, dates):
+        """
+        Creates a KenatArray from Gregorian dates: a datetime64 array (converted
+        in one pass with numpy) or any iterable of `datetime.date` objects.
+
+        Raises:
+            InvalidGregorianDateError: If a date is outside the range supported by `to_ec`.
+        """
+        if np is None:
+            return cls.from_dates(dates)
+        days = np.asarray(dates)
+        if days.dtype.kind != 'M':
+            return cls.from_dates(days.tolist())
+        ordinals = days.astype('datetime64[D]').astype(np.int64) + _vectorized.UNIX_EPOCH_ORDINAL
+        _vectorized.check_gregorian_range(ordinals, np.zeros(len(ordinals), dtype=bool))
+        return cls._wrap(_vectorized.ordinals_to_day_numbers(ordinals).astype(np.int32))
+
+    # --- Components ---
+    @property
+    def day_numbers(self):
+        """The underlying int32 day numbers (a numpy array, or `array('i')` without numpy)."""
+        return self._data
+
+    def _components(self):
+        """Returns (years, months, days) columns."""
+        if np is not None:
+            return conversions.day_number_to_ethiopian(self._data.astype(np.int64))
+        columns = (array('i'), array('i'), array('i'))
+        for day_number in self._data:
+            for column, value in zip(columns, conversions.day_number_to_ethiopian(day_number)):
+                column.append(value)
+        return columns
+
+    def _gregorian_ordinals(self):
+        if np is not None:
+            return _vectorized.day_numbers_to_ordinals(self._data.astype(np.int64))
+        return [conversions.day_number_to_gregorian_ordinal(day_number) for day_number in self._data]
+
+    @property
+    def year(self):
+        """The Ethiopian years."""
+        return self._components()[0]
+
+    @property
+    def month(self):
+        """The Ethiopian months (1-13)."""
+        return self._components()[1]
+
+    @property
+    def day(self):
+        """The Ethiopian days of the month."""
+        return self._components()[2]
+
+    def weekday(self):
+        """Returns the weekdays, 0 for Sunday to 6 for Saturday, as in `Kenat.weekday`."""
+        ordinals = self._gregorian_ordinals()
+        if np is not None:
+            return ordinals % 7
+        return array('i', (ordinal % 7 for ordinal in ordinals))
+
+    def is_leap_year(self):
+        """Returns a mask that is true for dates in Ethiopian leap years."""
+        years = self.year
+        if np is not None:
+            return years % 4 == 3
+        return array('B', (year % 4 == 3 for year in years))
+
+    def to_gregorian(self):
+        """Returns the Gregorian dates: a datetime64[D] array, or a list of `datetime.date` without numpy."""
+        ordinals = self._gregorian_ordinals()
+        if np is not None:
+            return (ordinals - _vectorized.UNIX_EPOCH_ORDINAL).astype('datetime64[D]')
+        return [datetime.date.fromordinal(ordinal) for ordinal in ordinals]
+
+    def is_holiday(self, filter_by=None):
+        """
+        Returns a mask that is true on holidays, as listed by
+        `get_holidays_for_year`. Each distinct year is computed once.
+
+        Args:
+            filter_by (str or list, optional): Only count holidays with these tags.
+        """
+        from . import holidays # Imported lazily to keep `import kenat` light
+        return holidays._day_number_mask(self._data, filter_by)
+
+    # --- Arithmetic Methods ---
+    def add(self, years=0, months=0, days=0):
+        """
+        Adds a duration like `Kenat.add`: years first (Pagume 6 becomes Pagume 5
+        in a common year), then months (capped at the end of the month), then days.
+        """
+        utils.validate_numeric_inputs('KenatArray.add', years=years, months=months, days=days)
+        for name, value in (('years', years), ('months', months), ('days', days)):
+            if isinstance(value, float) and not value.is_integer(): # Also rejects NaN and infinities
+                raise InvalidInputTypeError('KenatArray.add', name, 'whole number', value)
+        years, months, days = int(years), int(months), int(days)
+        if np is not None:
+            day_numbers = self._data.astype(np.int64)
+            if years:
+                day_numbers = _vectorized.add_years(day_numbers, years)
+            if months:
+                day_numbers = _vectorized.add_months(day_numbers, months)
+            return self._wrap((day_numbers + days).astype(np.int32))
+        result = array('i')
+        for day_number in self._data:
+            if years or months:
+                year, month, day = conversions.day_number_to_ethiopian(day_number)
+                date = {'year': year, 'month': month, 'day': day}
+                if years:
+                    date = day_arithmetic._add_years(date, years)
+                if months:
+                    date = day_arithmetic._add_months(date, months)
+                day_number = conversions.ethiopian_to_day_number(date['year'], date['month'], date['day'])
+            result.append(day_number + days)
+        return self._wrap(result)
+
+    def diff_in_days(self, other):
+        """
+        Returns the number of days from `other` to each date.
+
+        Args:
+            other (KenatArray or Kenat): Dates of the same length, or a single date.
+        """
+        if isinstance(other, KenatArray):
+            if len(other) != len(self):
+                raise InvalidInputTypeError('KenatArray.diff_in_days', 'other', f'{len(self)} dates', other)
+            if np is not None:
+                return self._data.astype(np.int64) - other._data
+            return array('i', (a - b for a, b in zip(self._data, other._data)))
+        if not isinstance(other, Kenat):
+            raise InvalidInputTypeError('KenatArray.diff_in_days', 'other', 'KenatArray or Kenat', other)
+        other = other.to_day_number()
+        if np is not None:
+            return self._data.astype(np.int64) - other
+        return array('i', (day_number - other for day_number in self._data))
+
+    # --- Sorting and Searching ---
+    def sort(self):
+        """Returns a new KenatArray in chronological order."""
+        if np is not None:
+            return self._wrap(np.sort(self._data))
+        return self._wrap(array('i', sorted(self._data)))
+
+    def argsort(self):
+        """Returns the indices that would sort the dates (a stable sort)."""
+        if np is not None:
+            return np.argsort(self._data, kind='stable')
+        return array('q', sorted(range(len(self._data)), key=self._data.__getitem__))
+
+    def searchsorted(self, value, side='left'):
+        """
+        Finds where `value` would be inserted to keep this sorted array in order.
+
+        Args:
+            value (Kenat, datetime.date, day number or KenatArray): The dates to find.
+            side (str): 'left' or 'right', as in `bisect`/`numpy.searchsorted`.
+        """
+        if side not in ('left', 'right'):
+            raise InvalidInputTypeError('KenatArray.searchsorted', 'side', "'left' or 'right'", side)
+        values = value._data if isinstance(value, KenatArray) else _day_number(value)
+        if np is not None:
+            return np.searchsorted(self._data, values, side=side)
+        search = bisect.bisect_left if side == 'left' else bisect.bisect_right
+        if isinstance(value, KenatArray):
+            return array('q', (search(self._data, day_number) for day_number in values))
+        return search(self._data, values)
+
+    # --- Formatting Methods ---
+    def format(self, options=None):
+        """
+        Formats the dates like `Kenat.format` and returns a list of strings.
+        Each distinct date is formatted once.
+
+        Args:
+            options (dict, optional): {'lang', 'show_weekday', 'use_geez'}.
+        """
+        options = options or {}
+        lang = options.get('lang', 'amharic')
+        if options.get('use_geez', False):
+            format_date = formatting.format_in_geez_amharic
+        elif options.get('show_weekday', False):
+            def format_date(date):
+                return formatting.format_with_weekday(date, lang)
+        else:
+            def format_date(date):
+                return formatting.format_standard(date, lang)
+        day_numbers = self._data.tolist() if np is not None else self._data
+        strings = {}
+        for day_number in day_numbers:
+            if day_number not in strings:
+                year, month, day = conversions.day_number_to_ethiopian(day_number)
+                strings[day_number] = format_date({'year': year, 'month': month, 'day': day})
+        return [strings[day_number] for day_number in day_numbers]
+
+    # --- Python Special Methods ---
+    def __len__(self):
+        return len(self._data)
+
+    def __iter__(self):
+        return map(Kenat._from_day_number, self._data.tolist() if np is not None else self._data)
+
+    def __getitem__(self, index):
+        if isinstance(index, int) or (np is not None and isinstance(index, np.integer)):
+            return Kenat._from_day_number(int(self._data[index]))
+        return self._wrap(self._data[index])
+
+    def __eq__(self, other):
+        """True when both arrays hold the same dates in the same order."""
+        if not isinstance(other, KenatArray):
+            return NotImplemented
+        if np is not None:
+            return bool(np.array_equal(self._data, other._data))
+        return self._data == other._data
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return (type(self), (self._data,))
+
+    def __repr__(self):
+        shown = [formatting.format_short(date.get_ethiopian()) for date in self[:5]]
+        more = ', ...' if len(self) > 5 else ''
+        return f"KenatArray([{', '.join(shown)}{more}], length={len(self)})"
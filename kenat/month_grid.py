@@ -3,6 +3,7 @@ from .geez_converter import to_geez
 from .constants import DAYS_OF_WEEK, MONTH_NAMES
 from .utils import get_weekday, validate_numeric_inputs
 from .exceptions import InvalidGridConfigError
+from .instrumentation import instrumented
 
 class MonthGrid:
     def __init__(self, config=None):
@@ -45,6 +46,7 @@ class MonthGrid:
         instance = cls(config)
         return instance.generate()
 
+    @instrumented('MonthGrid.generate')
     def generate(self):
         """Generates and returns the structured month grid."""
         from .kenat import Kenat
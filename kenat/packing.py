@@ -0,0 +1,93 @@
+"""
+Compact binary encoding of many dates and times.
+
+A date is packed as its Ethiopian day number, a little-endian signed 32-bit
+integer (the encoding of `Kenat.to_bytes`). A time is packed as its
+Gregorian minute of day, a little-endian unsigned 16-bit integer (the encoding of
+`Time.to_bytes`). Packed columns are plain `array.array` objects, so they
+can be written with `.tofile()`/`.tobytes()` and read back from any
+buffer-protocol object (bytes, `mmap`, `memoryview`) without copying:
+
+    from kenat import packing
+
+    with open('dates.bin', 'wb') as f:
+        packing.pack_many(dates).tofile(f)
+
+    with open('dates.bin', 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        dates = packing.unpack_many(buffer)
+"""
+import sys
+from array import array
+
+from .kenat import Kenat
+from .time import Time
+from .exceptions import InvalidInputTypeError
+
+_BIG_ENDIAN = sys.byteorder == 'big'
+
+def _pack(typecode, values):
+    packed = array(typecode, values)
+    if _BIG_ENDIAN:
+        packed.byteswap()
+    return packed
+
+def _unpack(function_name, typecode, buffer, build):
+    """Applies `build` to each little-endian integer of `buffer`, read in place."""
+    with memoryview(buffer) as view, view.cast('B') as raw:
+        itemsize = array(typecode).itemsize
+        if raw.nbytes % itemsize:
+            raise InvalidInputTypeError(function_name, 'buffer', f'a multiple of {itemsize} bytes', buffer)
+        if _BIG_ENDIAN:
+            values = array(typecode, raw.tobytes())
+            values.byteswap()
+            return [build(value) for value in values]
+        with raw.cast(typecode) as values:
+            return [build(value) for value in values]
+
+def pack_many(dates):
+    """
+    Packs dates into an array of day numbers.
+
+    Args:
+        dates (iterable of Kenat): The dates to pack.
+
+    Returns:
+        array.array: An 'i' array whose bytes are the little-endian day numbers.
+    """
+    return _pack('i', map(Kenat.to_day_number, dates))
+
+def unpack_many(buffer):
+    """
+    Unpacks dates written by `pack_many` or `Kenat.to_bytes`.
+
+    Args:
+        buffer (bytes-like): Any buffer-protocol object holding 4 bytes per date.
+
+    Returns:
+        list of Kenat
+    """
+    return _unpack('unpack_many', 'i', buffer, Kenat._from_day_number)
+
+def pack_times(times):
+    """
+    Packs times into an array of minutes of day.
+
+    Args:
+        times (iterable of Time): The times to pack.
+
+    Returns:
+        array.array: An 'H' array whose bytes are the little-endian minutes of day.
+    """
+    return _pack('H', (time.minute_of_day for time in times))
+
+def unpack_times(buffer):
+    """
+    Unpacks times written by `pack_times` or `Time.to_bytes`.
+
+    Args:
+        buffer (bytes-like): Any buffer-protocol object holding 2 bytes per time.
+
+    Returns:
+        list of Time
+    """
+    return _unpack('unpack_times', 'H', buffer, Time.from_minute_of_day)
@@ -0,0 +1,651 @@
+"""
+pandas integration: an `ethiopian_date` dtype and the `.ethiopic` Series accessor.
+
+Requires pandas (`pip install kenat[pandas]`). Importing this module
+registers the dtype and the accessor:
+
+    import kenat.pandas
+
+    df['date_ec'] = df['date'].astype('ethiopian_date')   # from datetime64, vectorized
+    df['date_ec'].ethiopic.month_name(lang='english')
+    df['date_ec'].ethiopic.add(months=1).ethiopic.to_gregorian()
+    df.resample(EthiopianMonthBegin(), on='date').sum()
+
+Values are stored as int32 Ethiopian day numbers (see `conversions.ethiopian_to_day_number`),
+so a column costs 4 bytes per row and every accessor method is computed
+with numpy on whole columns, following the rules of `conversions` and
+`day_arithmetic`. Scalars are boxed as `Kenat` objects only when single
+elements are accessed. The Ethiopian calendar offsets (`EthiopianMonthBegin`,
+`EthiopianFiscalYearBegin`, ...) work with `pd.date_range`, `resample` and
+datetime arithmetic, and are vectorized in the same way.
+"""
+import datetime
+import operator
+
+try:
+    import numpy as np
+    import pandas as pd
+    from pandas.api.extensions import (
+        ExtensionArray,
+        ExtensionDtype,
+        register_extension_dtype,
+        register_series_accessor,
+        take,
+    )
+    from pandas.api.indexers import check_array_indexer
+    from pandas.tseries.offsets import BaseOffset
+except ImportError as e: # pragma: no cover - depends on the environment
+    raise ImportError("kenat.pandas requires pandas. Install it with `pip install kenat[pandas]`.") from e
+
+from . import conversions, formatting, holidays
+from .kenat import Kenat
+from .constants import MONTH_NAMES
+from .exceptions import InvalidInputTypeError
+from ._vectorized import (
+    UNIX_EPOCH_ORDINAL,
+    MIN_GREGORIAN_ORDINAL,
+    MIN_TABLE_DAY_NUMBER,
+    days_in_month,
+    add_months,
+    add_years,
+    check_ethiopian,
+    check_gregorian_range,
+    day_numbers_to_ordinals,
+    ordinals_to_day_numbers,
+)
+
+# Day number stored for missing values.
+_NA_DAY_NUMBER = np.iinfo(np.int32).min
+
+# --- Vectorized helpers ---
+
+def _gregorian_ordinals(values):
+    """Returns (int64 ordinals, NaT mask) for datetime-like values, using their wall-clock date."""
+    index = pd.DatetimeIndex(values)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    days = index.values.astype('datetime64[D]')
+    mask = np.isnat(days)
+    ordinals = days.astype(np.int64) + UNIX_EPOCH_ORDINAL
+    ordinals[mask] = MIN_GREGORIAN_ORDINAL
+    return ordinals, mask
+
+def _integers_and_mask(values):
+    """Returns (int64 array, missing mask) for array-like integers, which may contain NA."""
+    array = pd.array(np.asarray(values) if np.ndim(values) else [values], dtype='Int64')
+    return array.to_numpy(dtype=np.int64, na_value=0), np.asarray(array.isna())
+
+def _box(day_number):
+    return Kenat._from_day_number(int(day_number))
+
+def _scalar_to_day_number(value):
+    """Converts a single value accepted by `Kenat` (or a (y, m, d) tuple) to a day number."""
+    if value is None or value is pd.NA or value is pd.NaT or (isinstance(value, float) and np.isnan(value)):
+        return _NA_DAY_NUMBER
+    if isinstance(value, tuple):
+        value = Kenat(*value)
+    elif isinstance(value, np.datetime64):
+        value = Kenat(pd.Timestamp(value).to_pydatetime())
+    elif not isinstance(value, Kenat):
+        value = Kenat(value)
+    return conversions.ethiopian_to_day_number(value.year, value.month, value.day)
+
+# --- Dtype and Array ---
+
+@register_extension_dtype
+class EthiopianDateDtype(ExtensionDtype):
+    """pandas dtype for Ethiopian dates, stored as int32 day numbers."""
+    name = 'ethiopian_date'
+    type = Kenat
+    kind = 'O'
+    na_value = pd.NA
+    _is_numeric = False
+
+    @classmethod
+    def construct_array_type(cls):
+        return EthiopianDateArray
+
+    def __repr__(self):
+        return 'EthiopianDateDtype()'
+
+    def __from_arrow__(self, array):
+        """Builds an EthiopianDateArray from a `kenat.arrow` Ethiopian date (Chunked)Array."""
+        chunks = array.chunks if hasattr(array, 'chunks') else [array]
+        day_numbers = [
+            chunk.storage.fill_null(_NA_DAY_NUMBER).to_numpy(zero_copy_only=False) for chunk in chunks
+        ]
+        return EthiopianDateArray(np.concatenate(day_numbers) if day_numbers else np.array([], dtype=np.int32))
+
+class EthiopianDateArray(ExtensionArray):
+    """
+    ExtensionArray of Ethiopian dates backed by an int32 numpy array of day numbers.
+
+    Args:
+        day_numbers (array-like of int): Ethiopian day numbers; the minimum
+            int32 value marks a missing date.
+        copy (bool): Whether to copy `day_numbers`.
+    """
+    def __init__(self, day_numbers, copy=False):
+        values = np.asarray(day_numbers, dtype=np.int32)
+        if values.ndim != 1:
+            raise ValueError("EthiopianDateArray must be 1-dimensional.")
+        self._data = values.copy() if copy else values
+
+    # --- Constructors ---
+    @classmethod
+    def _from_sequence(cls, scalars, *, dtype=None, copy=False):
+        if isinstance(scalars, cls):
+            return scalars.copy() if copy else scalars
+        if pd.api.types.is_datetime64_any_dtype(getattr(scalars, 'dtype', None)):
+            return cls.from_gregorian(scalars)
+        return cls(np.fromiter((_scalar_to_day_number(v) for v in scalars), dtype=np.int32))
+
+    @classmethod
+    def _from_sequence_of_strings(cls, strings, *, dtype=None, copy=False):
+        return cls._from_sequence(strings, dtype=dtype, copy=copy)
+
+    @classmethod
+    def _from_factorized(cls, values, original):
+        return cls(values)
+
+    @classmethod
+    def from_gregorian(cls, values):
+        """
+        Converts datetime-like values (datetime64 arrays, Series, DatetimeIndex)
+        to Ethiopian dates without creating Python objects. NaT becomes NA.
+
+        Raises:
+            InvalidGregorianDateError: If a date is outside the range supported by `to_ec`.
+        """
+        ordinals, mask = _gregorian_ordinals(values)
+        check_gregorian_range(ordinals, mask)
+        day_numbers = ordinals_to_day_numbers(ordinals)
+        day_numbers[mask] = _NA_DAY_NUMBER
+        return cls(day_numbers)
+
+    @classmethod
+    def from_ymd(cls, years, months, days):
+        """
+        Builds an array from Ethiopian year, month and day columns. A row is
+        missing if any of its components is missing.
+
+        Raises:
+            InvalidEthiopianDateError: For the first date that does not exist.
+        """
+        years, year_mask = _integers_and_mask(years)
+        months, month_mask = _integers_and_mask(months)
+        days, day_mask = _integers_and_mask(days)
+        mask = year_mask | month_mask | day_mask
+        check_ethiopian(years, months, days, mask)
+        day_numbers = conversions.ethiopian_to_day_number(years, months, days)
+        day_numbers[mask] = _NA_DAY_NUMBER
+        return cls(day_numbers)
+
+    # --- Components ---
+    @property
+    def day_numbers(self):
+        """The underlying int32 day numbers (the NA sentinel included)."""
+        return self._data
+
+    def _filled_day_numbers(self):
+        """Returns the day numbers as int64; missing rows hold Meskerem 1 of year 1."""
+        return np.where(self.isna(), 1, self._data).astype(np.int64)
+
+    def _components(self):
+        """Returns int64 (years, months, days) arrays; missing rows hold Meskerem 1 of year 1."""
+        return conversions.day_number_to_ethiopian(self._filled_day_numbers())
+
+    def _gregorian_ordinals(self):
+        """Returns int64 Gregorian ordinals; missing rows hold an arbitrary valid ordinal."""
+        day_numbers = np.where(self.isna(), MIN_TABLE_DAY_NUMBER, self._data).astype(np.int64)
+        return day_numbers_to_ordinals(day_numbers)
+
+    def to_gregorian(self):
+        """Returns the Gregorian dates as a datetime64[D] numpy array, with NaT for NA."""
+        days = (self._gregorian_ordinals() - UNIX_EPOCH_ORDINAL).astype('datetime64[D]')
+        days[self.isna()] = np.datetime64('NaT')
+        return days
+
+    # --- ExtensionArray interface ---
+    @property
+    def dtype(self):
+        return EthiopianDateDtype()
+
+    @property
+    def nbytes(self):
+        return self._data.nbytes
+
+    def __len__(self):
+        return len(self._data)
+
+    def __getitem__(self, item):
+        if pd.api.types.is_integer(item):
+            value = self._data[item]
+            return pd.NA if value == _NA_DAY_NUMBER else _box(value)
+        item = check_array_indexer(self, item)
+        return type(self)(self._data[item])
+
+    def __setitem__(self, key, value):
+        key = check_array_indexer(self, key)
+        if pd.api.types.is_list_like(value) and not isinstance(value, (tuple, dict)):
+            self._data[key] = self._from_sequence(value)._data
+        else:
+            self._data[key] = _scalar_to_day_number(value)
+
+    def __iter__(self):
+        for value in self._data:
+            yield pd.NA if value == _NA_DAY_NUMBER else _box(value)
+
+    def __array__(self, dtype=None, copy=None):
+        return np.array(list(self), dtype=object)
+
+    def isna(self):
+        return self._data == _NA_DAY_NUMBER
+
+    def __arrow_array__(self, type=None):
+        """Converts to a `kenat.arrow` Ethiopian date array, e.g. for `pa.Table.from_pandas`."""
+        import pyarrow as pa
+        from .arrow import ethiopian_date
+        mask = self.isna()
+        storage = pa.array(self._data, type=pa.int32(), mask=mask if mask.any() else None)
+        return pa.ExtensionArray.from_storage(ethiopian_date, storage)
+
+    def take(self, indices, allow_fill=False, fill_value=None):
+        if allow_fill:
+            fill_value = _NA_DAY_NUMBER if fill_value is None or fill_value is pd.NA else _scalar_to_day_number(fill_value)
+        return type(self)(take(self._data, indices, allow_fill=allow_fill, fill_value=fill_value))
+
+    def copy(self):
+        return type(self)(self._data, copy=True)
+
+    @classmethod
+    def _concat_same_type(cls, to_concat):
+        return cls(np.concatenate([array._data for array in to_concat]))
+
+    def unique(self):
+        return type(self)(pd.unique(self._data))
+
+    def _values_for_factorize(self):
+        return self._data, _NA_DAY_NUMBER
+
+    def _values_for_argsort(self):
+        return self._data
+
+    def astype(self, dtype, copy=True):
+        dtype = pd.api.types.pandas_dtype(dtype)
+        if isinstance(dtype, EthiopianDateDtype):
+            return self.copy() if copy else self
+        if pd.api.types.is_datetime64_dtype(dtype):
+            return self.to_gregorian().astype(dtype)
+        if pd.api.types.is_string_dtype(dtype) and not pd.api.types.is_object_dtype(dtype):
+            return pd.array(self._format(formatting.format_short), dtype=dtype)
+        return super().astype(dtype, copy=copy)
+
+    def _formatter(self, boxed=False):
+        def format_value(value):
+            return str(value) if value is pd.NA else formatting.format_short(value.get_ethiopian())
+        return format_value
+
+    def _reduce(self, name, *, skipna=True, keepdims=False, **kwargs):
+        if name not in ('min', 'max'):
+            return super()._reduce(name, skipna=skipna, keepdims=keepdims, **kwargs)
+        mask = self.isna()
+        if mask.all() or (mask.any() and not skipna):
+            result = pd.NA
+        else:
+            values = self._data[~mask]
+            result = _box(values.min() if name == 'min' else values.max())
+        return type(self)._from_sequence([result]) if keepdims else result
+
+    # --- Operators ---
+    def _other_day_numbers(self, other):
+        if isinstance(other, EthiopianDateArray):
+            return other._data
+        if pd.api.types.is_list_like(other) and not isinstance(other, (tuple, dict)):
+            return self._from_sequence(other)._data
+        return _scalar_to_day_number(other)
+
+    def _compare(self, other, op):
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+        other = self._other_day_numbers(other)
+        result = op(self._data, other)
+        missing = self.isna() | (other == _NA_DAY_NUMBER)
+        result[missing] = op is operator.ne
+        return result
+
+    def __eq__(self, other):
+        return self._compare(other, operator.eq)
+
+    def __ne__(self, other):
+        return self._compare(other, operator.ne)
+
+    def __lt__(self, other):
+        return self._compare(other, operator.lt)
+
+    def __le__(self, other):
+        return self._compare(other, operator.le)
+
+    def __gt__(self, other):
+        return self._compare(other, operator.gt)
+
+    def __ge__(self, other):
+        return self._compare(other, operator.ge)
+
+    def __add__(self, days):
+        """Adds a number of days (an integer or an array of integers)."""
+        if isinstance(days, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+        return self._add_days(days)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        """Subtracts days, or another date array to get the difference in days."""
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+        if pd.api.types.is_integer(other) or (
+            pd.api.types.is_list_like(other) and pd.api.types.is_integer_dtype(np.asarray(other))
+        ):
+            return self._add_days(-np.asarray(other))
+        return self._diff_in_days(other)
+
+    # --- Arithmetic, following `day_arithmetic` ---
+    def _add_days(self, days):
+        days, days_mask = _integers_and_mask(days)
+        mask = self.isna() | days_mask
+        result = self._data.astype(np.int64) + days
+        result[mask] = _NA_DAY_NUMBER
+        return type(self)(result)
+
+    def _add_months(self, months):
+        months, months_mask = _integers_and_mask(months)
+        mask = self.isna() | months_mask
+        result = add_months(self._filled_day_numbers(), months)
+        result[mask] = _NA_DAY_NUMBER
+        return type(self)(result)
+
+    def _add_years(self, years_to_add):
+        years_to_add, years_mask = _integers_and_mask(years_to_add)
+        mask = self.isna() | years_mask
+        result = add_years(self._filled_day_numbers(), years_to_add)
+        result[mask] = _NA_DAY_NUMBER
+        return type(self)(result)
+
+    def _diff_in_days(self, other):
+        other = self._other_day_numbers(other)
+        mask = self.isna() | (other == _NA_DAY_NUMBER)
+        return pd.arrays.IntegerArray(self._data.astype(np.int64) - other, mask)
+
+    def _format(self, format_date):
+        """Formats every distinct date once with `format_date(dict)`; NA becomes None."""
+        codes, uniques = pd.factorize(self._data[~self.isna()])
+        years, months, days = conversions.day_number_to_ethiopian(uniques.astype(np.int64))
+        strings = np.array([
+            format_date({'year': int(y), 'month': int(m), 'day': int(d)})
+            for y, m, d in zip(years, months, days)
+        ] + [None], dtype=object)
+        result = np.full(len(self), len(uniques), dtype=np.intp)
+        result[~self.isna()] = codes
+        return strings[result]
+
+# --- Series accessor ---
+
+@register_series_accessor('ethiopic')
+class EthiopicAccessor:
+    """
+    Vectorized Ethiopian calendar operations on a Series, available as `Series.ethiopic`.
+
+    Works on `ethiopian_date` Series and on datetime64 Series, which are
+    converted from Gregorian on the fly.
+    """
+    def __init__(self, series):
+        if isinstance(series.dtype, EthiopianDateDtype):
+            self._array = series.array
+        elif pd.api.types.is_datetime64_any_dtype(series.dtype):
+            self._array = EthiopianDateArray.from_gregorian(series)
+        else:
+            raise AttributeError("Can only use .ethiopic accessor with ethiopian_date or datetime64 values.")
+        self._series = series
+
+    def _wrap(self, values, dtype=None):
+        return pd.Series(values, index=self._series.index, name=self._series.name, dtype=dtype)
+
+    def _component(self, index):
+        values = self._array._components()[index]
+        return self._wrap(pd.arrays.IntegerArray(values, self._array.isna()))
+
+    @property
+    def year(self):
+        """The Ethiopian year."""
+        return self._component(0)
+
+    @property
+    def month(self):
+        """The Ethiopian month (1-13)."""
+        return self._component(1)
+
+    @property
+    def day(self):
+        """The Ethiopian day of the month."""
+        return self._component(2)
+
+    @property
+    def weekday(self):
+        """The weekday, 0 for Sunday to 6 for Saturday, as in `utils.get_weekday`."""
+        return self._wrap(pd.arrays.IntegerArray(self._array._gregorian_ordinals() % 7, self._array.isna()))
+
+    @property
+    def day_number(self):
+        """The Ethiopian day number (days since Meskerem 1 of year 1, which is 1)."""
+        values = self._array.day_numbers.astype(np.int64)
+        return self._wrap(pd.arrays.IntegerArray(values, self._array.isna()))
+
+    def fiscal_year(self, start_month=11):
+        """
+        Returns the fiscal year of each date, named after the Ethiopian year in
+        which it ends. By default fiscal years start on Hamle 1, so Hamle 1 2016
+        to Sene 30 2017 is fiscal year 2017.
+        """
+        years, months, _ = self._array._components()
+        values = years + (months >= start_month) if start_month > 1 else years
+        return self._wrap(pd.arrays.IntegerArray(values, self._array.isna()))
+
+    def month_name(self, lang='amharic'):
+        """Returns the month names in the given language."""
+        names = np.array(MONTH_NAMES.get(lang, MONTH_NAMES['amharic']) + [None], dtype=object)
+        months = self._array._components()[1] - 1
+        months[self._array.isna()] = len(names) - 1
+        return self._wrap(names[months])
+
+    def is_holiday(self, filter_by=None):
+        """
+        Returns a boolean Series that is True on holidays, as listed by
+        `get_holidays_for_year`. Each distinct year is computed once.
+
+        Args:
+            filter_by (str or list, optional): Only count holidays with these tags.
+        """
+        valid = ~self._array.isna()
+        holiday = np.zeros(len(valid), dtype=bool)
+        # Only the years of valid rows are looked up; missing rows are never holidays
+        holiday[valid] = holidays._day_number_mask(self._array._filled_day_numbers()[valid], filter_by)
+        return self._wrap(holiday)
+
+    def to_gregorian(self):
+        """Returns the Gregorian dates as a datetime64 Series (NaT for missing dates)."""
+        return self._wrap(self._array.to_gregorian())
+
+    def format(self, options=None):
+        """
+        Formats the dates like `Kenat.format`. Each distinct date is formatted once.
+
+        Args:
+            options (dict, optional): {'lang', 'show_weekday', 'use_geez'}.
+        """
+        options = options or {}
+        lang = options.get('lang', 'amharic')
+        if options.get('use_geez', False):
+            format_date = formatting.format_in_geez_amharic
+        elif options.get('show_weekday', False):
+            def format_date(date):
+                return formatting.format_with_weekday(date, lang)
+        else:
+            def format_date(date):
+                return formatting.format_standard(date, lang)
+        return self._wrap(self._array._format(format_date))
+
+    def add(self, years=0, months=0, days=0):
+        """
+        Adds a duration like `Kenat.add`: years first, then months, then days.
+        Each argument may be an integer or an array of integers.
+        """
+        array = self._array
+        if not pd.api.types.is_scalar(years) or years:
+            array = array._add_years(years)
+        if not pd.api.types.is_scalar(months) or months:
+            array = array._add_months(months)
+        if not pd.api.types.is_scalar(days) or days:
+            array = array._add_days(days)
+        return self._wrap(array)
+
+    def diff_in_days(self, other):
+        """Returns the number of days from `other` (dates or a Series of dates) to each date."""
+        if isinstance(other, pd.Series):
+            other = other.ethiopic._array
+        return self._wrap(self._array._diff_in_days(other))
+
+# --- Calendar offsets ---
+
+class _EthiopianOffset(BaseOffset):
+    """
+    Base class of the Ethiopian calendar offsets. Subclasses implement
+    `_on_offset(day_numbers)` and `_shift(day_numbers, n)` on int64 arrays of
+    Ethiopian day numbers; the Timestamp and datetime64 entry points used by
+    pandas are built on them, so scalars and whole columns share one code path.
+    Like pandas' own offsets, the time of day is kept unless `normalize` is set.
+    """
+    def _day_numbers(self, ordinals):
+        return ordinals_to_day_numbers(np.asarray(ordinals, dtype=np.int64))
+
+    def _apply(self, other):
+        other = pd.Timestamp(other)
+        day_number = self._shift(self._day_numbers([other.toordinal()]), self.n)
+        date = datetime.date.fromordinal(int(day_numbers_to_ordinals(day_number)[0]))
+        result = other.replace(year=date.year, month=date.month, day=date.day)
+        return result.normalize() if self.normalize else result
+
+    def _apply_array(self, values):
+        days = values.astype('datetime64[D]')
+        missing = np.isnat(days)
+        ordinals = np.where(missing, MIN_GREGORIAN_ORDINAL, days.astype(np.int64) + UNIX_EPOCH_ORDINAL)
+        shifted = day_numbers_to_ordinals(self._shift(self._day_numbers(ordinals), self.n))
+        result = (shifted - UNIX_EPOCH_ORDINAL).astype('datetime64[D]').astype(values.dtype)
+        if not self.normalize:
+            result = result + (values - days)
+        result[missing] = np.datetime64('NaT')
+        return result
+
+    def is_on_offset(self, dt):
+        dt = pd.Timestamp(dt)
+        if self.normalize and dt != dt.normalize():
+            return False
+        return bool(self._on_offset(self._day_numbers([dt.toordinal()]))[0])
+
+class EthiopianMonthBegin(_EthiopianOffset):
+    """Offset to the first day of an Ethiopian month (Pagume included)."""
+    _prefix = 'EMS'
+
+    def _on_offset(self, day_numbers):
+        return conversions.day_number_to_ethiopian(day_numbers)[2] == 1
+
+    def _shift(self, day_numbers, n):
+        years, months, days = conversions.day_number_to_ethiopian(day_numbers)
+        month_index = years * 13 + months - 1 + n + ((n <= 0) & (days > 1))
+        return conversions.ethiopian_to_day_number(month_index // 13, month_index % 13 + 1, 1)
+
+class EthiopianMonthEnd(_EthiopianOffset):
+    """Offset to the last day of an Ethiopian month: the 30th, or Pagume 5 or 6."""
+    _prefix = 'EME'
+
+    def _on_offset(self, day_numbers):
+        years, months, days = conversions.day_number_to_ethiopian(day_numbers)
+        return days == days_in_month(years, months)
+
+    def _shift(self, day_numbers, n):
+        years, months, days = conversions.day_number_to_ethiopian(day_numbers)
+        month_index = years * 13 + months - 1 + n - ((n > 0) & (days < days_in_month(years, months)))
+        years, months = month_index // 13, month_index % 13 + 1
+        return conversions.ethiopian_to_day_number(years, months, days_in_month(years, months))
+
+class EthiopianMonthOffset(_EthiopianOffset):
+    """
+    Steps by whole Ethiopian months like `Kenat.add(months=n)`: Pagume counts
+    as a month, and days past its end are capped at Pagume 5 (or 6).
+    """
+    _prefix = 'EM'
+
+    def _on_offset(self, day_numbers):
+        return np.ones(len(day_numbers), dtype=bool)
+
+    def _shift(self, day_numbers, n):
+        years, months, days = conversions.day_number_to_ethiopian(day_numbers)
+        month_index = years * 13 + months - 1 + n
+        years, months = month_index // 13, month_index % 13 + 1
+        return conversions.ethiopian_to_day_number(years, months, np.minimum(days, days_in_month(years, months)))
+
+class _EthiopianYearOffset(_EthiopianOffset):
+    """Base class of offsets to years starting on the first day of `month`."""
+    _attributes = ('n', 'normalize', 'month')
+    _default_month = 1
+
+    def __init__(self, n=1, normalize=False, month=None):
+        super().__init__(n, normalize)
+        month = self._default_month if month is None else month
+        if not isinstance(month, int) or not 1 <= month <= 13:
+            raise InvalidInputTypeError(type(self).__name__, 'month', 'number between 1 and 13', month)
+        self.month = month
+
+    def __reduce__(self):
+        # BaseOffset only pickles `n` and `normalize`
+        return (type(self), (self.n, self.normalize, self.month))
+
+    def _period_start_years(self, day_numbers):
+        """Returns the Ethiopian year in which the period containing each date starts."""
+        years, months, _ = conversions.day_number_to_ethiopian(day_numbers)
+        return years - (months < self.month)
+
+    def _start(self, years):
+        return conversions.ethiopian_to_day_number(years, self.month, 1)
+
+class EthiopianYearBegin(_EthiopianYearOffset):
+    """Offset to the start of an Ethiopian year, Meskerem 1 (or the first day of `month`)."""
+    _prefix = 'EYS'
+
+    def _on_offset(self, day_numbers):
+        return day_numbers == self._start(self._period_start_years(day_numbers))
+
+    def _shift(self, day_numbers, n):
+        years = self._period_start_years(day_numbers) + n + ((n <= 0) & ~self._on_offset(day_numbers))
+        return self._start(years)
+
+class EthiopianYearEnd(_EthiopianYearOffset):
+    """Offset to the last day of an Ethiopian year, Pagume 5 or 6 (or the day before `month` starts)."""
+    _prefix = 'EYE'
+
+    def _on_offset(self, day_numbers):
+        return day_numbers + 1 == self._start(self._period_start_years(day_numbers) + 1)
+
+    def _shift(self, day_numbers, n):
+        years = self._period_start_years(day_numbers) + n - ((n > 0) & ~self._on_offset(day_numbers))
+        return self._start(years + 1) - 1
+
+class EthiopianFiscalYearBegin(EthiopianYearBegin):
+    """Offset to the start of the Ethiopian fiscal year, Hamle 1."""
+    _prefix = 'EFYS'
+    _default_month = 11
+
+class EthiopianFiscalYearEnd(EthiopianYearEnd):
+    """Offset to the end of the Ethiopian fiscal year, Sene 30."""
+    _prefix = 'EFYE'
+    _default_month = 11
@@ -0,0 +1,186 @@
+"""
+Process-pool versions of the bulk conversion and holiday functions.
+
+Large backfills are CPU-bound pure Python, so threads do not help under the
+GIL. These helpers split the work into chunks and run them on a
+`ProcessPoolExecutor`. Dates travel between processes as (year, month, day)
+int tuples and holidays as the compact holiday index entries, never as
+dicts, and at most `2 * workers` chunks are in flight, so arbitrarily long
+iterables are processed in constant memory.
+
+Example:
+    from kenat import parallel
+
+    for eth in parallel.convert_many(gregorian_dates, 'to_ec', workers=8):
+        ...
+"""
+import datetime
+import itertools
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from . import conversions, holidays
+from .utils import validate_numeric_inputs
+from .exceptions import InvalidInputTypeError
+
+DIRECTIONS = ('to_ec', 'to_gc')
+
+def _as_triple(value):
+    """Returns a (year, month, day) tuple for a date, dict, Kenat or sequence."""
+    if isinstance(value, dict):
+        return (value['year'], value['month'], value['day'])
+    if hasattr(value, 'year'):
+        return (value.year, value.month, value.day)
+    year, month, day = value
+    return (year, month, day)
+
+def _convert_chunk(direction, chunk):
+    """Worker: converts a list of (y, m, d) tuples, returning (y, m, d) tuples."""
+    if direction == 'to_ec':
+        result = []
+        for date in chunk:
+            eth = conversions.to_ec(*date)
+            result.append((eth['year'], eth['month'], eth['day']))
+        return result
+    result = []
+    for date in chunk:
+        greg = conversions.to_gc(*date)
+        result.append((greg.year, greg.month, greg.day))
+    return result
+
+def _holiday_index_chunk(_, years):
+    """Worker: returns the holiday index entries of each year."""
+    return [holidays._holiday_index(year) for year in years]
+
+def _chunks(iterable, size, transform):
+    """Yields (start index, list) chunks of at most `size` transformed items."""
+    iterator = map(transform, iterable)
+    start = 0
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield start, chunk
+        start += len(chunk)
+
+def _run_chunks(func, arg, chunks, workers, ordered):
+    """
+    Yields (start index, results) for every chunk, computed as `func(arg, chunk)`.
+    With a single worker the chunks are processed in the calling process.
+    """
+    if workers == 1:
+        for start, chunk in chunks:
+            yield start, func(arg, chunk)
+        return
+
+    max_pending = workers * 2
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        if ordered:
+            pending = deque()
+            for start, chunk in chunks:
+                pending.append((start, executor.submit(func, arg, chunk)))
+                if len(pending) >= max_pending:
+                    start, future = pending.popleft()
+                    yield start, future.result()
+            while pending:
+                start, future = pending.popleft()
+                yield start, future.result()
+        else:
+            pending = {}
+            for start, chunk in chunks:
+                pending[executor.submit(func, arg, chunk)] = start
+                if len(pending) >= max_pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield pending.pop(future), future.result()
+            for future in list(pending):
+                yield pending.pop(future), future.result()
+
+def _check_pool_options(function_name, workers, chunksize):
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if not isinstance(workers, int) or workers < 1:
+        raise InvalidInputTypeError(function_name, 'workers', 'positive integer', workers)
+    if not isinstance(chunksize, int) or chunksize < 1:
+        raise InvalidInputTypeError(function_name, 'chunksize', 'positive integer', chunksize)
+    return workers
+
+def convert_many(dates, direction, workers=None, chunksize=1000, ordered=True):
+    """
+    Converts many dates across a pool of worker processes.
+
+    Args:
+        dates (iterable): Dates as (year, month, day) sequences, dicts with
+            'year', 'month' and 'day', `datetime.date` or `Kenat` objects.
+        direction (str): 'to_ec' (Gregorian → Ethiopian) or 'to_gc' (Ethiopian → Gregorian).
+        workers (int, optional): Number of processes. Defaults to the CPU count;
+            1 converts in the calling process.
+        chunksize (int): Number of dates sent to a worker at a time.
+        ordered (bool): If False, results are yielded as soon as their chunk
+            is done, as (index, result) pairs.
+
+    Yields:
+        dict or datetime.date: The same values `to_ec` or `to_gc` return, in
+        input order, or (index, value) pairs when `ordered` is False.
+
+    Raises:
+        KenatError: The first invalid date stops the conversion, as in `to_ec`/`to_gc`.
+    """
+    if direction not in DIRECTIONS:
+        raise InvalidInputTypeError('convert_many', 'direction', "'to_ec' or 'to_gc'", direction)
+    workers = _check_pool_options('convert_many', workers, chunksize)
+    return _convert_many(dates, direction, workers, chunksize, ordered)
+
+def _convert_many(dates, direction, workers, chunksize, ordered):
+    if direction == 'to_ec':
+        def build(date):
+            return {'year': date[0], 'month': date[1], 'day': date[2]}
+    else:
+        def build(date):
+            return datetime.date(*date)
+
+    chunks = _chunks(dates, chunksize, _as_triple)
+    for start, results in _run_chunks(_convert_chunk, direction, chunks, workers, ordered):
+        if ordered:
+            for result in results:
+                yield build(result)
+        else:
+            for offset, result in enumerate(results):
+                yield start + offset, build(result)
+
+def holidays_for_years(years, workers=None, lang='amharic', filter_by=None, chunksize=1, ordered=True):
+    """
+    Computes `get_holidays_for_year` for many Ethiopian years across a pool
+    of worker processes.
+
+    Args:
+        years (iterable of int): The Ethiopian years.
+        workers (int, optional): Number of processes. Defaults to the CPU count;
+            1 computes in the calling process.
+        lang (str): The language of holiday names and descriptions.
+        filter_by (str or list, optional): Holiday tags to keep, as in `get_holidays_for_year`.
+        chunksize (int): Number of years sent to a worker at a time.
+        ordered (bool): If False, years are yielded as soon as they are done.
+
+    Yields:
+        tuple: (year, list of holiday dicts) for every year.
+    """
+    workers = _check_pool_options('holidays_for_years', workers, chunksize)
+    return _holidays_for_years(years, workers, lang, filter_by, chunksize, ordered)
+
+def _holidays_for_years(years, workers, lang, filter_by, chunksize, ordered):
+    def checked(year):
+        validate_numeric_inputs('holidays_for_years', eth_year=year)
+        return year
+
+    # Remember the years of in-flight chunks to label their results.
+    pending_years = {}
+    def chunks():
+        for start, chunk in _chunks(years, chunksize, checked):
+            pending_years[start] = chunk
+            yield start, chunk
+
+    for start, indexes in _run_chunks(_holiday_index_chunk, None, chunks(), workers, ordered):
+        for year, entries in zip(pending_years.pop(start), indexes):
+            yield year, holidays._holidays_from_index(entries, lang, filter_by)
@@ -0,0 +1,82 @@
+"""
+SQLAlchemy column type for Ethiopian dates.
+
+Requires SQLAlchemy (`pip install kenat[sqlalchemy]`). `EthiopianDate`
+stores `Kenat` values as integer Ethiopian day numbers (see
+`conversions.ethiopian_to_day_number`), so comparisons, `between` and
+ORDER BY compile to plain integer comparisons that use B-tree indexes:
+
+    from sqlalchemy import Column, Integer, MetaData, Table, select
+    from kenat import Kenat
+    from kenat.sqlalchemy import EthiopianDate
+
+    orders = Table('orders', MetaData(),
+                   Column('id', Integer, primary_key=True),
+                   Column('placed_on', EthiopianDate, index=True))
+
+    select(orders).where(orders.c.placed_on.between(Kenat(2016, 1, 1), Kenat(2016, 6, 30)))
+    select(orders).where(orders.c.placed_on.in_month(2016, 13))
+
+Only the date is stored; the time of a `Kenat` is not persisted.
+"""
+import datetime
+
+try:
+    from sqlalchemy import Integer, and_
+    from sqlalchemy.types import TypeDecorator
+except ImportError as e: # pragma: no cover - depends on the environment
+    raise ImportError("kenat.sqlalchemy requires SQLAlchemy. Install it with `pip install kenat[sqlalchemy]`.") from e
+
+from . import conversions
+from .kenat import Kenat
+from .exceptions import InvalidInputTypeError, InvalidGregorianDateError
+
+def _day_number(value):
+    if isinstance(value, Kenat):
+        return value.to_day_number()
+    if isinstance(value, datetime.date):
+        if not conversions._MIN_GREGORIAN_DATE <= value <= conversions._MAX_GREGORIAN_DATE:
+            raise InvalidGregorianDateError(value.year, value.month, value.day)
+        return conversions.gregorian_ordinal_to_day_number(value.toordinal())
+    raise InvalidInputTypeError('EthiopianDate', 'value', 'Kenat or datetime.date', value)
+
+def _month_bounds(year, month):
+    """Returns the first day of an Ethiopian month and of the month after it."""
+    start = Kenat(year, month, 1)
+    return start, (Kenat(year + 1, 1, 1) if month == 13 else Kenat(year, month + 1, 1))
+
+class EthiopianDate(TypeDecorator):
+    """
+    Stores `Kenat` dates in an INTEGER column as Ethiopian day numbers and
+    loads them back as `Kenat` instances. `datetime.date` values are accepted
+    in comparisons and assignments and converted to the same day number.
+    """
+    impl = Integer
+    cache_ok = True
+
+    class Comparator(TypeDecorator.Comparator):
+        """Adds Ethiopian calendar ranges that compile to integer range checks."""
+        def in_year(self, year):
+            """True for dates in the Ethiopian `year`."""
+            return and_(self.expr >= Kenat(year, 1, 1), self.expr < Kenat(year + 1, 1, 1))
+
+        def in_month(self, year, month):
+            """True for dates in the Ethiopian `month` of `year`."""
+            start, end = _month_bounds(year, month)
+            return and_(self.expr >= start, self.expr < end)
+
+    comparator_factory = Comparator
+
+    @property
+    def python_type(self):
+        return Kenat
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return _day_number(value)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return Kenat._from_day_number(value)
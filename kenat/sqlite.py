@@ -0,0 +1,121 @@
+"""
+SQLite user-defined functions for Ethiopian dates.
+
+Example:
+    import sqlite3
+    from kenat import sqlite as kenat_sqlite
+
+    conn = sqlite3.connect('sales.db')
+    kenat_sqlite.register(conn)
+    conn.execute("CREATE INDEX sales_eth_month ON sales (eth_year(date), eth_month(date))")
+    conn.execute("SELECT eth_year(date), eth_month(date), sum(amount) FROM sales GROUP BY 1, 2")
+
+Gregorian dates are ISO 'YYYY-MM-DD' text, as produced by SQLite's own date
+functions; a trailing time is ignored. Like SQLite's date functions, these
+return NULL for NULL, malformed or unsupported input rather than raising,
+so one bad row does not abort a query.
+
+All functions except `is_holiday` are registered as deterministic, so they
+may be used in expression indexes, generated columns and CHECK constraints.
+A database that uses them there can only be written by connections that
+called `register`. `is_holiday` depends on the registered holiday providers
+and Islamic holiday overrides, which can change at runtime, so SQLite must
+not store its results.
+"""
+import datetime
+
+from . import conversions, formatting, holidays
+from .cache import memoize
+from .exceptions import KenatError
+
+@memoize('sqlite_iso', maxsize=65536)
+def _ethiopian(iso):
+    """Returns the Ethiopian (year, month, day) of an ISO date string, or None."""
+    if len(iso) > 10 and iso[10] in 'T ':
+        iso = iso[:10]
+    try:
+        date = datetime.date.fromisoformat(iso)
+    except ValueError:
+        return None
+    if not conversions._MIN_GREGORIAN_DATE <= date <= conversions._MAX_GREGORIAN_DATE:
+        return None
+    day_number = conversions.gregorian_ordinal_to_day_number(date.toordinal())
+    return conversions.day_number_to_ethiopian(day_number)
+
+def _parse(iso):
+    return _ethiopian(iso) if isinstance(iso, str) else None
+
+def to_ec(iso):
+    """SQL `to_ec(iso)`: the Ethiopian date as 'yyyy/mm/dd' text."""
+    date = _parse(iso)
+    return None if date is None else f"{date[0]}/{date[1]:02d}/{date[2]:02d}"
+
+def to_gc(year, month, day):
+    """SQL `to_gc(year, month, day)`: the Gregorian date of an Ethiopian date, as ISO text."""
+    try:
+        return conversions.to_gc(year, month, day).isoformat()
+    except KenatError:
+        return None
+
+def eth_year(iso):
+    """SQL `eth_year(iso)`: the Ethiopian year."""
+    date = _parse(iso)
+    return None if date is None else date[0]
+
+def eth_month(iso):
+    """SQL `eth_month(iso)`: the Ethiopian month (1-13)."""
+    date = _parse(iso)
+    return None if date is None else date[1]
+
+def eth_day(iso):
+    """SQL `eth_day(iso)`: the day of the Ethiopian month."""
+    date = _parse(iso)
+    return None if date is None else date[2]
+
+def is_holiday(iso, tags=None):
+    """
+    SQL `is_holiday(iso)` or `is_holiday(iso, tags)`: 1 if the date is a
+    holiday, else 0. `tags` is a comma-separated list of holiday tags, e.g.
+    'public' or 'christian,muslim'.
+    """
+    date = _parse(iso)
+    if date is None or (tags is not None and not isinstance(tags, str)):
+        return None
+    tags = tuple(tag.strip() for tag in tags.split(',') if tag.strip()) if tags else ()
+    try:
+        return int(conversions.ethiopian_to_day_number(*date) in holidays._holiday_days(date[0], tags))
+    except KenatError: # Holidays that fall outside the supported Gregorian range
+        return None
+
+def eth_format(iso, style, lang='amharic'):
+    """
+    SQL `eth_format(iso, style)` or `eth_format(iso, style, lang)`: the
+    Ethiopian date formatted in one of `formatting.DATE_STYLES`.
+    """
+    date = _parse(iso)
+    if date is None or style not in formatting.DATE_STYLES:
+        return None
+    return formatting.format_date({'year': date[0], 'month': date[1], 'day': date[2]}, style, lang)
+
+# (SQL name, number of arguments, function, deterministic)
+FUNCTIONS = (
+    ('to_ec', 1, to_ec, True),
+    ('to_gc', 3, to_gc, True),
+    ('eth_year', 1, eth_year, True),
+    ('eth_month', 1, eth_month, True),
+    ('eth_day', 1, eth_day, True),
+    ('is_holiday', 1, is_holiday, False),
+    ('is_holiday', 2, is_holiday, False),
+    ('eth_format', 2, eth_format, True),
+    ('eth_format', 3, eth_format, True),
+)
+
+def register(connection):
+    """
+    Installs kenat's SQL functions on a connection.
+
+    Args:
+        connection (sqlite3.Connection): The connection to extend.
+    """
+    for name, num_args, func, deterministic in FUNCTIONS:
+        connection.create_function(name, num_args, func, deterministic=deterministic)
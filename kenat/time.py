@@ -1,105 +1,209 @@
-from .geez_converter import to_geez, to_arabic
+import re
+import struct
+from array import array
+
+from .geez_converter import to_geez, _to_arabic
 from .constants import PERIOD_LABELS
-from .exceptions import InvalidTimeError
+from .exceptions import InvalidTimeError, InvalidInputTypeError
 from .utils import validate_numeric_inputs
+from .instrumentation import instrumented
+
+# Binary encoding of a time: its Gregorian minute of day as a little-endian uint16.
+_TIME_STRUCT = struct.Struct('<H')
+
+def _restore_time(minute_of_day):
+    """Unpickles a Time from its minute of day (see `Time.__reduce__`)."""
+    return _INTERNED[minute_of_day]
+
+# Time strings: "<hour>:<minute> [period]", with Arabic or Ge'ez numerals and
+# an optional 'day'/'night' or Amharic period label.
+_TIME_PATTERN = re.compile(r'\s*(\d+|[\u1369-\u137c]+)\s*:\s*(\d+|[\u1369-\u137c]+)(?:\s+(\S+))?\s*')
+_PERIODS = {'day': 'day', 'night': 'night'}
+_PERIODS.update({label: period for period, label in PERIOD_LABELS.items()})
+
+def _ethiopian_minute_of_day(hour, minute, period):
+    """Returns the Gregorian minute of day of an Ethiopian time (unvalidated)."""
+    # Ethiopian hour 12 (0) of the day period is 6 AM; the night period starts at 6 PM.
+    return ((hour % 12) * 60 + minute + (360 if period == 'day' else 1080)) % 1440
+
+def _parse_number(text):
+    return int(text) if text.isdecimal() else _to_arabic(text)
+
+def _parse_minute_of_day(time_string):
+    """Returns the minute of day of a time string, or -1 if it is not a valid time."""
+    match = _TIME_PATTERN.fullmatch(time_string)
+    if match is None:
+        return -1
+    hour_text, minute_text, label = match.groups()
+    period = 'day' if label is None else _PERIODS.get(label.lower())
+    hour = _parse_number(hour_text)
+    minute = _parse_number(minute_text)
+    if period is None or not 1 <= hour <= 12 or not 0 <= minute <= 59:
+        return -1
+    return _ethiopian_minute_of_day(hour, minute, period)
+
+def _whole_minutes(minutes):
+    """Returns `minutes` as an int; float inputs must be whole numbers."""
+    if minutes != int(minutes):
+        raise InvalidTimeError(f"Invalid time: hours and minutes must be whole numbers, got {minutes} minutes.")
+    return int(minutes)
 
 class Time:
     """
     A class to represent and work with Ethiopian time (1-12 hour cycles for day/night).
+
+    There are only 1,440 distinct times, so instances are immutable and
+    interned: every constructor and arithmetic method returns one of a
+    prebuilt table of shared instances, indexed by Gregorian minute of day.
+    Times hash and order by that minute.
     """
-    def __init__(self, hour, minute=0, period='day'):
+    __slots__ = ('_minute_of_day', '_hour', '_minute', '_period', '_formats')
+
+    def __new__(cls, hour, minute=0, period='day'):
         """
-        Constructs a Time instance representing an Ethiopian time. 
+        Returns the Time instance representing an Ethiopian time. 
         
         Args:
             hour (int): The Ethiopian hour (1-12). 
             minute (int): The minute (0-59). 
             period (str): The period ('day' or 'night'). 
         """
-        validate_numeric_inputs('Time.constructor', hour=hour, minute=minute) # 
-        if not 1 <= hour <= 12: # 
-            raise InvalidTimeError(f"Invalid Ethiopian hour: {hour}. Must be between 1 and 12.") # 
-        if not 0 <= minute <= 59: # 
-            raise InvalidTimeError(f"Invalid minute: {minute}. Must be between 0 and 59.") # 
-        if period not in ['day', 'night']: # 
-            raise InvalidTimeError(f"Invalid period: \"{period}\". Must be 'day' or 'night'.") # 
+        validate_numeric_inputs('Time.constructor', hour=hour, minute=minute)
+        if not 1 <= hour <= 12:
+            raise InvalidTimeError(f"Invalid Ethiopian hour: {hour}. Must be between 1 and 12.")
+        if not 0 <= minute <= 59:
+            raise InvalidTimeError(f"Invalid minute: {minute}. Must be between 0 and 59.")
+        if period not in ['day', 'night']:
+            raise InvalidTimeError(f"Invalid period: \"{period}\". Must be 'day' or 'night'.")
 
-        self.hour = hour # 
-        self.minute = minute # 
-        self.period = period # 
+        minute_of_day = _whole_minutes(_ethiopian_minute_of_day(hour, minute, period))
+        if cls is Time:
+            return _INTERNED[minute_of_day]
+        return cls._build(minute_of_day)
+
+    @classmethod
+    def _build(cls, minute_of_day):
+        """Creates a new instance; only used to fill the intern table (and by subclasses)."""
+        time = object.__new__(cls)
+        hour, minute = divmod(minute_of_day, 60)
+        ethiopian_base = (hour - 6) % 24 # Hours since 6 AM, when the Ethiopian day starts
+        time._minute_of_day = minute_of_day
+        time._hour = ethiopian_base % 12 or 12
+        time._minute = minute
+        time._period = 'day' if ethiopian_base < 12 else 'night'
+        time._formats = {}
+        return time
+
+    @property
+    def hour(self):
+        """The Ethiopian hour (1-12)."""
+        return self._hour
+
+    @property
+    def minute(self):
+        """The minute (0-59)."""
+        return self._minute
+
+    @property
+    def period(self):
+        """The period, 'day' or 'night'."""
+        return self._period
 
     @classmethod
     def from_gregorian(cls, hour, minute=0):
         """
         Creates a Time instance from a Gregorian 24-hour time. 
         """
-        validate_numeric_inputs('Time.from_gregorian', hour=hour, minute=minute) # 
-        if not 0 <= hour <= 23: # 
-            raise InvalidTimeError(f"Invalid Gregorian hour: {hour}. Must be between 0 and 23.") # 
-        
-        # Normalize Gregorian hour to an Ethiopian base (where 6 AM is 0)
-        temp_hour = hour - 6 # 
-        if temp_hour < 0: # 
-            temp_hour += 24 # 
+        validate_numeric_inputs('Time.from_gregorian', hour=hour, minute=minute)
+        if not 0 <= hour <= 23:
+            raise InvalidTimeError(f"Invalid Gregorian hour: {hour}. Must be between 0 and 23.")
+        if not 0 <= minute <= 59:
+            raise InvalidTimeError(f"Invalid minute: {minute}. Must be between 0 and 59.")
+        return _INTERNED[_whole_minutes(hour * 60 + minute)]
 
-        period = 'day' if temp_hour < 12 else 'night' # 
-        eth_hour = temp_hour % 12 # 
-        eth_hour = 12 if eth_hour == 0 else eth_hour # 
+    @classmethod
+    def from_minute_of_day(cls, minute_of_day):
+        """Returns the Time for a number of minutes since Gregorian midnight (0-1439)."""
+        validate_numeric_inputs('Time.from_minute_of_day', minute_of_day=minute_of_day)
+        if not 0 <= minute_of_day < 1440:
+            raise InvalidTimeError(f"Invalid minute of day: {minute_of_day}. Must be between 0 and 1439.")
+        return _INTERNED[_whole_minutes(minute_of_day)]
 
-        return cls(eth_hour, minute, period) # 
+    @classmethod
+    def _from_minute_of_day(cls, minute_of_day):
+        """Unvalidated core of `from_minute_of_day`, for values known to be in range."""
+        return _INTERNED[minute_of_day]
+
+    @property
+    def minute_of_day(self):
+        """The number of minutes since Gregorian midnight (0-1439)."""
+        return self._minute_of_day
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Creates a Time instance from the 2 bytes written by `to_bytes`."""
+        try:
+            (minute_of_day,) = _TIME_STRUCT.unpack(data)
+        except (struct.error, TypeError):
+            raise InvalidInputTypeError('Time.from_bytes', 'data', '2-byte buffer', data)
+        return cls.from_minute_of_day(minute_of_day)
+
+    def to_bytes(self):
+        """Returns the time as 2 bytes: its minute of day as a little-endian unsigned 16-bit integer."""
+        return _TIME_STRUCT.pack(self._minute_of_day)
 
     def to_gregorian(self):
         """
         Converts the Ethiopian time to Gregorian 24-hour format. 
         """
-        # Convert Ethiopian 1-12 hour to a 0-11 offset, with 12 o'clock as 0.
-        greg_hour = self.hour % 12 # 
-        
-        if self.period == 'day': # 
-            greg_hour += 6 # 
-        else:  # 'night'
-            greg_hour += 18 # 
-
-        # Handle the 24-hour wrap-around
-        greg_hour %= 24 # 
-        return {'hour': greg_hour, 'minute': self.minute} # 
+        hour, minute = divmod(self._minute_of_day, 60)
+        return {'hour': hour, 'minute': minute}
 
     @classmethod
+    @instrumented('Time.from_string')
     def from_string(cls, time_string):
         """
-        Creates a Time object from a string representation (e.g., "6:30 night", "፮:፴ ማታ"). 
-        """
-        if not isinstance(time_string, str) or not time_string.strip(): # 
-            raise InvalidTimeError("Input must be a non-empty string.") # 
-        if ':' not in time_string: # 
-            raise InvalidTimeError(f"Invalid time string: \"{time_string}\". Must include a ':' separator.") # 
-
-        def parse_number(s):
-            try:
-                return int(s)
-            except ValueError:
-                try:
-                    return to_arabic(s) # 
-                except Exception:
-                    return float('nan') # 
-        
-        parts = time_string.replace(':', ' ').split()
-        if len(parts) < 2: # 
-            raise InvalidTimeError(f"Invalid time string format: \"{time_string}\".") # 
+        Creates a Time object from a string representation (e.g., "6:30 night", "፮:፴ ማታ").
+        The period may be 'day', 'night', 'ጠዋት' or 'ማታ' and defaults to 'day'.
+        """
+        if not isinstance(time_string, str) or not time_string.strip():
+            raise InvalidTimeError("Input must be a non-empty string.")
+        if ':' not in time_string:
+            raise InvalidTimeError(f"Invalid time string: \"{time_string}\". Must include a ':' separator.")
+        minute_of_day = _parse_minute_of_day(time_string)
+        if minute_of_day < 0:
+            raise InvalidTimeError(f"Invalid time string: \"{time_string}\".")
+        return _INTERNED[minute_of_day] if cls is Time else cls._build(minute_of_day)
 
-        hour = parse_number(parts[0]) # 
-        minute = parse_number(parts[1]) # 
+    @classmethod
+    @instrumented('Time.parse_many')
+    def parse_many(cls, time_strings):
+        """
+        Parses many time strings in the `from_string` format without raising.
 
-        if hour != hour or minute != minute: # Check for NaN
-            raise InvalidTimeError(f"Invalid number in time string: \"{time_string}\"") # 
+        Args:
+            time_strings (iterable of str): The strings to parse.
 
-        period = 'day' # 
-        if len(parts) > 2: # 
-            period_str = parts[2].lower() # 
-            if period_str in ['night', 'ማታ']: # 
-                period = 'night' # 
-        
-        return cls(hour, minute, period) # 
+        Returns:
+            tuple: (minutes, errors), two arrays as long as the input:
+            `minutes` (array('H')) holds each time's `minute_of_day` (0 where
+            invalid), and `errors` (array('B')) is 1 where the string is not
+            a valid time. `packing.unpack_times(minutes)` returns the Time instances.
+        """
+        minutes = array('H')
+        errors = array('B')
+        parsed = {} # Logs repeat the same strings many times
+        for time_string in time_strings:
+            minute_of_day = parsed.get(time_string) if isinstance(time_string, str) else -1
+            if minute_of_day is None:
+                minute_of_day = parsed[time_string] = _parse_minute_of_day(time_string)
+            if minute_of_day < 0:
+                minutes.append(0)
+                errors.append(1)
+            else:
+                minutes.append(minute_of_day)
+                errors.append(0)
+        return minutes, errors
 
     def add(self, duration):
         """
@@ -111,11 +215,7 @@ class Time:
         hours = duration.get('hours', 0)
         minutes = duration.get('minutes', 0)
         validate_numeric_inputs('Time.add', hours=hours, minutes=minutes)
-        
-        greg = self.to_gregorian()
-        total_minutes = (greg['hour'] * 60 + greg['minute'] + hours * 60 + minutes) % 1440
-
-        return Time.from_gregorian(total_minutes // 60, total_minutes % 60)
+        return _INTERNED[int(self._minute_of_day + hours * 60 + minutes) % 1440]
     
     def subtract(self, duration):
         """
@@ -136,13 +236,7 @@ class Time:
         if not isinstance(other_time, Time):
             raise InvalidTimeError('Can only compare with another Time instance.')
         
-        t1 = self.to_gregorian()
-        t2 = other_time.to_gregorian()
-        
-        total_minutes1 = t1['hour'] * 60 + t1['minute']
-        total_minutes2 = t2['hour'] * 60 + t2['minute']
-        
-        diff = abs(total_minutes1 - total_minutes2)
+        diff = abs(self._minute_of_day - other_time._minute_of_day)
         
         # The shortest path around a 24h clock
         if diff > 720: # 720 minutes = 12 hours
@@ -151,7 +245,14 @@ class Time:
         return {'hours': diff // 60, 'minutes': diff % 60}
     
     def format(self, lang=None, use_geez=None, show_period=True, zero_as_dash=True):
-        """Formats the time as a string."""
+        """Formats the time as a string. Results are cached per instance and options."""
+        key = (lang, use_geez, show_period, zero_as_dash)
+        formatted = self._formats.get(key)
+        if formatted is None:
+            formatted = self._formats[key] = self._format(lang, use_geez, show_period, zero_as_dash)
+        return formatted
+
+    def _format(self, lang, use_geez, show_period, zero_as_dash):
         # Set intelligent defaults if arguments are not provided
         if use_geez is None:
             use_geez = True
@@ -180,6 +281,16 @@ class Time:
 
         return f"{hour_str}:{minute_str}{period_label}"
         
+    def __reduce__(self):
+        # Pickle as a single integer, restored to the interned instance.
+        return (_restore_time, (self._minute_of_day,))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
     def __repr__(self):
         return f"Time(hour={self.hour}, minute={self.minute}, period='{self.period}')"
 
@@ -190,7 +301,30 @@ class Time:
         """Checks if two Time objects are equal."""
         if not isinstance(other, Time):
             return NotImplemented
-        return (self.hour == other.hour and
-                self.minute == other.minute and
-                self.period == other.period)
+        return self._minute_of_day == other._minute_of_day
+
+    def __hash__(self):
+        return self._minute_of_day
+
+    def __lt__(self, other):
+        if not isinstance(other, Time):
+            return NotImplemented
+        return self._minute_of_day < other._minute_of_day
+
+    def __le__(self, other):
+        if not isinstance(other, Time):
+            return NotImplemented
+        return self._minute_of_day <= other._minute_of_day
+
+    def __gt__(self, other):
+        if not isinstance(other, Time):
+            return NotImplemented
+        return self._minute_of_day > other._minute_of_day
+
+    def __ge__(self, other):
+        if not isinstance(other, Time):
+            return NotImplemented
+        return self._minute_of_day >= other._minute_of_day
 
+# Every possible time, by Gregorian minute of day.
+_INTERNED = tuple(Time._build(minute_of_day) for minute_of_day in range(1440))
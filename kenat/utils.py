@@ -1,4 +1,59 @@
+import contextlib
+import contextvars
 from .exceptions import InvalidInputTypeError
+from .cache import memoize
+
+# --- Validation Mode ---
+
+VALIDATION_MODES = ('strict', 'fast', 'off')
+
+_validation_mode = 'strict'
+_validation_override = contextvars.ContextVar('kenat_validation_mode', default=None)
+
+def _check_validation_mode(mode):
+    if mode not in VALIDATION_MODES:
+        raise ValueError(f"Invalid validation mode: {mode!r}. Must be one of {VALIDATION_MODES}.")
+    return mode
+
+def get_validation_mode():
+    """
+    Returns the validation mode currently in effect ('strict', 'fast' or 'off').
+    A mode set with the `validation_mode` context manager takes precedence
+    over the library-wide mode.
+    """
+    return _validation_override.get() or _validation_mode
+
+def set_validation_mode(mode):
+    """
+    Sets the library-wide validation mode.
+
+    Modes:
+        'strict': Every argument is type-checked and NaN values are rejected (default).
+        'fast':   Only the cheap isinstance checks are performed.
+        'off':    Type validation is skipped entirely. Intended for trusted
+                  batch pipelines whose inputs are already known to be valid.
+
+    Range checks that decide whether a date exists (e.g. month 14) are
+    always performed, regardless of the mode.
+    """
+    global _validation_mode
+    _validation_mode = _check_validation_mode(mode)
+
+@contextlib.contextmanager
+def validation_mode(mode):
+    """
+    Context manager that temporarily switches the validation mode.
+    The override is local to the current thread (or asyncio task).
+
+    Example:
+        with validation_mode('off'):
+            dates = [to_ec(y, m, d) for y, m, d in trusted_rows]
+    """
+    token = _validation_override.set(_check_validation_mode(mode))
+    try:
+        yield
+    finally:
+        _validation_override.reset(token)
 
 # --- Validation Helpers ---
 
@@ -9,8 +64,12 @@ def validate_numeric_inputs(func_name, **kwargs):
     Raises:
         InvalidInputTypeError: If any value is not a number.
     """
+    mode = _validation_override.get() or _validation_mode
+    if mode == 'off':
+        return
+    strict = mode == 'strict'
     for name, value in kwargs.items():
-        if not isinstance(value, (int, float)) or value != value: # Checks for NaN
+        if not isinstance(value, (int, float)) or (strict and value != value): # Checks for NaN
             raise InvalidInputTypeError(func_name, name, 'number', value)
 
 def validate_ethiopian_date_object(date_obj, func_name, param_name):
@@ -20,16 +79,16 @@ def validate_ethiopian_date_object(date_obj, func_name, param_name):
     Raises:
         InvalidInputTypeError: If the object is not a dict or its components are not numbers.
     """
+    mode = _validation_override.get() or _validation_mode
+    if mode == 'off':
+        return
     if not isinstance(date_obj, dict):
         raise InvalidInputTypeError(func_name, param_name, 'dict', date_obj)
-    validate_numeric_inputs(
-        func_name,
-        **{
-            f'{param_name}.year': date_obj.get('year'),
-            f'{param_name}.month': date_obj.get('month'),
-            f'{param_name}.day': date_obj.get('day'),
-        }
-    )
+    strict = mode == 'strict'
+    for field in ('year', 'month', 'day'):
+        value = date_obj.get(field)
+        if not isinstance(value, (int, float)) or (strict and value != value):
+            raise InvalidInputTypeError(func_name, f'{param_name}.{field}', 'number', value)
 
 # --- Date Property Helpers ---
 
@@ -59,9 +118,14 @@ def get_weekday(eth_date):
     """
     Returns the weekday (0=Sunday, 6=Saturday) for a given Ethiopian date.
     """
+    return _weekday(eth_date['year'], eth_date['month'], eth_date['day'])
+
+@memoize('weekday', maxsize=8192)
+def _weekday(year, month, day):
+    """Cached core of `get_weekday`."""
     # Import locally to prevent circular dependency with the 'conversions' module
     from . import conversions
-    g = conversions.to_gc(eth_date['year'], eth_date['month'], eth_date['day'])
+    g = conversions.to_gc(year, month, day)
     # The getDay() method in JS returns 0 for Sunday, which matches Python's isoweekday() % 7 behavior.
     # Python's weekday() is 0 for Monday. JS getDay() is 0 for Sunday.
     # The source new Date(...).getDay() is 0 for Sunday.
@@ -0,0 +1,92 @@
+import datetime
+import pytest
+
+pa = pytest.importorskip('pyarrow')
+pq = pytest.importorskip('pyarrow.parquet')
+
+from kenat import Kenat, to_ec, to_gc
+from kenat import arrow as kenat_arrow
+from kenat.exceptions import InvalidEthiopianDateError, InvalidGregorianDateError
+
+GREGORIAN = [datetime.date(2023, 9, 1) + datetime.timedelta(days=i) for i in range(400)]
+
+
+@pytest.fixture
+def dates():
+    return pa.array(GREGORIAN[:200] + [None] + GREGORIAN[200:], type=pa.date32())
+
+
+def test_from_date32_matches_to_ec(dates):
+    ethiopian = kenat_arrow.from_date32(dates)
+    assert isinstance(ethiopian.type, kenat_arrow.EthiopianDateType)
+    assert ethiopian.storage.type == pa.int32()
+    assert ethiopian.null_count == 1
+    for greg, eth in zip(dates.to_pylist(), ethiopian.to_pylist()):
+        if greg is None:
+            assert eth is None
+        else:
+            assert eth == Kenat(greg)
+
+
+def test_to_date32_round_trip(dates):
+    assert kenat_arrow.to_date32(kenat_arrow.from_date32(dates)).equals(dates)
+
+
+def test_to_ymd_from_gregorian_and_ethiopian(dates):
+    years, months, days = kenat_arrow.to_ymd(dates)
+    assert (years.type, months.type, days.type) == (pa.int32(), pa.int8(), pa.int8())
+    expected = [to_ec(d.year, d.month, d.day) if d else None for d in dates.to_pylist()]
+    assert [
+        {'year': y, 'month': m, 'day': d} if y is not None else None
+        for y, m, d in zip(years.to_pylist(), months.to_pylist(), days.to_pylist())
+    ] == expected
+    assert kenat_arrow.to_ymd(kenat_arrow.from_date32(dates))[0].equals(years)
+
+
+def test_from_ymd_validates_and_propagates_nulls():
+    ethiopian = kenat_arrow.from_ymd([2015, 2016, None], [13, 1, 1], [6, 1, 1])
+    assert ethiopian.to_pylist() == [Kenat(2015, 13, 6), Kenat(2016, 1, 1), None]
+    assert kenat_arrow.to_date32(ethiopian).to_pylist()[:2] == [to_gc(2015, 13, 6), to_gc(2016, 1, 1)]
+    with pytest.raises(InvalidEthiopianDateError):
+        kenat_arrow.from_ymd([2016], [13], [6])
+
+
+def test_out_of_range_gregorian_dates_raise():
+    with pytest.raises(InvalidGregorianDateError):
+        kenat_arrow.from_date32(pa.array([datetime.date(1899, 12, 31)], type=pa.date32()))
+
+
+def test_chunked_arrays_stay_chunked(dates):
+    chunked = pa.chunked_array([dates.slice(0, 100), dates.slice(100)])
+    ethiopian = kenat_arrow.from_date32(chunked)
+    assert ethiopian.num_chunks == 2
+    assert kenat_arrow.to_date32(ethiopian).combine_chunks().equals(dates)
+    assert [column.num_chunks for column in kenat_arrow.to_ymd(chunked)] == [2, 2, 2]
+
+
+def test_timestamps_use_their_date():
+    stamps = pa.array([datetime.datetime(2024, 1, 1, 23, 30)], type=pa.timestamp('s'))
+    assert kenat_arrow.from_date32(stamps).to_pylist() == [Kenat(2016, 4, 22)]
+
+
+def test_parquet_round_trip_preserves_type(tmp_path, dates):
+    table = kenat_arrow.with_ethiopian_columns(pa.table({'date': dates}), 'date')
+    assert table.column_names == ['date', 'date_ec', 'date_ec_year', 'date_ec_month', 'date_ec_day']
+    path = tmp_path / 'dates.parquet'
+    pq.write_table(table, path)
+    result = pq.read_table(path)
+    assert result.schema == table.schema
+    assert result.equals(table)
+
+
+def test_pandas_round_trip(tmp_path, dates):
+    pytest.importorskip('pandas')
+    import kenat.pandas
+
+    frame = pa.table({'date_ec': kenat_arrow.from_date32(dates)}).to_pandas()
+    assert str(frame['date_ec'].dtype) == 'ethiopian_date'
+    assert frame['date_ec'].isna().sum() == 1
+    path = tmp_path / 'frame.parquet'
+    pq.write_table(pa.Table.from_pandas(frame), path)
+    restored = pq.read_table(path).to_pandas()
+    assert restored['date_ec'].equals(frame['date_ec'])
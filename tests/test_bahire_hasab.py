@@ -75,6 +75,12 @@ class TestBahireHasab:
             assert abiy_tsome['ethiopian'] == {'year': 2016, 'month': 7, 'day': 2}
             assert abiy_tsome['name'] == 'Great Lent'
 
+        @pytest.mark.parametrize("year, expected_day", [(1987, 15), (2006, 12), (2025, 16)])
+        def test_should_treat_a_zero_metqi_as_thirty(self, year, expected_day):
+            # Years with medeb 1 have a remainder of 0, which the computus reads as 30
+            assert get_bahire_hasab(year)['metqi'] == 30
+            assert get_movable_holiday('TINSAYE', year) == {'year': year, 'month': 8, 'day': expected_day}
+
     # A final nested class for error handling.
     class TestErrorHandling:
         """
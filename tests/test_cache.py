@@ -0,0 +1,141 @@
+import pytest
+import kenat
+from kenat import to_ec, to_gc, get_holidays_for_year, get_holidays_in_month, get_bahire_hasab, to_geez
+from kenat.cache import LRUCache, memoize
+
+
+@pytest.fixture(autouse=True)
+def fresh_caches():
+    kenat.cache_clear()
+    yield
+    kenat.cache_clear()
+
+
+def test_cache_info_lists_every_cache():
+    info = kenat.cache_info()
+    for name in ('to_ec', 'to_gc', 'weekday', 'to_geez', 'to_arabic', 'bahire_hasab',
+                 'islamic_holidays', 'holiday_index', 'month_calendar'):
+        assert set(info[name]) == {'hits', 'misses', 'size', 'maxsize', 'evictions'}
+
+
+def test_hits_and_misses_are_counted():
+    to_ec(2024, 5, 23)
+    to_ec(2024, 5, 23)
+    info = kenat.cache_info()['to_ec']
+    assert (info['hits'], info['misses'], info['size']) == (1, 1, 1)
+
+
+def test_cached_results_are_not_shared_with_callers():
+    first = to_ec(2024, 5, 23)
+    first['year'] = 0
+    assert to_ec(2024, 5, 23) == {'year': 2016, 'month': 9, 'day': 15}
+
+    holidays = get_holidays_for_year(2016)
+    holidays.pop()
+    assert len(get_holidays_for_year(2016)) == len(holidays) + 1
+    # Holiday records are shared between calls, so they are immutable
+    with pytest.raises(TypeError):
+        holidays[0]['ethiopian']['day'] = 99
+    with pytest.raises(AttributeError):
+        holidays[0].name = 'mutated'
+    with pytest.raises(TypeError):
+        holidays[0]['tags'].append('mutated')
+
+    bahire_hasab = get_bahire_hasab(2016)
+    bahire_hasab['nineveh']['day'] = 99
+    assert get_bahire_hasab(2016)['nineveh']['day'] != 99
+
+
+def test_holiday_queries_share_the_year_index():
+    get_holidays_for_year(2016)
+    for month in range(1, 14):
+        get_holidays_in_month(2016, month, lang='english')
+    info = kenat.cache_info()['holiday_index']
+    assert info['misses'] == 1
+    assert info['hits'] == 13
+
+
+def test_cache_clear_single_cache():
+    to_ec(2024, 5, 23)
+    to_geez(2016)
+    kenat.cache_clear('to_ec')
+    info = kenat.cache_info()
+    assert info['to_ec']['size'] == 0
+    assert info['to_geez']['size'] == 1
+
+
+def test_unknown_cache_name_raises():
+    with pytest.raises(ValueError):
+        kenat.cache_clear('nope')
+
+
+def test_set_cache_maxsize_evicts_least_recently_used():
+    kenat.set_cache_maxsize('to_geez', 2)
+    try:
+        to_geez(1)
+        to_geez(2)
+        to_geez(1) # Refresh 1 so that 2 is evicted next
+        to_geez(3)
+        info = kenat.cache_info()['to_geez']
+        assert (info['size'], info['evictions'], info['maxsize']) == (2, 1, 2)
+        to_geez(1)
+        assert kenat.cache_info()['to_geez']['hits'] == 2
+    finally:
+        kenat.set_cache_maxsize('to_geez', 4096)
+
+
+def test_stale_reference_flags_give_no_second_chance():
+    cache = LRUCache('test_stale', 1)
+    cache.store('a', 1)
+    cache.lookup('a')
+    cache.store('b', 2) # 'a' gets its second chance, then 'b' is evicted
+    cache._referenced['b'] = True # As left by a lookup racing with that eviction
+    cache.store('b', 2)
+    cache.store('c', 3)
+    assert list(cache._data) == ['c'] and not cache._referenced
+
+
+def test_invalid_maxsize_raises():
+    with pytest.raises(ValueError):
+        kenat.set_cache_maxsize('to_geez', -1)
+
+
+def test_caching_context_manager_bypasses_caches():
+    with kenat.caching(enabled=False):
+        assert to_gc(2016, 9, 15).isoformat() == '2024-05-23'
+        get_holidays_for_year(2016)
+    info = kenat.cache_info()
+    assert info['to_gc']['size'] == 0
+    assert info['holiday_index']['size'] == 0
+
+
+def test_warmup_populates_year_caches():
+    kenat.warmup(range(2015, 2017))
+    info = kenat.cache_info()
+    assert info['holiday_index']['size'] == 2
+    assert info['month_calendar']['size'] == 26
+    get_holidays_for_year(2016)
+    assert kenat.cache_info()['holiday_index']['hits'] == 1
+
+
+def test_exceptions_are_not_cached():
+    calls = []
+
+    @memoize('test_exceptions', maxsize=4)
+    def flaky(value):
+        calls.append(value)
+        raise RuntimeError(value)
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            flaky(1)
+    assert calls == [1, 1]
+
+
+def test_unhashable_arguments_bypass_the_cache():
+    @memoize('test_unhashable', maxsize=4)
+    def total(values):
+        return sum(values)
+
+    assert total([1, 2]) == 3
+    assert kenat.cache_info()['test_unhashable']['size'] == 0
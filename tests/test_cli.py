@@ -0,0 +1,118 @@
+import json
+import pytest
+
+from kenat import cli
+
+
+def run(tmp_path, content, *args, name='in.csv'):
+    source = tmp_path / name
+    source.write_text(content, encoding='utf-8')
+    output = tmp_path / 'out'
+    status = cli.main(['convert', str(source), '-o', str(output), *args])
+    return status, output.read_text(encoding='utf-8')
+
+
+CSV = 'id,date,note\n1,2024-01-01,a\n2,,b\n3,2023-09-12T08:00:00,c\n'
+
+
+class TestParsing:
+    @pytest.mark.parametrize('value, expected', [
+        ('2016/04/22', (2016, 4, 22)),
+        ('2016-4-22', (2016, 4, 22)),
+        ('Tahsas 22 2016', (2016, 4, 22)),
+        ('ታህሳስ ፳፪ ፳፻፲፮', (2016, 4, 22)),
+        ('ሰኞ, ታህሳስ 22 2016', (2016, 4, 22)),
+        ('መስከረም ፭ ፳፻፲፮', (2016, 1, 5)),
+        ('፳፻፲፮/፩/፭', (2016, 1, 5)),
+        ('፳፻፲፮-፬-፳፪', (2016, 4, 22)),
+    ])
+    def test_parse_ethiopian(self, value, expected):
+        assert cli.parse_ethiopian(value) == expected
+
+    def test_parse_ethiopian_rejects_unknown_formats(self):
+        with pytest.raises(cli.InvalidDateFormatError):
+            cli.parse_ethiopian('Smarch 1 2016')
+
+    def test_parse_gregorian_ignores_time(self):
+        assert cli.parse_gregorian('2024-01-01T10:00:00Z') == (2024, 1, 1)
+        assert cli.parse_gregorian('2024-01-01 10:00') == (2024, 1, 1)
+
+
+class TestCsv:
+    def test_converts_in_place_and_keeps_empty_values(self, tmp_path):
+        status, output = run(tmp_path, CSV, '-c', 'date')
+        assert status == 0
+        assert output == 'id,date,note\n1,2016/04/22,a\n2,,b\n3,2016/01/01,c\n'
+
+    @pytest.mark.parametrize('date_format, expected', [
+        ('iso', '2016-04-22'),
+        ('standard', 'Tahsas 22 2016'),
+        ('geez', 'ታህሳስ ፳፪ ፳፻፲፮'),
+    ])
+    def test_formats_and_suffix(self, tmp_path, date_format, expected):
+        _, output = run(tmp_path, CSV, '-c', 'date', '-f', date_format, '--lang', 'english', '--suffix', '_ec')
+        lines = output.splitlines()
+        assert lines[0] == 'id,date,note,date_ec'
+        assert lines[1] == f'1,2024-01-01,a,{expected}'
+
+    def test_geez_output_round_trips(self, tmp_path):
+        dates = 'date\n2023-09-12\n2023-09-16\n2024-01-01\n2024-09-10\n'
+        _, geez = run(tmp_path, dates, '-c', 'date', '-f', 'geez')
+        assert geez.splitlines()[2] == 'መስከረም ፭ ፳፻፲፮'
+        _, back = run(tmp_path, geez, '-c', 'date', '--to', 'gc', name='geez.csv')
+        assert back == dates
+
+    def test_to_gregorian(self, tmp_path):
+        _, output = run(tmp_path, 'date\n2016/13/5\nመስከረም 1 2017\n', '--to', 'gc', '-c', 'date')
+        assert output == 'date\n2024-09-10\n2024-09-11\n'
+
+    def test_bad_rows_go_to_the_error_file(self, tmp_path):
+        errors = tmp_path / 'errors.csv'
+        status, output = run(tmp_path, CSV + '4,2024-02-30,d\n5,1850-01-01,e\n', '-c', 'date',
+                             '--errors', str(errors))
+        assert status == 0
+        assert output.splitlines()[-1] == '3,2016/01/01,c'
+        lines = errors.read_text(encoding='utf-8').splitlines()
+        assert lines[0] == 'row,id,date,note,error'
+        assert lines[1].startswith('4,4,2024-02-30,d,date: ')
+        assert lines[2].startswith('5,5,1850-01-01,e,date: ')
+
+    def test_bad_row_stops_without_error_file(self, tmp_path):
+        with pytest.raises(SystemExit, match='row 2: date'):
+            run(tmp_path, 'date\n2024-01-01\nnot a date\n', '-c', 'date')
+
+    def test_unknown_column(self, tmp_path):
+        with pytest.raises(SystemExit, match='missing'):
+            run(tmp_path, CSV, '-c', 'missing')
+
+    def test_quoted_fields_may_span_lines(self, tmp_path):
+        content = 'note,date\n"two\nlines, ""quoted""",2024-01-01\nplain,2024-01-02\n'
+        _, output = run(tmp_path, content, '-c', 'date', '--batch-size', '1')
+        assert output == 'note,date\n"two\nlines, ""quoted""",2016/04/22\nplain,2016/04/23\n'
+
+    def test_workers_and_batches_keep_order(self, tmp_path):
+        dates = [f'2024-{month:02d}-{day:02d}' for month in range(1, 13) for day in range(1, 29)]
+        content = 'date\n' + '\n'.join(dates) + '\n'
+        _, expected = run(tmp_path, content, '-c', 'date')
+        _, output = run(tmp_path, content, '-c', 'date', '--workers', '2', '--batch-size', '7')
+        assert output == expected
+
+
+class TestJsonLines:
+    def test_converts_records(self, tmp_path):
+        content = '{"id": 1, "date": "2024-01-01"}\n\n{"id": 2, "date": null}\n'
+        status, output = run(tmp_path, content, '-c', 'date', '--suffix', '_ec', name='in.jsonl')
+        assert status == 0
+        assert [json.loads(line) for line in output.splitlines()] == [
+            {'id': 1, 'date': '2024-01-01', 'date_ec': '2016/04/22'},
+            {'id': 2, 'date': None, 'date_ec': None},
+        ]
+
+    def test_bad_records_go_to_the_error_file(self, tmp_path):
+        errors = tmp_path / 'errors.jsonl'
+        content = '{"date": "2016/04/22"}\n{"date": 5}\n[1]\n{bad json\n'
+        _, output = run(tmp_path, content, '--to', 'gc', '-c', 'date', '--errors', str(errors), name='in.jsonl')
+        assert output == '{"date": "2024-01-01"}\n'
+        failed = [json.loads(line) for line in errors.read_text(encoding='utf-8').splitlines()]
+        assert [entry['record'] for entry in failed] == [2, 3, 4]
+        assert failed[0]['input'] == '{"date": 5}'
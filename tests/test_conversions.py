@@ -1,7 +1,9 @@
 import pytest
 import datetime
-from kenat.conversions import to_ec, to_gc
-from kenat.exceptions import InvalidGregorianDateError, InvalidEthiopianDateError
+from array import array
+from kenat import Kenat
+from kenat.conversions import to_ec, to_gc, from_timestamps, _from_timestamps_python
+from kenat.exceptions import InvalidGregorianDateError, InvalidEthiopianDateError, InvalidInputTypeError
 
 class TestEthiopianToGregorian:
     """
@@ -65,4 +67,63 @@ class TestGregorianToEthiopian:
             
     def test_invalid_date_throws_error(self):
         with pytest.raises(InvalidGregorianDateError):
-            to_ec(2023, 2, 29) # Not a leap year
\ No newline at end of file
+            to_ec(2023, 2, 29) # Not a leap year
+
+
+class TestFromTimestamps:
+    """
+    Tests `from_timestamps` against `Kenat(datetime)`, with and without numpy.
+    """
+    # 2024-01-01 03:15, 05:59, 06:00 and 18:30 at UTC+3
+    TIMESTAMPS = [1704068100, 1704077940, 1704078000, 1704123000]
+
+    @staticmethod
+    def _expected(timestamp, utc_offset=3 * 3600):
+        local = datetime.datetime(1970, 1, 1) + datetime.timedelta(seconds=timestamp + utc_offset)
+        date = Kenat(local)
+        return (date.year, date.month, date.day, date.time.hour, date.time.minute, date.time.period)
+
+    @pytest.fixture(params=['numpy', 'python'])
+    def convert(self, request):
+        if request.param == 'numpy':
+            pytest.importorskip('numpy')
+            return from_timestamps
+        return lambda timestamps, utc_offset=3 * 3600: _from_timestamps_python(timestamps, utc_offset)
+
+    def test_matches_kenat(self, convert):
+        columns = convert(array('q', self.TIMESTAMPS))
+        rows = list(zip(*(list(column) for column in columns)))
+        assert rows == [self._expected(timestamp) for timestamp in self.TIMESTAMPS]
+        assert rows[0] == (2016, 4, 22, 9, 15, 'night')
+        assert rows[2] == (2016, 4, 22, 12, 0, 'day')
+
+    def test_utc_offset_and_float_input(self, convert):
+        years, months, days, hours, minutes, periods = convert([0.5, 59.9], utc_offset=0)
+        assert list(zip(years, months, days, hours, minutes, periods)) == [self._expected(0, 0)] * 2
+
+    def test_memoryview_input(self, convert):
+        columns = convert(memoryview(array('q', self.TIMESTAMPS)))
+        assert [column[3] for column in columns] == list(self._expected(self.TIMESTAMPS[3]))
+
+    def test_out_of_range_throws_error(self, convert):
+        with pytest.raises(InvalidGregorianDateError):
+            convert([-3_000_000_000])
+
+    @pytest.mark.parametrize('timestamp, date', [
+        (1e20, {'year': 9999, 'month': 12, 'day': 31}),
+        (-1e20, {'year': 1, 'month': 1, 'day': 1}),
+        (4_133_980_800 - 3 * 3600, {'year': 2101, 'month': 1, 'day': 1}),
+    ])
+    def test_far_out_of_range_throws_the_same_error(self, convert, timestamp, date):
+        with pytest.raises(InvalidGregorianDateError) as error:
+            convert([timestamp])
+        assert error.value.date == date
+
+    @pytest.mark.parametrize('timestamp', [float('nan'), float('inf')])
+    def test_non_finite_input_throws_error(self, convert, timestamp):
+        with pytest.raises(InvalidInputTypeError):
+            convert([timestamp])
+
+    def test_non_numeric_input_throws_error(self, convert):
+        with pytest.raises(InvalidInputTypeError):
+            convert(['1704068100'])
@@ -0,0 +1,96 @@
+import datetime
+import pickle
+import pytest
+
+from kenat import EthiopianDateTime, Kenat, Time
+from kenat.exceptions import InvalidEthiopianDateError, InvalidInputTypeError
+
+
+class TestConstruction:
+    def test_default_time_is_start_of_day(self):
+        start = EthiopianDateTime(2016, 1, 1)
+        assert start.time == Time(12, 0, 'day')
+        assert start.to_datetime() == datetime.datetime(2023, 9, 12, 6, 0)
+
+    def test_night_hours_after_midnight_belong_to_the_same_ethiopian_date(self):
+        late = EthiopianDateTime(2016, 1, 1, Time(11, 0, 'night'))
+        assert late.to_datetime() == datetime.datetime(2023, 9, 13, 5, 0)
+        assert (late.year, late.month, late.day) == (2016, 1, 1)
+        assert late > EthiopianDateTime(2016, 1, 1, Time(1, 0, 'night'))
+
+    def test_invalid_inputs(self):
+        with pytest.raises(InvalidEthiopianDateError):
+            EthiopianDateTime(2015, 13, 7)
+        with pytest.raises(InvalidInputTypeError):
+            EthiopianDateTime(2016, 1, 1, '10:00')
+        with pytest.raises(InvalidInputTypeError):
+            EthiopianDateTime('2016', 1, 1)
+
+    def test_is_immutable_value(self):
+        with pytest.raises(AttributeError):
+            EthiopianDateTime(2016, 1, 1).extra = 1
+
+
+class TestConversions:
+    def test_datetime_round_trip_across_the_day_boundary(self):
+        for minutes in range(0, 3 * 1440, 13):
+            value = datetime.datetime(2024, 1, 1) + datetime.timedelta(minutes=minutes)
+            assert EthiopianDateTime.from_datetime(value).to_datetime() == value
+
+    def test_from_datetime_before_6am_is_previous_ethiopian_date(self):
+        value = EthiopianDateTime.from_datetime(datetime.datetime(2024, 1, 1, 3, 15))
+        assert value.get_ethiopian() == Kenat(datetime.date(2023, 12, 31)).get_ethiopian()
+        assert value.time == Time(9, 15, 'night')
+
+    def test_timestamp_uses_utc_offset(self):
+        local = datetime.datetime(2024, 1, 1, 3, 15)
+        timestamp = int(local.replace(tzinfo=datetime.timezone(datetime.timedelta(hours=3))).timestamp())
+        value = EthiopianDateTime.from_timestamp(timestamp)
+        assert value == EthiopianDateTime.from_datetime(local)
+        assert value.to_timestamp() == timestamp
+        assert EthiopianDateTime.from_timestamp(timestamp + 59) == value
+        assert EthiopianDateTime.from_timestamp(timestamp, utc_offset=0).to_datetime() == datetime.datetime(2024, 1, 1, 0, 15)
+
+    def test_kenat_round_trip(self):
+        date = Kenat(datetime.datetime(2024, 1, 1, 3, 15))
+        value = EthiopianDateTime.from_kenat(date)
+        assert value.to_datetime() == datetime.datetime(2024, 1, 1, 3, 15)
+        assert value.to_kenat() == date
+        assert value.to_kenat().time == date.time
+
+    def test_minutes_round_trip(self):
+        value = EthiopianDateTime(2016, 13, 5, Time(3, 30, 'night'))
+        assert EthiopianDateTime.from_minutes(value.to_minutes()) == value
+        assert value.to_day_number() == Kenat(2016, 13, 5).to_day_number()
+        with pytest.raises(InvalidInputTypeError):
+            EthiopianDateTime.from_minutes('1')
+
+
+class TestArithmetic:
+    def test_add_crosses_day_month_and_year_boundaries(self):
+        value = EthiopianDateTime(2015, 13, 6, Time(11, 0, 'night'))
+        later = value.add(hours=2)
+        assert (later.year, later.month, later.day) == (2016, 1, 1)
+        assert later.time == Time(1, 0, 'day')
+        assert later.add(days=-1, hours=-2) == value.add(days=-1)
+
+    def test_diff_and_ordering(self):
+        a = EthiopianDateTime(2016, 1, 1)
+        b = a.add(days=2, minutes=30)
+        assert b.diff_in_minutes(a) == 2 * 1440 + 30
+        assert sorted([b, a]) == [a, b]
+        assert len({a, a.add(minutes=0), b}) == 2
+        with pytest.raises(InvalidInputTypeError):
+            a.diff_in_minutes(Kenat(2016, 1, 1))
+
+
+class TestFormatting:
+    def test_str_repr_and_format(self):
+        value = EthiopianDateTime(2016, 1, 1, Time(11, 0, 'night'))
+        assert str(value) == '2016/01/01 11:00 night'
+        assert repr(value) == "EthiopianDateTime(year=2016, month=1, day=1, time=Time(hour=11, minute=0, period='night'))"
+        assert value.format() == 'መስከረም 1 2016 11:00 ማታ'
+
+    def test_pickles_as_an_integer(self):
+        value = EthiopianDateTime(2016, 1, 1, Time(11, 0, 'night'))
+        assert pickle.loads(pickle.dumps(value)) == value
@@ -0,0 +1,63 @@
+import datetime
+import json
+import pickle
+import pytest
+
+from kenat import Holiday, Kenat, get_bahire_hasab, get_holiday, get_holidays_for_year
+from kenat.holiday_record import HolidayDate
+
+
+def test_reads_like_the_old_dicts():
+    meskel = get_holiday('meskel', 2016, lang='english')
+    assert meskel['key'] == meskel.key == 'meskel'
+    assert meskel['ethiopian']['day'] == meskel.ethiopian.day == 17
+    assert meskel.get('gregorian') is None and 'gregorian' not in meskel
+    assert meskel == {
+        'key': 'meskel', 'tags': ['public', 'religious', 'christian'], 'movable': False,
+        'name': meskel['name'], 'description': meskel['description'],
+        'ethiopian': {'year': 2016, 'month': 1, 'day': 17},
+    }
+    assert {'year': 2016, 'month': 1, 'day': 17} == meskel['ethiopian']
+    assert meskel['tags'] == ['public', 'religious', 'christian']
+    with pytest.raises(KeyError):
+        meskel['gregorian']
+
+
+def test_records_are_shared_and_immutable():
+    first = get_holidays_for_year(2016, lang='english')
+    again = get_holidays_for_year(2016, lang='english')
+    assert first is not again
+    assert all(a is b for a, b in zip(first, again))
+    with pytest.raises(AttributeError):
+        first[0].name = 'x'
+    with pytest.raises(TypeError):
+        first[0]['name'] = 'x'
+    with pytest.raises(AttributeError):
+        first[0].ethiopian.day = 1
+    with pytest.raises(TypeError):
+        first[0]['tags'].append('x')
+    with pytest.raises(TypeError):
+        first[0].update(name='x')
+
+
+def test_to_dict_pickle_and_hash():
+    fasika = get_holiday('fasika', 2016, lang='english')
+    plain = fasika.to_dict()
+    assert isinstance(plain['ethiopian'], dict) and isinstance(plain['tags'], list)
+    assert json.loads(json.dumps(plain)) == plain
+    assert pickle.loads(pickle.dumps(fasika)) == fasika
+    assert len({fasika, get_holiday('fasika', 2016, lang='english')}) == 1
+    assert repr(HolidayDate(2016, 8, 27)) == 'HolidayDate(year=2016, month=8, day=27)'
+
+
+def test_records_serialize_as_json():
+    year = get_holidays_for_year(2016, lang='english')
+    assert json.loads(json.dumps(year)) == year
+    assert json.loads(json.dumps(Kenat('2016/1/17').is_holiday('english'))) == [get_holiday('meskel', 2016, lang='english')]
+
+
+def test_bahire_hasab_movable_feasts_are_records():
+    fasika = get_bahire_hasab(2016, lang='english')['movableFeasts']['fasika']
+    assert isinstance(fasika, Holiday)
+    assert fasika['gregorian'] == datetime.date(2024, 5, 5)
+    assert fasika is get_bahire_hasab(2016, lang='english')['movableFeasts']['fasika']
@@ -0,0 +1,79 @@
+import pytest
+
+from kenat import Kenat, holiday_rules
+from kenat.bahire_hasab import get_movable_holiday
+from kenat.holidays import _tabular_islamic_occurrences
+from kenat.exceptions import InvalidInputTypeError
+
+
+def test_fixed_ethiopian_date():
+    rule = holiday_rules.fixed(3, 15)
+    assert rule(2016) == (((2016, 3, 15), None),)
+    assert not rule.movable
+
+
+def test_fixed_pagume_6_only_in_leap_years():
+    rule = holiday_rules.fixed(13, 6)
+    assert rule(2015) == (((2015, 13, 6), None),)
+    assert rule(2016) == ()
+
+
+def test_fixed_gregorian_date():
+    assert holiday_rules.fixed(1, 1, calendar='gregorian')(2016) == (((2016, 4, 22), (2024, 1, 1)),)
+    leap_day = holiday_rules.fixed(2, 29, calendar='gregorian')
+    assert leap_day(2016) == (((2016, 6, 21), (2024, 2, 29)),)
+    assert leap_day(2017) == ()
+
+
+@pytest.mark.parametrize("year", [2012, 2016, 2017])
+def test_tewsak_matches_movable_feasts(year):
+    fasika = get_movable_holiday('TINSAYE', year)
+    assert holiday_rules.tewsak(69)(year)[0][0] == (fasika['year'], fasika['month'], fasika['day'])
+
+
+def test_tewsak_drops_dates_outside_the_year():
+    assert holiday_rules.tewsak(-400)(2016) == ()
+
+
+def test_hijri_uses_tabular_calendar():
+    assert holiday_rules.hijri(10, 1)(2016) == _tabular_islamic_occurrences(2016, 10, 1)
+
+
+def test_nth_weekday_ethiopian():
+    # Meskerem 2016 starts on a Tuesday
+    assert holiday_rules.nth_weekday(1, 0, 1)(2016) == (((2016, 1, 6), (2023, 9, 17)),)
+    assert holiday_rules.nth_weekday(1, 0, -1)(2016) == (((2016, 1, 27), (2023, 10, 8)),)
+    assert holiday_rules.nth_weekday(1, 2, 5)(2016)[0][0] == (2016, 1, 29)
+    assert holiday_rules.nth_weekday(1, 0, 5)(2016) == ()
+
+
+def test_nth_weekday_gregorian():
+    thanksgiving = holiday_rules.nth_weekday(11, 4, 4, calendar='gregorian')
+    date = thanksgiving(2016)[0]
+    assert date[1] == (2023, 11, 23)
+    assert Kenat(*date[0]).weekday() == 4
+
+
+@pytest.mark.parametrize("factory, args", [
+    (holiday_rules.fixed, (14, 1)),
+    (holiday_rules.fixed, (13, 7)),
+    (holiday_rules.fixed, (2, 30, 'gregorian')),
+    (holiday_rules.fixed, (1, 1, 'julian')),
+    (holiday_rules.tewsak, ('69',)),
+    (holiday_rules.tewsak, (1.5,)),
+    (holiday_rules.hijri, (13, 1)),
+    (holiday_rules.nth_weekday, (1, 7, 1)),
+    (holiday_rules.nth_weekday, (1, 0, 0)),
+    (holiday_rules.nth_weekday, (13, 0, 1, 'gregorian')),
+])
+def test_invalid_rules_are_rejected(factory, args):
+    with pytest.raises(InvalidInputTypeError):
+        factory(*args)
+
+
+def test_custom_evaluator():
+    rule = holiday_rules.HolidayRule(lambda year: (((year, 2, 2), None),), movable=False, description='Tikimt 2')
+    assert rule(2016) == (((2016, 2, 2), None),)
+    assert repr(rule) == 'HolidayRule(Tikimt 2)'
+    with pytest.raises(InvalidInputTypeError):
+        holiday_rules.HolidayRule('not callable')
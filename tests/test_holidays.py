@@ -1,5 +1,13 @@
+import datetime
+import json
 import pytest
-from kenat.holidays import get_holidays_in_month, get_holiday
+from kenat import Kenat, holiday_rules, holidays
+from kenat.conversions import to_gc
+from kenat.holidays import (
+    get_holidays_in_month, get_holiday, get_holidays_for_year,
+    get_holidays_for_gregorian_year, get_holidays_in_gregorian_month,
+    holiday_mask, holiday_keys,
+)
 from kenat.bahire_hasab import get_movable_holiday
 from kenat.exceptions import InvalidInputTypeError, UnknownHolidayError
 
@@ -103,3 +111,236 @@ def test_returns_correct_eid_adha_date_2016():
     holiday = get_holiday('eidAdha', 2016)
     assert holiday is not None
     assert holiday['ethiopian'] == {'year': 2016, 'month': 10, 'day': 9}
+
+
+# -------------------
+# Vectorized lookups
+# -------------------
+
+def test_holiday_keys_and_mask_across_years():
+    dates = [Kenat(2016, 1, 1), Kenat(2016, 1, 2), Kenat(2016, 8, 1), Kenat(2017, 1, 17), Kenat(2016, 4, 29)]
+    assert holiday_keys(dates) == [('enkutatash',), (), ('eidFitr',), ('meskel',), ('gena',)]
+    assert [bool(v) for v in holiday_mask(dates)] == [True, False, True, True, True]
+    assert [bool(v) for v in holiday_mask(dates, filter_by='muslim')] == [False, False, True, False, False]
+    assert holiday_keys(dates, filter_by=['christian']) == [(), (), (), ('meskel',), ('gena',)]
+
+
+def test_holiday_mask_accepts_gregorian_dates():
+    dates = [Kenat(2016, 1, 1).to_gregorian_date(), datetime.date(2024, 1, 1)]
+    assert [bool(v) for v in holiday_mask(dates)] == [True, False]
+
+
+def test_holiday_keys_match_kenat_is_holiday():
+    start = Kenat(2016, 1, 1).to_day_number()
+    dates = [Kenat.from_day_number(start + offset) for offset in range(0, 800, 3)]
+    expected = [sorted(h['key'] for h in date.is_holiday()) for date in dates]
+    assert [sorted(keys) for keys in holiday_keys(dates)] == expected
+
+
+# -------------------
+# Gregorian views
+# -------------------
+
+def test_gregorian_year_spans_two_ethiopian_years_in_gregorian_order():
+    result = get_holidays_for_gregorian_year(2024, 'english')
+    dates = [datetime.date(**h['gregorian']) for h in result]
+    assert dates == sorted(dates)
+    assert all(d.year == 2024 for d in dates)
+    assert {h['ethiopian']['year'] for h in result} == {2016, 2017}
+    keys = [h['key'] for h in result]
+    assert keys[0] == 'gena' and 'enkutatash' in keys and 'meskel' in keys
+
+
+def test_gregorian_year_matches_ethiopian_year_holidays():
+    expected = {
+        (h['key'], datetime.date(**h['gregorian']) if 'gregorian' in h else to_gc(*h['ethiopian'].values()))
+        for year in (2016, 2017) for h in get_holidays_for_year(year, filter_by='public')
+    }
+    expected = {item for item in expected if item[1].year == 2024}
+    result = get_holidays_for_gregorian_year(2024, filter_by='public')
+    assert {(h['key'], datetime.date(**h['gregorian'])) for h in result} == expected
+
+
+def test_gregorian_month():
+    assert [h['key'] for h in get_holidays_in_gregorian_month(2024, 9)] == ['enkutatash', 'moulid', 'meskel']
+    assert [h['key'] for h in get_holidays_in_gregorian_month(2024, 9, filter_by='muslim')] == ['moulid']
+    assert get_holidays_in_gregorian_month(2024, 12) == []
+
+
+def test_gregorian_views_accept_whole_floats_only():
+    assert get_holidays_for_gregorian_year(2024.0) == get_holidays_for_gregorian_year(2024)
+    assert get_holidays_in_gregorian_month(2024.0, 9.0) == get_holidays_in_gregorian_month(2024, 9)
+    with pytest.raises(InvalidInputTypeError):
+        get_holidays_for_gregorian_year(2024.5)
+    with pytest.raises(InvalidInputTypeError):
+        get_holidays_in_gregorian_month(2024, 9.5)
+
+
+@pytest.mark.parametrize("g_year", [1900, 2100])
+def test_gregorian_views_at_the_edges_of_the_supported_range(g_year):
+    # 1900 and 2100 span Ethiopian years 1892 and 2093, which start or end outside 1900-2100
+    result = get_holidays_for_gregorian_year(g_year, 'english')
+    assert {h['gregorian']['year'] for h in result} == {g_year}
+    assert {'gena', 'enkutatash', 'meskel', 'fasika'} <= {h['key'] for h in result}
+    assert {'eidFitr', 'eidAdha'} <= {h['key'] for h in result}
+    assert [h['key'] for h in get_holidays_in_gregorian_month(g_year, 1)][:2] == ['gena', 'timket']
+    assert get_holidays_in_gregorian_month(g_year, 12, 'english') == [
+        h for h in result if h['gregorian']['month'] == 12]
+
+
+@pytest.mark.parametrize("month", [0, 13])
+def test_gregorian_month_invalid_range(month):
+    with pytest.raises(InvalidInputTypeError):
+        get_holidays_in_gregorian_month(2024, month)
+
+
+# -------------------
+# Islamic holiday table and overrides
+# -------------------
+
+@pytest.fixture
+def restore_islamic_holidays():
+    yield
+    holidays.clear_islamic_holiday_overrides()
+
+
+def test_bundled_islamic_table_matches_tabular_calendar():
+    for year in (1900, 2016, 2090):
+        for key, hijri in holidays.ISLAMIC_HOLIDAY_DATES.items():
+            assert holidays._islamic_occurrences(key, year) == holidays._tabular_islamic_occurrences(year, *hijri)
+
+
+def test_json_override_replaces_computed_date(tmp_path, restore_islamic_holidays):
+    assert get_holiday('eidFitr', 2016)['ethiopian'] == {'year': 2016, 'month': 8, 'day': 1}
+    path = tmp_path / 'observed.json'
+    path.write_text(json.dumps({'eidFitr': {'2016': '2024-04-10'}, 'moulid': {'2016': []}}))
+    holidays.load_islamic_holiday_overrides(path)
+
+    assert get_holiday('eidFitr', 2016)['gregorian'] == {'year': 2024, 'month': 4, 'day': 10}
+    assert holiday_keys([Kenat(2016, 8, 1), Kenat(2016, 8, 2)]) == [(), ('eidFitr',)]
+    assert 'moulid' not in [h['key'] for h in get_holidays_for_year(2016)]
+    assert get_holiday('eidFitr', 2017)['ethiopian']['year'] == 2017 # Other years are unchanged
+
+    holidays.clear_islamic_holiday_overrides()
+    assert get_holiday('eidFitr', 2016)['ethiopian'] == {'year': 2016, 'month': 8, 'day': 1}
+
+
+def test_csv_override(tmp_path, restore_islamic_holidays):
+    path = tmp_path / 'observed.csv'
+    path.write_text('holiday,year,date\neidAdha,2016,2024-06-17\n')
+    holidays.load_islamic_holiday_overrides(str(path))
+    assert [h['gregorian'] for h in get_holidays_in_gregorian_month(2024, 6, filter_by='muslim')] == [
+        {'year': 2024, 'month': 6, 'day': 17}]
+
+
+def test_csv_empty_date_means_not_observed(tmp_path, restore_islamic_holidays):
+    path = tmp_path / 'observed.csv'
+    path.write_text('holiday,year,date\nmoulid,2016,\n')
+    holidays.load_islamic_holiday_overrides(path)
+    assert get_holiday('moulid', 2016) is None
+    assert 'moulid' not in [h['key'] for h in get_holidays_for_year(2016)]
+
+
+@pytest.mark.parametrize("content, error", [
+    ({'christmas': {'2016': '2024-04-10'}}, UnknownHolidayError),
+    ({'eidFitr': {'2016': '10/04/2024'}}, InvalidInputTypeError),
+    ({'eidFitr': {'2016': '2025-04-10'}}, InvalidInputTypeError), # Not in Ethiopian year 2016
+    ({'eidFitr': {'next': '2024-04-10'}}, InvalidInputTypeError),
+    ([{'eidFitr': {'2016': '2024-04-10'}}], InvalidInputTypeError),
+    ({'eidFitr': ['2024-04-10']}, InvalidInputTypeError),
+    ({'eidFitr': {'2016': 5}}, InvalidInputTypeError),
+    ({'eidFitr': {'2016': [5]}}, InvalidInputTypeError),
+])
+def test_invalid_overrides_are_rejected(tmp_path, restore_islamic_holidays, content, error):
+    path = tmp_path / 'observed.json'
+    path.write_text(json.dumps(content))
+    with pytest.raises(error):
+        holidays.load_islamic_holiday_overrides(path)
+    assert get_holiday('eidFitr', 2016)['ethiopian'] == {'year': 2016, 'month': 8, 'day': 1}
+
+
+def test_override_file_from_environment(tmp_path, monkeypatch, restore_islamic_holidays):
+    path = tmp_path / 'observed.json'
+    path.write_text(json.dumps({'eidFitr': {'2016': '2024-04-10'}}))
+    monkeypatch.setenv(holidays.ISLAMIC_OVERRIDES_ENV, str(path))
+    monkeypatch.setattr(holidays, '_islamic_table', None) # Loaded again on next use
+    holidays.clear_islamic_holiday_overrides()
+    assert get_holiday('eidFitr', 2016)['gregorian'] == {'year': 2024, 'month': 4, 'day': 10}
+
+
+# -------------------
+# Holiday providers
+# -------------------
+
+@pytest.fixture
+def acme():
+    holidays.register_holiday_provider('acme', {
+        'foundersDay': {
+            'rule': holiday_rules.fixed(3, 15),
+            'tags': ['company'],
+            'name': {'english': "Founders' Day", 'amharic': 'የመሥራቾች ቀን'},
+            'description': "The company's founding.",
+        },
+        'retreat': {'rule': holiday_rules.nth_weekday(1, 0, -1), 'tags': ['company']},
+    })
+    yield
+    holidays.unregister_holiday_provider('acme')
+
+
+def test_provider_holidays_join_every_query(acme):
+    founders = get_holiday('foundersDay', 2016)
+    assert founders['name'] == 'የመሥራቾች ቀን'
+    assert founders['tags'] == ['company'] and not founders['movable']
+    assert get_holiday('retreat', 2016, lang='english')['name'] == 'retreat'
+    assert [h['key'] for h in get_holidays_in_month(2016, 3, lang='english', filter_by='company')] == ['foundersDay']
+    assert holiday_keys([Kenat(2016, 3, 15), Kenat(2016, 1, 27)]) == [('foundersDay',), ('retreat',)]
+    assert Kenat(2016, 3, 15).is_holiday()
+    assert holidays.get_holiday_providers()['acme'] == ['foundersDay', 'retreat']
+
+
+def test_changing_providers_invalidates_cached_holidays():
+    assert not holiday_mask([Kenat(2016, 3, 15)])[0]
+    holidays.register_holiday_provider('acme', {'foundersDay': {'rule': holiday_rules.fixed(3, 15)}})
+    try:
+        assert holiday_mask([Kenat(2016, 3, 15)])[0]
+        holidays.register_holiday_provider('acme', {'foundersDay': {'rule': holiday_rules.fixed(3, 16)}})
+        assert list(holiday_mask([Kenat(2016, 3, 15), Kenat(2016, 3, 16)])) == [False, True]
+    finally:
+        holidays.unregister_holiday_provider('acme')
+    assert get_holiday('foundersDay', 2016) is None
+    assert not holiday_mask([Kenat(2016, 3, 16)])[0]
+
+
+@pytest.mark.parametrize("name, definitions", [
+    ('ethiopia', {'x': {'rule': holiday_rules.fixed(1, 1)}}),
+    ('other', {'meskel': {'rule': holiday_rules.fixed(1, 17)}}),
+    ('other', {'foundersDay': {'rule': holiday_rules.fixed(1, 1)}}), # Taken by 'acme'
+    ('other', {'x': {'month': 1, 'day': 1}}),
+    ('other', {'x': {'rule': holiday_rules.fixed(1, 1), 'tags': 'company'}}),
+    ('other', {'x': {'rule': holiday_rules.fixed(1, 1), 'tags': None}}),
+    ('other', {'x': {'rule': holiday_rules.fixed(1, 1), 'tags': ['company', 1]}}),
+    ('other', {'x': {'rule': holiday_rules.fixed(1, 1), 'name': 42}}),
+])
+def test_invalid_providers_are_rejected(acme, name, definitions):
+    with pytest.raises(InvalidInputTypeError):
+        holidays.register_holiday_provider(name, definitions)
+    assert 'other' not in holidays.get_holiday_providers()
+
+
+def test_unregister_unknown_provider():
+    with pytest.raises(InvalidInputTypeError):
+        holidays.unregister_holiday_provider('ethiopia')
+
+
+@pytest.mark.parametrize("content", [{'eidFitr': {'2016': 'not a date'}}, ['eidFitr']])
+def test_invalid_override_file_from_environment_keeps_failing(tmp_path, monkeypatch, restore_islamic_holidays, content):
+    path = tmp_path / 'observed.json'
+    path.write_text(json.dumps(content))
+    monkeypatch.setenv(holidays.ISLAMIC_OVERRIDES_ENV, str(path))
+    monkeypatch.setattr(holidays, '_islamic_table', None)
+    holidays.clear_islamic_holiday_overrides()
+    for _ in range(2): # Not silently dropped after the first failure
+        with pytest.raises(InvalidInputTypeError):
+            get_holiday('eidFitr', 2016)
+    path.write_text(json.dumps({'eidFitr': {'2016': '2024-04-10'}}))
+    assert get_holiday('eidFitr', 2016)['gregorian'] == {'year': 2024, 'month': 4, 'day': 10}
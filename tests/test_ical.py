@@ -0,0 +1,122 @@
+import datetime
+import io
+import pytest
+
+from kenat import EthiopianDateTime, Kenat, Time, get_holidays_for_year, ical
+from kenat.exceptions import InvalidInputTypeError
+
+
+def unfold(text):
+    """Returns the content lines of an iCalendar text."""
+    assert text.endswith('\r\n')
+    return text.replace('\r\n ', '').split('\r\n')[:-1]
+
+
+def events(lines):
+    result, event = [], None
+    for line in lines:
+        if line == 'BEGIN:VEVENT':
+            event = {}
+        elif line == 'END:VEVENT':
+            result.append(event)
+        elif event is not None:
+            name, _, value = line.partition(':')
+            event[name] = value
+    return result
+
+
+def test_export_holidays_matches_holiday_queries():
+    text = ''.join(ical.export_holidays(2016, 2017, lang='english', filter_by='public'))
+    lines = unfold(text)
+    assert lines[:3] == ['BEGIN:VCALENDAR', 'VERSION:2.0', f'PRODID:{ical.PRODID}']
+    assert lines[-1] == 'END:VCALENDAR'
+
+    exported = events(lines)
+    expected = [h for year in (2016, 2017) for h in get_holidays_for_year(year, lang='english', filter_by='public')]
+    assert len(exported) == len(expected)
+    meskel = next(e for e in exported if e['UID'] == 'meskel-20230928@kenat')
+    assert meskel['DTSTART;VALUE=DATE'] == '20230928'
+    assert meskel['DTEND;VALUE=DATE'] == '20230929'
+    assert meskel['SUMMARY'] == 'Finding of the True Cross (Meskel)'
+    assert meskel['DESCRIPTION'].startswith('Thursday\\, Meskerem 17 2016\\n\\n')
+    assert meskel['CATEGORIES'] == 'public,religious,christian'
+
+
+def test_lines_are_folded_at_75_octets():
+    text = ''.join(ical.export_holidays(2016, 2016, lang='amharic', calendar_name='የኢትዮጵያ በዓላት'))
+    physical = text.split('\r\n')[:-1]
+    assert max(len(line.encode('utf-8')) for line in physical) <= 75
+    assert any(line.startswith(' ') for line in physical)
+    assert 'X-WR-CALNAME:የኢትዮጵያ በዓላት' in unfold(text)
+
+
+def test_export_holidays_writes_to_path_and_file(tmp_path):
+    path = tmp_path / 'holidays.ics'
+    assert ical.export_holidays(2016, 2016, file=path) is None
+    buffer = io.StringIO(newline='')
+    ical.export_holidays(2016, 2016, file=buffer)
+    strip_stamp = lambda text: [l for l in unfold(text) if not l.startswith('DTSTAMP')]
+    assert strip_stamp(path.read_bytes().decode('utf-8')) == strip_stamp(buffer.getvalue())
+
+
+def test_export_holidays_invalid_range():
+    with pytest.raises(InvalidInputTypeError):
+        ical.export_holidays(2017, 2016)
+    with pytest.raises(InvalidInputTypeError):
+        ical.export_holidays('2016', 2017)
+
+
+def test_export_holidays_at_the_edges_of_the_supported_range(tmp_path):
+    assert (ical.FIRST_YEAR, ical.LAST_YEAR) == (1893, 2092)
+    for year in (1893, 2092):
+        exported = events(unfold(''.join(ical.export_holidays(year, year, lang='english'))))
+        assert len(exported) == len(get_holidays_for_year(year))
+
+    path = tmp_path / 'holidays.ics'
+    for start, end in ((2000, 2100), (2093, 2093), (1892, 1893)):
+        with pytest.raises(InvalidInputTypeError):
+            ical.export_holidays(start, end, file=path)
+        assert not path.exists()
+
+
+def test_export_events():
+    text = ''.join(ical.export_events([
+        {'summary': 'Trip; north', 'start': Kenat(2016, 1, 5), 'end': Kenat(2016, 1, 7), 'description': 'Bring a coat'},
+        {'summary': 'Call', 'start': EthiopianDateTime(2016, 1, 1, Time(3, 0, 'day')),
+         'end': EthiopianDateTime(2016, 1, 1, Time(4, 0, 'day')), 'uid': 'call-1@example.com'},
+        {'summary': 'Lunch', 'start': datetime.datetime(2024, 1, 1, 12, 30)},
+        {'summary': 'Day off', 'start': datetime.date(2024, 1, 2), 'categories': ['personal']},
+    ], lang='english'))
+    trip, call, lunch, day_off = events(unfold(text))
+
+    assert trip['SUMMARY'] == 'Trip\\; north'
+    assert (trip['DTSTART;VALUE=DATE'], trip['DTEND;VALUE=DATE']) == ('20230916', '20230919')
+    assert trip['DESCRIPTION'] == 'Saturday\\, Meskerem 5 2016\\n\\nBring a coat'
+    assert call['UID'] == 'call-1@example.com'
+    assert (call['DTSTART'], call['DTEND']) == ('20230912T060000Z', '20230912T070000Z') # 9 AM EAT
+    assert lunch['DTSTART'] == '20240101T123000' and 'DTEND' not in lunch
+    assert day_off['DTEND;VALUE=DATE'] == '20240103' and day_off['CATEGORIES'] == 'personal'
+
+
+def test_aware_datetimes_are_described_in_east_africa_time():
+    start = datetime.datetime(2024, 1, 1, 10, 0, tzinfo=datetime.timezone.utc)
+    event, = events(unfold(''.join(ical.export_events([{'summary': 'Call', 'start': start}]))))
+    assert event['DTSTART'] == '20240101T100000Z'
+    assert event['DESCRIPTION'] == EthiopianDateTime.from_datetime(datetime.datetime(2024, 1, 1, 13, 0)).format('amharic')
+    assert '07:00' in event['DESCRIPTION']
+
+
+def test_event_uids_are_stable():
+    event = [{'summary': 'Trip', 'start': Kenat(2016, 1, 5)}]
+    uid = lambda: events(unfold(''.join(ical.export_events(event))))[0]['UID']
+    assert uid() == uid()
+
+
+@pytest.mark.parametrize("event", [
+    {'summary': 'No start'},
+    {'summary': 'Bad start', 'start': '2016-01-01'},
+    {'summary': 'Mixed', 'start': Kenat(2016, 1, 1), 'end': datetime.datetime(2024, 1, 1)},
+])
+def test_invalid_events(event):
+    with pytest.raises(InvalidInputTypeError):
+        ''.join(ical.export_events([event]))
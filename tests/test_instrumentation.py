@@ -0,0 +1,84 @@
+import pytest
+from kenat import instrumentation, to_ec, to_gc, get_holidays_in_month, MonthGrid, Time
+from kenat.exceptions import InvalidEthiopianDateError
+
+
+@pytest.fixture(autouse=True)
+def clean_instrumentation():
+    instrumentation.reset()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def test_disabled_by_default_records_nothing():
+    assert not instrumentation.is_enabled()
+    to_ec(2024, 5, 23)
+    assert instrumentation.snapshot() == {}
+
+
+def test_records_calls_and_latency():
+    with instrumentation.instrumenting():
+        to_ec(2024, 5, 23)
+        to_ec(2024, 5, 24)
+        to_gc(2016, 9, 15)
+    stats = instrumentation.snapshot()
+    assert stats['to_ec']['calls'] == 2
+    assert stats['to_gc']['calls'] == 1
+    assert stats['to_ec']['total_seconds'] >= stats['to_ec']['max_seconds'] > 0
+    assert stats['to_ec']['mean_seconds'] == pytest.approx(stats['to_ec']['total_seconds'] / 2)
+    assert stats['to_ec']['cache_hits'] + stats['to_ec']['cache_misses'] == 2
+
+
+def test_failed_calls_are_still_counted():
+    instrumentation.enable()
+    with pytest.raises(InvalidEthiopianDateError):
+        to_gc(2016, 14, 1)
+    assert instrumentation.snapshot()['to_gc']['calls'] == 1
+
+
+def test_methods_and_classmethods_are_instrumented():
+    instrumentation.enable()
+    MonthGrid({'year': 2016, 'month': 1}).generate()
+    Time.from_string('10:30 day')
+    get_holidays_in_month(2016, 1)
+    stats = instrumentation.snapshot()
+    assert stats['MonthGrid.generate']['calls'] == 1
+    assert stats['Time.from_string']['calls'] == 1
+    assert stats['get_holidays_in_month']['calls'] >= 1
+
+
+def test_cache_accesses_produce_hit_rate():
+    instrumentation.enable()
+    instrumentation.record_cache_access('to_ec', True)
+    instrumentation.record_cache_access('to_ec', True)
+    instrumentation.record_cache_access('to_ec', False)
+    stats = instrumentation.snapshot()['to_ec']
+    assert (stats['cache_hits'], stats['cache_misses']) == (2, 1)
+    assert stats['cache_hit_rate'] == pytest.approx(2 / 3)
+
+
+def test_prometheus_export():
+    instrumentation.enable()
+    to_ec(2024, 5, 23)
+    text = instrumentation.to_prometheus()
+    assert '# TYPE kenat_calls_total counter' in text
+    assert 'kenat_calls_total{function="to_ec"} 1' in text
+    assert 'kenat_call_seconds_max{function="to_ec"}' in text
+    assert text.endswith('\n')
+
+
+def test_finished_threads_are_merged_and_released():
+    import gc
+    import threading
+    instrumentation.enable()
+    for _ in range(20):
+        thread = threading.Thread(target=to_ec, args=(2024, 5, 23))
+        thread.start()
+        thread.join()
+    del thread
+    gc.collect()
+    assert len(instrumentation._thread_stats) <= 1 # Only the main thread, if it recorded
+    assert instrumentation.snapshot()['to_ec']['calls'] == 20
+    instrumentation.reset()
+    assert instrumentation.snapshot() == {}
@@ -2,7 +2,10 @@
 
 import pytest
 import datetime
+import pickle
+from concurrent.futures import ProcessPoolExecutor
 from kenat import Kenat
+from kenat.kenat import _restore_kenat
 
 class TestKenatClass:
     """
@@ -97,4 +100,23 @@ class TestKenatApiHelperMethods:
         # 2016/9/15 ET is May 23, 2024 GC, which is a Thursday.
         # In JS getDay(), Thursday is 4.
         specific_date = Kenat("2016/9/15")
-        assert specific_date.weekday() == 4
\ No newline at end of file
+        assert specific_date.weekday() == 4
+
+
+class TestKenatPickling:
+    def test_should_round_trip_date_and_time(self):
+        for date in (Kenat('2016/13/5'), Kenat(datetime.datetime(2024, 1, 1, 15, 45))):
+            restored = pickle.loads(pickle.dumps(date))
+            assert restored == date
+            assert restored.time == date.time
+            assert restored.get_ethiopian() == date.get_ethiopian()
+
+    def test_should_pickle_default_time_as_a_single_integer(self):
+        assert Kenat('2016/1/1').__reduce__() == (_restore_kenat, (Kenat('2016/1/1').to_day_number(),))
+        dates = [Kenat.from_day_number(735000 + i) for i in range(100)]
+        assert len(pickle.dumps(dates)) < 100 * 12
+
+    def test_should_work_across_processes(self):
+        dates = [Kenat(2016, month, 1) for month in range(1, 14)]
+        with ProcessPoolExecutor(1) as executor:
+            assert executor.submit(list, dates).result() == dates
@@ -0,0 +1,124 @@
+import datetime
+import pickle
+import pytest
+
+from kenat import Kenat, KenatArray, kenat_array
+from kenat.exceptions import InvalidGregorianDateError, InvalidInputTypeError
+
+
+@pytest.fixture(params=['numpy', 'array'], autouse=True)
+def backend(request, monkeypatch):
+    """Runs every test with numpy and with the array.array fallback."""
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(kenat_array, 'np', None)
+    return request.param
+
+
+DATES = [Kenat(2015, 13, 6), Kenat(2015, 1, 1), Kenat(2016, 4, 29), Kenat(2017, 2, 10)]
+
+
+@pytest.fixture
+def dates():
+    return KenatArray.from_dates(DATES)
+
+
+class TestConstruction:
+    def test_from_dates_and_day_numbers(self, dates):
+        assert list(dates) == DATES
+        assert KenatArray([d.to_day_number() for d in DATES]) == dates
+        assert len(dates) == 4
+
+    def test_from_gregorian(self, dates):
+        greg = [d.to_gregorian_date() for d in DATES]
+        assert KenatArray.from_gregorian(greg) == dates
+        assert KenatArray.from_dates(greg) == dates
+
+    def test_from_gregorian_datetime64(self, backend, dates):
+        if backend != 'numpy':
+            pytest.skip('datetime64 input needs numpy')
+        import numpy as np
+        greg = np.array([d.to_gregorian_date() for d in DATES], dtype='datetime64[D]')
+        assert KenatArray.from_gregorian(greg) == dates
+        with pytest.raises(InvalidGregorianDateError):
+            KenatArray.from_gregorian(np.array(['1800-01-01'], dtype='datetime64[D]'))
+
+    def test_invalid_inputs(self):
+        with pytest.raises(InvalidGregorianDateError):
+            KenatArray.from_dates([datetime.date(1800, 1, 1)])
+        with pytest.raises(InvalidInputTypeError):
+            KenatArray.from_dates(['2016/1/1'])
+
+
+class TestComponents:
+    def test_year_month_day(self, dates):
+        assert list(dates.year) == [d.year for d in DATES]
+        assert list(dates.month) == [d.month for d in DATES]
+        assert list(dates.day) == [d.day for d in DATES]
+
+    def test_weekday_and_leap_year(self, dates):
+        assert list(dates.weekday()) == [d.weekday() for d in DATES]
+        assert [bool(v) for v in dates.is_leap_year()] == [d.is_leap_year() for d in DATES]
+
+    def test_to_gregorian(self, dates):
+        greg = dates.to_gregorian()
+        assert [datetime.date.fromisoformat(str(d)) for d in greg] == [d.to_gregorian_date() for d in DATES]
+
+    def test_is_holiday(self):
+        dates = KenatArray.from_dates([Kenat(2016, 1, 1), Kenat(2016, 1, 2), Kenat(2017, 1, 17)])
+        assert [bool(v) for v in dates.is_holiday()] == [True, False, True]
+        assert [bool(v) for v in dates.is_holiday(filter_by='public')] == [True, False, True]
+        assert not any(dates.is_holiday(filter_by='muslim'))
+
+
+class TestArithmetic:
+    @pytest.mark.parametrize('duration', [
+        {'years': 1}, {'months': 1}, {'months': -14}, {'days': 40}, {'years': 1, 'months': 2, 'days': 3},
+    ])
+    def test_add_matches_kenat(self, dates, duration):
+        assert list(dates.add(**duration)) == [d.add(**duration) for d in DATES]
+
+    def test_add_clamps_pagume(self):
+        dates = KenatArray.from_dates([Kenat(2015, 13, 6), Kenat(2016, 12, 30)])
+        assert list(dates.add(years=1)) == [Kenat(2016, 13, 5), Kenat(2017, 12, 30)]
+        assert list(dates.add(months=1)) == [Kenat(2016, 1, 6), Kenat(2016, 13, 5)]
+
+    @pytest.mark.parametrize('duration', [{'years': 0.5}, {'months': 1.5}, {'days': 1.5}, {'days': float('nan')}])
+    def test_add_rejects_fractions(self, dates, duration):
+        with pytest.raises(InvalidInputTypeError):
+            dates.add(**duration)
+
+    def test_add_accepts_whole_floats(self, dates):
+        assert list(dates.add(months=1.0, days=2.0)) == list(dates.add(months=1, days=2))
+
+    def test_diff_in_days(self, dates):
+        assert list(dates.diff_in_days(Kenat(2016, 1, 1))) == [d.diff_in_days(Kenat(2016, 1, 1)) for d in DATES]
+        assert list(dates.diff_in_days(dates.add(days=3))) == [-3] * 4
+        assert list(dates.add(days=-3).diff_in_days(dates)) == [-3] * 4
+        with pytest.raises(InvalidInputTypeError):
+            dates.diff_in_days(dates[:2])
+
+
+class TestSequence:
+    def test_indexing_and_slicing(self, dates):
+        assert dates[1] == DATES[1]
+        assert dates[-1] == DATES[-1]
+        assert list(dates[1:3]) == DATES[1:3]
+        assert isinstance(dates[::2], KenatArray)
+
+    def test_sort_argsort_and_searchsorted(self, dates):
+        ordered = dates.sort()
+        assert list(ordered) == sorted(DATES)
+        assert [dates[int(i)] for i in dates.argsort()] == sorted(DATES)
+        assert ordered.searchsorted(Kenat(2016, 4, 29)) == 2
+        assert ordered.searchsorted(Kenat(2016, 4, 29), side='right') == 3
+        assert list(ordered.searchsorted(KenatArray.from_dates([Kenat(2000, 1, 1), Kenat(2020, 1, 1)]))) == [0, 4]
+
+    def test_format(self, dates):
+        assert dates.format({'lang': 'english'}) == [d.format({'lang': 'english'}) for d in DATES]
+        assert dates.format({'use_geez': True}) == [d.format({'use_geez': True}) for d in DATES]
+
+    def test_repr_and_pickle(self, dates):
+        assert repr(dates) == 'KenatArray([2015/13/06, 2015/01/01, 2016/04/29, 2017/02/10], length=4)'
+        assert pickle.loads(pickle.dumps(dates)) == dates
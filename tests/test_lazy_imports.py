@@ -0,0 +1,46 @@
+import subprocess
+import sys
+
+import pytest
+import kenat
+
+
+def _loaded_modules(statement):
+    """Runs `statement` in a fresh interpreter and returns the kenat modules it loaded."""
+    code = statement + "; import sys; print(' '.join(m for m in sys.modules if m.startswith('kenat')))"
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    return set(result.stdout.split())
+
+
+def test_conversion_import_does_not_load_holiday_machinery():
+    modules = _loaded_modules('from kenat import to_ec')
+    assert 'kenat.conversions' in modules
+    for heavy in ('kenat.holidays', 'kenat.bahire_hasab', 'kenat.month_grid', 'kenat.kenat', 'kenat._holiday_info'):
+        assert heavy not in modules
+
+
+def test_kenat_class_does_not_load_holidays_until_needed():
+    modules = _loaded_modules('from kenat import Kenat; Kenat(2016, 1, 1).format()')
+    assert 'kenat.holidays' not in modules
+    assert 'kenat._holiday_info' not in modules
+
+
+@pytest.mark.parametrize("name", kenat.__all__)
+def test_every_public_name_resolves(name):
+    assert getattr(kenat, name) is not None
+
+
+def test_lazy_submodule_access():
+    assert kenat.holidays.get_holidays_for_year is kenat.get_holidays_for_year
+
+
+def test_holiday_info_is_loaded_on_first_access():
+    from kenat import constants
+    from kenat.constants import HOLIDAY_INFO
+    assert constants.HOLIDAY_INFO is HOLIDAY_INFO
+    assert 'enkutatash' in HOLIDAY_INFO
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError):
+        kenat.does_not_exist
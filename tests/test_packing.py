@@ -0,0 +1,72 @@
+import mmap
+import pytest
+
+from kenat import Kenat, Time, conversions, packing
+from kenat.exceptions import InvalidInputTypeError, InvalidTimeError
+
+
+class TestKenatBytes:
+    def test_day_number_round_trip(self):
+        date = Kenat(2016, 13, 5)
+        assert date.to_day_number() == conversions.ethiopian_to_day_number(2016, 13, 5)
+        assert Kenat.from_day_number(date.to_day_number()) == date
+
+    def test_to_bytes_is_little_endian_day_number(self):
+        date = Kenat(2016, 1, 1)
+        assert date.to_bytes() == date.to_day_number().to_bytes(4, 'little')
+        assert Kenat.from_bytes(date.to_bytes()) == date
+        assert Kenat.from_bytes(memoryview(date.to_bytes())) == date
+
+    @pytest.mark.parametrize('data', [b'\x00\x01', b'12345', 'abcd', None])
+    def test_from_bytes_rejects_other_lengths(self, data):
+        with pytest.raises(InvalidInputTypeError):
+            Kenat.from_bytes(data)
+
+    def test_is_four_bytes(self):
+        assert len(Kenat(2016, 1, 1).to_bytes()) == 4
+
+
+class TestTimeBytes:
+    def test_minute_of_day(self):
+        assert Time(12, 0, 'day').minute_of_day == 6 * 60
+        assert Time(6, 30, 'night').minute_of_day == 30
+        assert Time.from_minute_of_day(30) == Time(6, 30, 'night')
+        with pytest.raises(InvalidTimeError):
+            Time.from_minute_of_day(1440)
+
+    def test_round_trip_every_minute(self):
+        for minute in range(1440):
+            time = Time.from_minute_of_day(minute)
+            assert time.to_bytes() == minute.to_bytes(2, 'little')
+            assert Time.from_bytes(time.to_bytes()) == time
+
+
+class TestBulk:
+    def test_pack_and_unpack_many(self):
+        dates = [Kenat.from_day_number(735000 + i * 37) for i in range(500)]
+        packed = packing.pack_many(dates)
+        assert packed.typecode == 'i' and len(packed) == 500
+        assert packed.tobytes()[:4] == dates[0].to_bytes()
+        assert packing.unpack_many(packed) == dates
+        assert packing.unpack_many(packed.tobytes()) == dates
+        assert packing.unpack_many(memoryview(packed.tobytes())[8:]) == dates[2:]
+
+    def test_unpack_from_mmap(self, tmp_path):
+        dates = [Kenat(2016, month, 1) for month in range(1, 14)]
+        path = tmp_path / 'dates.bin'
+        with open(path, 'wb') as f:
+            packing.pack_many(dates).tofile(f)
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            assert packing.unpack_many(buffer) == dates
+
+    def test_times(self):
+        times = [Time(3, 15, 'day'), Time(12, 0, 'night'), Time(11, 59, 'night')]
+        packed = packing.pack_times(times)
+        assert packed.typecode == 'H'
+        assert packing.unpack_times(packed.tobytes()) == times
+
+    def test_rejects_partial_items(self):
+        with pytest.raises(InvalidInputTypeError):
+            packing.unpack_many(b'\x00' * 6)
+        with pytest.raises(InvalidInputTypeError):
+            packing.unpack_times(b'\x00' * 3)
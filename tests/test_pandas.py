@@ -0,0 +1,224 @@
+import datetime
+import pytest
+
+pd = pytest.importorskip('pandas')
+np = pytest.importorskip('numpy')
+
+from kenat import Kenat, to_ec, to_gc, get_holidays_for_year
+from kenat.conversions import (
+    ethiopian_to_day_number,
+    day_number_to_ethiopian,
+    day_number_to_gregorian_ordinal,
+    gregorian_ordinal_to_day_number,
+)
+from kenat.exceptions import InvalidEthiopianDateError, InvalidGregorianDateError
+from kenat.pandas import (
+    EthiopianDateArray,
+    EthiopianDateDtype,
+    EthiopianMonthBegin,
+    EthiopianMonthEnd,
+    EthiopianMonthOffset,
+    EthiopianYearBegin,
+    EthiopianYearEnd,
+    EthiopianFiscalYearBegin,
+    EthiopianFiscalYearEnd,
+)
+
+
+@pytest.fixture
+def gregorian():
+    return pd.Series(pd.date_range('2023-09-01', periods=400, freq='D'), name='date')
+
+
+@pytest.fixture
+def ethiopian(gregorian):
+    return gregorian.astype('ethiopian_date')
+
+
+class TestDayNumbers:
+    def test_day_numbers_round_trip(self):
+        for year in (1, 2, 3, 4, 2015, 2016):
+            for month, day in ((1, 1), (13, 5), (7, 30)):
+                assert day_number_to_ethiopian(ethiopian_to_day_number(year, month, day)) == (year, month, day)
+        assert ethiopian_to_day_number(1, 1, 1) == 1
+
+    def test_gregorian_mapping_matches_scalar_conversions(self):
+        date = datetime.date(1900, 1, 1)
+        while date <= datetime.date(2100, 12, 31):
+            eth = to_ec(date.year, date.month, date.day)
+            day_number = gregorian_ordinal_to_day_number(date.toordinal())
+            assert day_number_to_ethiopian(day_number) == (eth['year'], eth['month'], eth['day'])
+            assert day_number_to_gregorian_ordinal(day_number) == to_gc(*day_number_to_ethiopian(day_number)).toordinal()
+            date += datetime.timedelta(days=53)
+
+    def test_helpers_accept_numpy_arrays(self):
+        ordinals = np.arange(datetime.date(2020, 1, 1).toordinal(), datetime.date(2020, 12, 31).toordinal())
+        day_numbers = gregorian_ordinal_to_day_number(ordinals)
+        assert list(day_numbers) == [gregorian_ordinal_to_day_number(int(o)) for o in ordinals]
+
+
+class TestDtype:
+    def test_astype_from_datetime_matches_to_ec(self, gregorian, ethiopian):
+        assert isinstance(ethiopian.dtype, EthiopianDateDtype)
+        assert ethiopian.array.day_numbers.dtype == np.int32
+        for greg, eth in zip(gregorian, ethiopian):
+            assert eth.get_ethiopian() == to_ec(greg.year, greg.month, greg.day)
+
+    def test_construct_from_mixed_scalars(self):
+        series = pd.Series([Kenat(2015, 13, 6), '2016/1/1', {'year': 2015, 'month': 5, 'day': 5},
+                            None, (2016, 2, 2), datetime.date(2024, 1, 1)], dtype='ethiopian_date')
+        assert series.isna().tolist() == [False, False, False, True, False, False]
+        assert series.astype(str).tolist()[:3] == ['2015/13/06', '2016/01/01', '2015/05/05']
+        assert series[5] == Kenat(2016, 4, 22)
+
+    def test_invalid_dates_raise(self):
+        with pytest.raises(InvalidEthiopianDateError):
+            pd.Series(['2016/13/6'], dtype='ethiopian_date')
+        with pytest.raises(InvalidEthiopianDateError):
+            EthiopianDateArray.from_ymd([2016], [13], [6])
+        with pytest.raises(InvalidGregorianDateError):
+            pd.Series(pd.to_datetime(['1899-12-31'])).astype('ethiopian_date')
+
+    def test_from_ymd_with_missing_components(self):
+        array = EthiopianDateArray.from_ymd([2015, 2016, None], [13, 1, 1], [6, 1, 1])
+        assert list(array.isna()) == [False, False, True]
+        assert array[0] == Kenat(2015, 13, 6)
+
+    def test_missing_values_round_trip(self, gregorian):
+        gregorian[3] = pd.NaT
+        ethiopian = gregorian.astype('ethiopian_date')
+        assert ethiopian.isna().sum() == 1
+        assert ethiopian.ethiopic.year.isna().sum() == 1
+        assert ethiopian.ethiopic.to_gregorian().isna().sum() == 1
+        assert ethiopian.fillna(Kenat(2000, 1, 1))[3] == Kenat(2000, 1, 1)
+
+    def test_sorting_grouping_and_comparisons(self, ethiopian):
+        shuffled = ethiopian.sample(frac=1, random_state=0)
+        assert shuffled.sort_values().tolist() == ethiopian.tolist()
+        assert ethiopian.min() == Kenat(2015, 12, 26)
+        assert ethiopian.nunique() == 400
+        frame = pd.DataFrame({'date': ethiopian, 'value': 1})
+        assert frame.groupby('date')['value'].sum().sum() == 400
+        assert (ethiopian < '2016/1/1').sum() == 11
+        assert (ethiopian == Kenat(2016, 1, 1)).sum() == 1
+
+    def test_subtraction_gives_days(self, ethiopian):
+        assert (ethiopian - ethiopian[0]).tolist() == list(range(400))
+        assert (ethiopian + 1)[0] == Kenat(2015, 12, 27)
+
+
+class TestAccessor:
+    def test_components(self, ethiopian):
+        expected = [k.get_ethiopian() for k in ethiopian]
+        assert ethiopian.ethiopic.year.tolist() == [d['year'] for d in expected]
+        assert ethiopian.ethiopic.month.tolist() == [d['month'] for d in expected]
+        assert ethiopian.ethiopic.day.tolist() == [d['day'] for d in expected]
+        assert ethiopian.ethiopic.weekday.tolist() == [k.weekday() for k in ethiopian]
+
+    def test_works_on_datetime_series(self, gregorian, ethiopian):
+        assert gregorian.ethiopic.day.tolist() == ethiopian.ethiopic.day.tolist()
+
+    def test_rejects_other_dtypes(self):
+        with pytest.raises(AttributeError):
+            pd.Series([1, 2]).ethiopic
+
+    def test_month_name_and_format(self, ethiopian):
+        assert ethiopian.ethiopic.month_name('english')[0] == 'Nehase'
+        assert ethiopian.ethiopic.format({'lang': 'english'}).tolist() == [k.format({'lang': 'english'}) for k in ethiopian]
+        assert ethiopian.ethiopic.format({'use_geez': True})[0] == ethiopian[0].format({'use_geez': True})
+
+    def test_is_holiday_matches_get_holidays_for_year(self, ethiopian):
+        holidays = {
+            (h['ethiopian']['year'], h['ethiopian']['month'], h['ethiopian']['day'])
+            for year in (2015, 2016, 2017) for h in get_holidays_for_year(year)
+        }
+        expected = [(k.year, k.month, k.day) in holidays for k in ethiopian]
+        assert ethiopian.ethiopic.is_holiday().tolist() == expected
+
+    def test_is_holiday_with_missing_values(self):
+        series = pd.Series(pd.array([Kenat(2016, 1, 1), None, Kenat(2016, 1, 2)], dtype='ethiopian_date'))
+        assert series.ethiopic.is_holiday().tolist() == [True, False, False]
+        assert pd.Series(pd.array([None, None], dtype='ethiopian_date')).ethiopic.is_holiday().tolist() == [False, False]
+
+    def test_to_gregorian_round_trip(self, gregorian, ethiopian):
+        assert (ethiopian.ethiopic.to_gregorian().values == gregorian.values.astype('datetime64[D]')).all()
+
+    @pytest.mark.parametrize("duration", [
+        {'days': 40}, {'days': -3}, {'months': 1}, {'months': 14}, {'years': 1}, {'years': -4, 'months': 2, 'days': 9},
+    ])
+    def test_add_matches_kenat_add(self, ethiopian, duration):
+        result = ethiopian.ethiopic.add(**duration)
+        if duration.get('days', 0) < 0:
+            expected = [Kenat(k.to_gregorian_date() + datetime.timedelta(days=duration['days'])) for k in ethiopian]
+        else:
+            expected = [k.add(**duration) for k in ethiopian]
+        assert result.tolist() == expected
+
+    def test_diff_in_days(self, ethiopian):
+        assert ethiopian.ethiopic.diff_in_days(ethiopian.shift(1)).tolist()[:3] == [pd.NA, 1, 1]
+
+
+def _ethiopian_strings(index):
+    return index.to_series().astype('ethiopian_date').astype(str).tolist()
+
+
+class TestOffsets:
+    OFFSETS = [EthiopianMonthBegin, EthiopianMonthEnd, EthiopianMonthOffset, EthiopianYearBegin,
+               EthiopianYearEnd, EthiopianFiscalYearBegin, EthiopianFiscalYearEnd]
+
+    def test_month_end_range_includes_pagume(self):
+        index = pd.date_range('2023-08-01', '2023-10-20', freq=EthiopianMonthEnd())
+        assert _ethiopian_strings(index) == ['2015/11/30', '2015/12/30', '2015/13/06', '2016/01/30']
+
+    def test_month_begin_range(self):
+        index = pd.date_range('2023-08-01', periods=3, freq=EthiopianMonthBegin())
+        assert _ethiopian_strings(index) == ['2015/12/01', '2015/13/01', '2016/01/01']
+
+    def test_year_offsets(self):
+        assert _ethiopian_strings(pd.date_range('2020-01-01', periods=2, freq=EthiopianYearBegin())) == \
+            ['2013/01/01', '2014/01/01']
+        assert _ethiopian_strings(pd.date_range('2022-01-01', periods=2, freq=EthiopianYearEnd())) == \
+            ['2014/13/05', '2015/13/06']
+        assert _ethiopian_strings(pd.date_range('2020-01-01', periods=2, freq=EthiopianFiscalYearBegin())) == \
+            ['2012/11/01', '2013/11/01']
+        assert _ethiopian_strings(pd.date_range('2020-01-01', periods=2, freq=EthiopianFiscalYearEnd())) == \
+            ['2012/10/30', '2013/10/30']
+
+    def test_month_offset_caps_at_end_of_pagume(self):
+        start = Kenat(2015, 13, 6).to_gregorian_date()
+        assert Kenat((pd.Timestamp(start) + EthiopianMonthOffset(13)).date()) == Kenat(2016, 13, 5)
+        assert Kenat((pd.Timestamp(start) + EthiopianMonthOffset(12)).date()) == Kenat(2016, 12, 6)
+
+    @pytest.mark.parametrize("offset_class", OFFSETS)
+    @pytest.mark.parametrize("n", [-2, -1, 0, 1, 3])
+    def test_vectorized_and_scalar_paths_agree(self, offset_class, n):
+        index = pd.date_range('2023-06-01 08:15', '2024-10-01', freq='D')
+        offset = offset_class(n)
+        assert list(index + offset) == [ts + offset for ts in index]
+
+    @pytest.mark.parametrize("offset_class", OFFSETS)
+    def test_rolling_lands_on_offset(self, offset_class):
+        offset = offset_class()
+        for ts in pd.date_range('2023-06-01', '2024-10-01', freq='5D'):
+            forward, back = offset.rollforward(ts), offset.rollback(ts)
+            assert offset.is_on_offset(forward) and offset.is_on_offset(back)
+            assert back <= ts <= forward
+
+    def test_resample_by_ethiopian_month(self):
+        series = pd.Series(1, index=pd.date_range('2023-08-01', '2024-10-01', freq='h'))
+        result = series.resample(EthiopianMonthBegin()).sum()
+        dates = series.index.to_series()
+        expected = series.groupby([dates.ethiopic.year, dates.ethiopic.month]).sum()
+        assert result.tolist() == expected.tolist()
+        assert all(EthiopianMonthBegin().is_on_offset(ts) for ts in result.index)
+
+    def test_offsets_pickle_with_parameters(self):
+        import pickle
+        offset = EthiopianYearBegin(2, month=11)
+        assert pickle.loads(pickle.dumps(offset)) == offset
+        assert pickle.loads(pickle.dumps(EthiopianFiscalYearEnd())).month == 11
+
+    def test_fiscal_year_accessor(self):
+        series = pd.Series(['2016/10/30', '2016/11/01', '2017/13/05'], dtype='ethiopian_date')
+        assert series.ethiopic.fiscal_year().tolist() == [2016, 2017, 2018]
+        assert series.ethiopic.fiscal_year(start_month=1).tolist() == [2016, 2016, 2017]
@@ -0,0 +1,64 @@
+import datetime
+import pickle
+import pytest
+from kenat import to_ec, to_gc, get_holidays_for_year, Kenat
+from kenat.parallel import convert_many, holidays_for_years
+from kenat.exceptions import InvalidGregorianDateError, InvalidEthiopianDateError, InvalidInputTypeError
+
+DATES = [datetime.date(2015, 1, 1) + datetime.timedelta(days=i) for i in range(400)]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_convert_many_to_ec_matches_to_ec(workers):
+    result = list(convert_many(DATES, 'to_ec', workers=workers, chunksize=37))
+    assert result == [to_ec(d.year, d.month, d.day) for d in DATES]
+
+
+def test_convert_many_to_gc_accepts_tuples_dicts_and_kenat():
+    dates = [(2016, 1, 1), {'year': 2016, 'month': 13, 'day': 5}, Kenat(2017, 4, 29)]
+    result = list(convert_many(dates, 'to_gc', workers=2, chunksize=1))
+    assert result == [to_gc(2016, 1, 1), to_gc(2016, 13, 5), to_gc(2017, 4, 29)]
+
+
+def test_convert_many_unordered_yields_indexed_results():
+    result = list(convert_many(DATES, 'to_ec', workers=2, chunksize=50, ordered=False))
+    assert sorted(index for index, _ in result) == list(range(len(DATES)))
+    for index, eth in result:
+        d = DATES[index]
+        assert eth == to_ec(d.year, d.month, d.day)
+
+
+def test_convert_many_propagates_errors_from_workers():
+    with pytest.raises(InvalidGregorianDateError):
+        list(convert_many([(2024, 1, 1), (2024, 2, 30)], 'to_ec', workers=2))
+    with pytest.raises(InvalidEthiopianDateError):
+        list(convert_many([(2016, 13, 7)], 'to_gc', workers=1))
+
+
+def test_convert_many_rejects_bad_arguments_eagerly():
+    with pytest.raises(InvalidInputTypeError):
+        convert_many(DATES, 'sideways')
+    with pytest.raises(InvalidInputTypeError):
+        convert_many(DATES, 'to_ec', workers=0)
+    with pytest.raises(InvalidInputTypeError):
+        convert_many(DATES, 'to_ec', chunksize=0)
+
+
+@pytest.mark.parametrize("workers, ordered", [(1, True), (2, True), (2, False)])
+def test_holidays_for_years_matches_get_holidays_for_year(workers, ordered):
+    years = [2012, 2013, 2014, 2015, 2016]
+    result = dict(holidays_for_years(years, workers=workers, lang='english', ordered=ordered))
+    assert result == {year: get_holidays_for_year(year, lang='english') for year in years}
+
+
+def test_holidays_for_years_keeps_input_order_and_filters():
+    result = list(holidays_for_years([2016, 2012], workers=2, filter_by='christian'))
+    assert [year for year, _ in result] == [2016, 2012]
+    assert result[0][1] == get_holidays_for_year(2016, filter_by='christian')
+
+
+def test_kenat_errors_survive_pickling():
+    error = pickle.loads(pickle.dumps(InvalidEthiopianDateError(2016, 13, 7)))
+    assert isinstance(error, InvalidEthiopianDateError)
+    assert str(error) == "Invalid Ethiopian date: 2016/13/7"
+    assert error.date == {'year': 2016, 'month': 13, 'day': 7}
@@ -0,0 +1,79 @@
+import datetime
+import pytest
+
+sa = pytest.importorskip('sqlalchemy')
+
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+from kenat import Kenat, conversions
+from kenat.sqlalchemy import EthiopianDate
+from kenat.exceptions import InvalidInputTypeError
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Order(Base):
+    __tablename__ = 'orders'
+    id: Mapped[int] = mapped_column(primary_key=True)
+    placed_on: Mapped[Kenat] = mapped_column(EthiopianDate, index=True, nullable=True)
+
+
+@pytest.fixture
+def session():
+    engine = sa.create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        start = datetime.date(2023, 9, 1)
+        session.add_all([Order(placed_on=Kenat(start + datetime.timedelta(days=i))) for i in range(60)])
+        session.add(Order(placed_on=None))
+        session.commit()
+        yield session
+
+
+def dates(session, *criteria):
+    query = sa.select(Order.placed_on).where(*criteria).order_by(Order.placed_on)
+    return list(session.scalars(query))
+
+
+def test_stores_integer_day_numbers(session):
+    raw = session.execute(sa.text('SELECT placed_on FROM orders ORDER BY id LIMIT 1')).scalar()
+    assert isinstance(raw, int)
+    loaded = session.scalars(sa.select(Order.placed_on).order_by(Order.id)).first()
+    assert loaded == Kenat(2015, 12, 26)
+    assert isinstance(loaded, Kenat)
+
+
+def test_null_round_trip(session):
+    assert session.scalars(sa.select(Order).where(Order.placed_on.is_(None))).one().placed_on is None
+
+
+def test_comparisons_and_ordering(session):
+    assert len(dates(session, Order.placed_on < Kenat(2016, 1, 1))) == 11
+    result = dates(session, Order.placed_on.between(Kenat(2015, 13, 5), Kenat(2016, 1, 2)))
+    assert result == [Kenat(2015, 13, 5), Kenat(2015, 13, 6), Kenat(2016, 1, 1), Kenat(2016, 1, 2)]
+    assert dates(session, Order.placed_on == datetime.date(2023, 9, 12)) == [Kenat(2016, 1, 1)]
+    ordered = dates(session, Order.placed_on.is_not(None))
+    assert ordered == sorted(ordered) and len(ordered) == 60
+
+
+def test_year_and_month_ranges(session):
+    assert len(dates(session, Order.placed_on.in_year(2016))) == 49
+    assert len(dates(session, Order.placed_on.in_month(2015, 13))) == 6
+    assert len(dates(session, Order.placed_on.in_month(2016, 1))) == 30
+
+
+def test_ranges_compile_to_integer_comparisons(session):
+    statement = sa.select(Order.id).where(Order.placed_on.between(Kenat(2016, 1, 1), Kenat(2016, 1, 30)))
+    sql = str(statement.compile(session.bind, compile_kwargs={'literal_binds': True}))
+    start, end = (conversions.ethiopian_to_day_number(2016, 1, day) for day in (1, 30))
+    assert f'BETWEEN {start} AND {end}' in sql
+    plan = session.execute(sa.text('EXPLAIN QUERY PLAN ' + sql)).all()
+    assert any('ix_orders_placed_on' in row[-1] for row in plan)
+
+
+def test_rejects_other_values(session):
+    session.add(Order(placed_on='2016/1/1'))
+    with pytest.raises(sa.exc.StatementError) as excinfo:
+        session.flush()
+    assert isinstance(excinfo.value.orig, InvalidInputTypeError)
@@ -0,0 +1,90 @@
+import sqlite3
+import pytest
+
+from kenat import sqlite as kenat_sqlite
+from kenat import to_ec, to_gc, get_holidays_for_year
+
+
+@pytest.fixture
+def conn():
+    connection = sqlite3.connect(':memory:')
+    kenat_sqlite.register(connection)
+    yield connection
+    connection.close()
+
+
+def query(conn, sql, *params):
+    return conn.execute(sql, params).fetchone()[0]
+
+
+class TestFunctions:
+    def test_to_ec_and_components(self, conn):
+        assert query(conn, "SELECT to_ec('2024-01-01')") == '2016/04/22'
+        assert query(conn, "SELECT to_ec('2023-09-12 08:30:00')") == '2016/01/01'
+        assert conn.execute(
+            "SELECT eth_year(d), eth_month(d), eth_day(d) FROM (SELECT '2023-09-11' AS d)"
+        ).fetchone() == (2015, 13, 6)
+
+    def test_matches_to_ec(self, conn):
+        rows = conn.execute(
+            "WITH RECURSIVE d(x) AS (SELECT date('1900-01-01') UNION ALL "
+            "SELECT date(x, '+97 days') FROM d WHERE x < '2100-06-01') "
+            "SELECT x, eth_year(x), eth_month(x), eth_day(x) FROM d").fetchall()
+        assert len(rows) > 700
+        for iso, year, month, day in rows:
+            y, m, d = map(int, iso.split('-'))
+            assert to_ec(y, m, d) == {'year': year, 'month': month, 'day': day}
+
+    def test_to_gc(self, conn):
+        assert query(conn, "SELECT to_gc(2016, 13, 5)") == '2024-09-10'
+        assert query(conn, "SELECT to_gc(2016, 13, 6)") is None
+
+    @pytest.mark.parametrize('value', [None, 'not a date', '2024-02-30', '1899-12-31', 20240101])
+    def test_invalid_input_is_null(self, conn, value):
+        assert conn.execute(
+            "SELECT to_ec(?), eth_year(?), is_holiday(?), eth_format(?, 'short')", (value,) * 4
+        ).fetchone() == (None, None, None, None)
+
+    def test_is_holiday(self, conn):
+        assert query(conn, "SELECT is_holiday('2024-01-08')") == 1  # Genna, Tahsas 29
+        assert query(conn, "SELECT is_holiday('2024-01-09')") == 0
+        assert query(conn, "SELECT is_holiday('2024-01-08', 'muslim')") == 0
+        assert query(conn, "SELECT is_holiday('2024-01-08', 'muslim, christian')") == 1
+
+    def test_is_holiday_matches_holiday_list(self, conn):
+        for holiday in get_holidays_for_year(2016, filter_by='public'):
+            greg = to_gc(*holiday['ethiopian'].values())
+            iso = greg.isoformat()
+            assert query(conn, "SELECT is_holiday(?, 'public')", iso) == 1
+
+    def test_eth_format(self, conn):
+        assert query(conn, "SELECT eth_format('2024-01-01', 'iso')") == '2016-04-22'
+        assert query(conn, "SELECT eth_format('2024-01-01', 'standard', 'english')") == 'Tahsas 22 2016'
+        assert query(conn, "SELECT eth_format('2024-01-01', 'geez')") == 'ታህሳስ ፳፪ ፳፻፲፮'
+        assert query(conn, "SELECT eth_format('2024-01-01', 'bogus')") is None
+
+
+class TestSchemaUse:
+    def test_expression_index_and_grouping(self, conn):
+        conn.execute("CREATE TABLE sales (date TEXT, amount INTEGER)")
+        conn.executemany("INSERT INTO sales VALUES (date('2023-09-01', ?), 1)",
+                         [(f'+{i} days',) for i in range(60)])
+        conn.execute("CREATE INDEX sales_eth ON sales (eth_year(date), eth_month(date))")
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT count(*) FROM sales WHERE eth_year(date) = 2016 AND eth_month(date) = 1"
+        ).fetchall()
+        assert any('sales_eth' in row[-1] for row in plan)
+        assert conn.execute(
+            "SELECT eth_year(date), eth_month(date), sum(amount) FROM sales GROUP BY 1, 2 ORDER BY 1, 2"
+        ).fetchall() == [(2015, 12, 5), (2015, 13, 6), (2016, 1, 30), (2016, 2, 19)]
+
+    def test_generated_column(self, conn):
+        conn.execute("CREATE TABLE events (date TEXT, date_ec TEXT GENERATED ALWAYS AS (to_ec(date)) STORED)")
+        conn.execute("INSERT INTO events (date) VALUES ('2024-01-01')")
+        assert query(conn, "SELECT date_ec FROM events") == '2016/04/22'
+
+    def test_is_holiday_cannot_back_an_index(self, conn):
+        # Its result changes with holiday providers, so SQLite must not store it
+        conn.execute("CREATE TABLE days (date TEXT)")
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("CREATE INDEX days_holiday ON days (is_holiday(date))")
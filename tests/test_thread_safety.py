@@ -0,0 +1,88 @@
+import threading
+import pytest
+import kenat
+from kenat import to_ec, to_gc, get_holidays_for_year, MonthGrid, instrumentation
+
+THREADS = 8
+
+
+@pytest.fixture(autouse=True)
+def fresh_caches():
+    kenat.cache_clear()
+    yield
+    kenat.cache_clear()
+
+
+def run_concurrently(task, threads=THREADS):
+    """Runs `task(index)` on several threads released at once; returns results and errors."""
+    barrier = threading.Barrier(threads)
+    results = [None] * threads
+    errors = []
+
+    def worker(index):
+        try:
+            barrier.wait()
+            results[index] = task(index)
+        except Exception as exc: # pragma: no cover - reported by the assertion below
+            errors.append(exc)
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return results, errors
+
+
+def test_cold_holiday_index_is_consistent_across_threads():
+    with kenat.caching(enabled=False):
+        expected = [get_holidays_for_year(year) for year in range(2010, 2020)]
+    results, errors = run_concurrently(lambda i: [get_holidays_for_year(year) for year in range(2010, 2020)])
+    assert not errors
+    assert all(result == expected for result in results)
+
+
+def test_threads_racing_on_a_cold_key_share_one_cached_object():
+    from kenat.holidays import _holiday_index
+    results, errors = run_concurrently(lambda i: _holiday_index(2016))
+    assert not errors
+    assert all(result is results[0] for result in results)
+    assert kenat.cache_info()['holiday_index']['size'] == 1
+
+
+def test_month_grid_generate_concurrently():
+    with kenat.caching(enabled=False):
+        expected = [MonthGrid({'year': 2016, 'month': month}).generate() for month in range(1, 14)]
+    results, errors = run_concurrently(
+        lambda i: [MonthGrid({'year': 2016, 'month': month}).generate() for month in range(1, 14)]
+    )
+    assert not errors
+    assert all(result == expected for result in results)
+
+
+def test_conversions_with_a_small_cache_under_contention():
+    original = kenat.cache_info()['to_gc']['maxsize']
+    kenat.set_cache_maxsize('to_gc', 16)
+    try:
+        def task(index):
+            return [to_gc(2000 + (index + i) % 20, 1 + i % 13, 1 + i % 5) for i in range(2000)]
+
+        results, errors = run_concurrently(task)
+        assert not errors
+        with kenat.caching(enabled=False):
+            for index, result in enumerate(results):
+                assert result == task(index)
+        info = kenat.cache_info()['to_gc']
+        assert info['size'] <= 16
+        assert info['evictions'] > 0
+    finally:
+        kenat.set_cache_maxsize('to_gc', original)
+
+
+def test_instrumentation_merges_counts_from_all_threads():
+    instrumentation.reset()
+    with instrumentation.instrumenting():
+        _, errors = run_concurrently(lambda i: [to_ec(2024, 1, 1 + i) for _ in range(100)])
+    assert not errors
+    assert instrumentation.snapshot()['to_ec']['calls'] == THREADS * 100
+    instrumentation.reset()
@@ -1,3 +1,4 @@
+import pickle
 import pytest
 from kenat import Kenat
 from kenat.time import Time
@@ -36,6 +37,38 @@ class TestTimeFromString:
         with pytest.raises(InvalidTimeError): Time.from_string('')
         with pytest.raises(InvalidTimeError): Time.from_string('10 30')
 
+    def test_should_throw_for_out_of_range_values_and_unknown_periods(self):
+        with pytest.raises(InvalidTimeError): Time.from_string('13:00 day')
+        with pytest.raises(InvalidTimeError): Time.from_string('0:30')
+        with pytest.raises(InvalidTimeError): Time.from_string('10:60')
+        with pytest.raises(InvalidTimeError): Time.from_string('10:30 PM')
+        with pytest.raises(InvalidTimeError): Time.from_string(1030)
+
+    def test_should_accept_spacing_and_amharic_day_label(self):
+        assert Time.from_string(' 10 : 30  DAY ') == Time(10, 30, 'day')
+        assert Time.from_string('፬:፲ ጠዋት') == Time(4, 10, 'day')
+
+class TestTimeParseMany:
+    def test_should_return_minutes_and_error_mask(self):
+        minutes, errors = Time.parse_many(['10:30 day', '፫:፲፭ ማታ', '13:00', None, '10:30 day'])
+        assert minutes.typecode == 'H' and errors.typecode == 'B'
+        assert list(errors) == [0, 0, 1, 1, 0]
+        assert minutes[0] == Time(10, 30, 'day').minute_of_day
+        assert minutes[1] == Time(3, 15, 'night').minute_of_day
+        assert minutes[2] == minutes[3] == 0
+        assert minutes[4] == minutes[0]
+
+    def test_should_agree_with_from_string(self):
+        strings = [f'{h}:{m:02d} {p}' for h in range(1, 13) for m in range(0, 60, 7) for p in ('day', 'night')]
+        minutes, errors = Time.parse_many(strings)
+        assert not any(errors)
+        assert [Time.from_minute_of_day(m) for m in minutes] == [Time.from_string(s) for s in strings]
+
+    def test_should_accept_any_iterable(self):
+        minutes, errors = Time.parse_many(iter(['6:00', 'bad']))
+        assert list(minutes) == [Time(6, 0).minute_of_day, 0]
+        assert list(errors) == [0, 1]
+
 class TestTimeConversion:
     @pytest.mark.parametrize("g_hour, g_minute, expected", [
         (7, 30, Time(1, 30, 'day')),
@@ -99,4 +132,53 @@ class TestTimeFormatting:
         
     def test_format_with_dash_for_zero(self):
         time = Time(12, 0, 'day')
-        assert time.format(use_geez=False, zero_as_dash=True) == '12:_ day'
\ No newline at end of file
+        assert time.format(use_geez=False, zero_as_dash=True) == '12:_ day'
+
+
+class TestTimePickling:
+    def test_should_round_trip_every_minute(self):
+        for minute in range(1440):
+            time = Time.from_minute_of_day(minute)
+            restored = pickle.loads(pickle.dumps(time))
+            assert restored == time
+            assert (restored.hour, restored.minute, restored.period) == (time.hour, time.minute, time.period)
+
+    def test_should_pickle_as_an_integer(self):
+        assert len(pickle.dumps(Time(6, 30, 'night'))) < len(pickle.dumps({'hour': 6, 'minute': 30, 'period': 'night'}))
+
+class TestTimeFlyweight:
+    def test_should_return_shared_instances(self):
+        assert Time(3, 30, 'day') is Time(3, 30, 'day')
+        assert Time.from_gregorian(9, 30) is Time(3, 30, 'day')
+        assert Time.from_string('3:30 day') is Time(3, 30, 'day')
+        assert Time(3, 0, 'day').add({'minutes': 30}) is Time(3, 30, 'day')
+        assert Time(3, 30, 'day').subtract({'hours': 24}) is Time(3, 30, 'day')
+
+    def test_should_be_immutable_and_slotted(self):
+        time = Time(3, 30, 'day')
+        with pytest.raises(AttributeError):
+            time.hour = 4
+        assert not hasattr(time, '__dict__')
+
+    def test_should_hash_and_order_by_minute_of_day(self):
+        assert {Time(3, 30, 'day'): 1}[Time.from_gregorian(9, 30)] == 1
+        assert len({Time.from_minute_of_day(m % 1440) for m in range(3000)}) == 1440
+        assert Time(6, 0, 'night') < Time(12, 0, 'day') < Time(1, 0, 'day') < Time(12, 0, 'night')
+        assert sorted([Time(1, 0, 'night'), Time(11, 0, 'night')]) == [Time(11, 0, 'night'), Time(1, 0, 'night')]
+
+    def test_should_cache_formatted_strings(self):
+        time = Time(3, 15, 'night')
+        assert time.format() is time.format()
+        assert time.format(use_geez=False) == '03:15 night'
+        assert time.format() == '፫:፲፭ ማታ'
+
+    def test_should_validate_gregorian_minutes(self):
+        with pytest.raises(InvalidTimeError): Time.from_gregorian(9, 60)
+        with pytest.raises(InvalidTimeError): Time.from_gregorian(9, -1)
+
+    def test_should_keep_every_time_distinct(self):
+        for period in ('day', 'night'):
+            for hour in range(1, 13):
+                for minute in range(60):
+                    time = Time(hour, minute, period)
+                    assert (time.hour, time.minute, time.period) == (hour, minute, period)
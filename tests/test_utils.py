@@ -4,8 +4,15 @@ from kenat.utils import (
     month_day_from_day_of_year,
     is_gregorian_leap_year,
     is_ethiopian_leap_year,
-    get_ethiopian_days_in_month
+    get_ethiopian_days_in_month,
+    validate_numeric_inputs,
+    validate_ethiopian_date_object,
+    get_validation_mode,
+    set_validation_mode,
+    validation_mode,
 )
+from kenat.conversions import to_gc
+from kenat.exceptions import InvalidInputTypeError, InvalidEthiopianDateError
 
 @pytest.mark.parametrize("year, month, day, expected_doy", [
     (2023, 1, 1, 1),
@@ -64,4 +71,49 @@ class TestGetEthiopianDaysInMonth:
 
     @pytest.mark.parametrize("non_leap_year", [2010, 2012, 2013, 2014])
     def test_returns_5_for_pagume_in_non_leap_year(self, non_leap_year):
-        assert get_ethiopian_days_in_month(non_leap_year, 13) == 5
\ No newline at end of file
+        assert get_ethiopian_days_in_month(non_leap_year, 13) == 5
+
+class TestValidationMode:
+    def test_default_mode_is_strict(self):
+        assert get_validation_mode() == 'strict'
+
+    def test_strict_mode_rejects_nan(self):
+        with pytest.raises(InvalidInputTypeError):
+            validate_numeric_inputs('test', value=float('nan'))
+
+    def test_fast_mode_skips_nan_check_but_keeps_type_check(self):
+        with validation_mode('fast'):
+            validate_numeric_inputs('test', value=float('nan'))
+            with pytest.raises(InvalidInputTypeError):
+                validate_numeric_inputs('test', value='2016')
+
+    def test_off_mode_skips_type_checks(self):
+        with validation_mode('off'):
+            validate_numeric_inputs('test', value='2016')
+            validate_ethiopian_date_object(None, 'test', 'date')
+        with pytest.raises(InvalidInputTypeError):
+            validate_numeric_inputs('test', value='2016')
+
+    def test_ethiopian_date_object_reports_component_name(self):
+        with pytest.raises(InvalidInputTypeError) as exc_info:
+            validate_ethiopian_date_object({'year': 2016, 'month': 'one', 'day': 1}, 'test', 'a')
+        assert exc_info.value.parameter_name == 'a.month'
+
+    def test_set_validation_mode_is_overridden_by_context_manager(self):
+        set_validation_mode('fast')
+        try:
+            assert get_validation_mode() == 'fast'
+            with validation_mode('strict'):
+                assert get_validation_mode() == 'strict'
+            assert get_validation_mode() == 'fast'
+        finally:
+            set_validation_mode('strict')
+
+    def test_unknown_mode_raises(self):
+        with pytest.raises(ValueError):
+            set_validation_mode('lenient')
+
+    def test_off_mode_still_rejects_impossible_dates(self):
+        with validation_mode('off'):
+            with pytest.raises(InvalidEthiopianDateError):
+                to_gc(2016, 14, 1)
@@ -0,0 +1,38 @@
+"""
+Regenerates kenat/_islamic_holidays.py, the bundled table of Islamic holiday
+dates, from the tabular Islamic calendar for every Ethiopian year that lies
+within the supported Gregorian range.
+
+Usage:
+    python tools/generate_islamic_holidays.py
+"""
+import pathlib
+
+from kenat import conversions, holidays
+
+OUTPUT = pathlib.Path(__file__).resolve().parent.parent / 'kenat' / '_islamic_holidays.py'
+
+HEADER = '''\
+# Gregorian dates of the Islamic holidays in each Ethiopian year, computed with
+# the tabular Islamic calendar. Generated by tools/generate_islamic_holidays.py;
+# do not edit. Observed dates that differ are supplied with
+# `holidays.load_islamic_holiday_overrides`.
+ISLAMIC_HOLIDAYS = {
+'''
+
+def main():
+    first = conversions._to_ec(*conversions._MIN_GREGORIAN_DATE.timetuple()[:3])[0] + 1
+    last = conversions._to_ec(*conversions._MAX_GREGORIAN_DATE.timetuple()[:3])[0] - 1
+    lines = [HEADER]
+    for eth_year in range(first, last + 1):
+        dates = {
+            key: tuple(gregorian for _, gregorian in holidays._tabular_islamic_occurrences(eth_year, *hijri))
+            for key, hijri in holidays.ISLAMIC_HOLIDAY_DATES.items()
+        }
+        lines.append(f"  {eth_year}: {dates!r},\n")
+    lines.append('}\n')
+    OUTPUT.write_text(''.join(lines), encoding='utf-8')
+    print(f"Wrote {last - first + 1} years to {OUTPUT}")
+
+if __name__ == '__main__':
+    main()